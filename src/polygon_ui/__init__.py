@@ -4,79 +4,64 @@ Polygon UI
 Description: A library/framework of UI components for Qt/PySide, similar to Mantine for webapps
 """
 
-__version__ = "0.2.0"
-
-# Core imports
-from .core import PolygonProvider, PolygonComponent, ComponentFactory
-from .theme import Theme, ThemeProvider, Colors, Spacing, Typography
-from .styles import StyleProps, StylesAPI, QSSGenerator
-from .utils import css_var_to_qss, generate_color_shades, VariantSystem
-from .polybook import PolyBookApp, ComponentRegistry, Story, StoryManager
-
-# Layout system
-try:
-    from .layout.core import (
-        LayoutComponent,
-        GridComponent,
-        UtilityComponent,
-        Breakpoint,
-        BreakpointSystem,
-        ResponsiveProps,
-        responsive,
-        cols,
-        spacing,
-    )
+import importlib
 
-    _layout_core_available = True
-except ImportError:
-    # Layout core not available
-    _layout_core_available = False
-
-# Layout components (not yet implemented)
-_layout_components_available = False
+__version__ = "0.2.0"
 
-__all__ = [
+# Exported names are resolved lazily (PEP 562) so that ``import polygon_ui``
+# does not pull in PySide6 widgets, the theme system and PolyBook up front.
+_LAZY = {
     # Core
-    "PolygonProvider",
-    "PolygonComponent",
-    "ComponentFactory",
+    "PolygonProvider": ("polygon_ui.core", "PolygonProvider"),
+    "PolygonComponent": ("polygon_ui.core", "PolygonComponent"),
+    "ComponentFactory": ("polygon_ui.core", "ComponentFactory"),
     # Theme
-    "Theme",
-    "ThemeProvider",
-    "Colors",
-    "Spacing",
-    "Typography",
+    "Theme": ("polygon_ui.theme", "Theme"),
+    "ThemeProvider": ("polygon_ui.theme", "ThemeProvider"),
+    "Colors": ("polygon_ui.theme", "Colors"),
+    "Spacing": ("polygon_ui.theme", "Spacing"),
+    "Typography": ("polygon_ui.theme", "Typography"),
     # Styles
-    "StyleProps",
-    "StylesAPI",
-    "QSSGenerator",
+    "StyleProps": ("polygon_ui.styles", "StyleProps"),
+    "StylesAPI": ("polygon_ui.styles", "StylesAPI"),
+    "QSSGenerator": ("polygon_ui.styles", "QSSGenerator"),
     # Utils
-    "css_var_to_qss",
-    "generate_color_shades",
-    "VariantSystem",
+    "css_var_to_qss": ("polygon_ui.utils", "css_var_to_qss"),
+    "generate_color_shades": ("polygon_ui.utils", "generate_color_shades"),
+    "VariantSystem": ("polygon_ui.utils", "VariantSystem"),
     # PolyBook
-    "PolyBookApp",
-    "ComponentRegistry",
-    "Story",
-    "StoryManager",
-]
+    "PolyBookApp": ("polygon_ui.polybook", "PolyBookApp"),
+    "ComponentRegistry": ("polygon_ui.polybook", "ComponentRegistry"),
+    "Story": ("polygon_ui.polybook", "Story"),
+    "StoryManager": ("polygon_ui.polybook", "StoryManager"),
+    # Layout Core
+    "LayoutComponent": ("polygon_ui.layout.core", "LayoutComponent"),
+    "GridComponent": ("polygon_ui.layout.core", "GridComponent"),
+    "UtilityComponent": ("polygon_ui.layout.core", "UtilityComponent"),
+    "Breakpoint": ("polygon_ui.layout.core", "Breakpoint"),
+    "BreakpointSystem": ("polygon_ui.layout.core", "BreakpointSystem"),
+    "ResponsiveProps": ("polygon_ui.layout.core", "ResponsiveProps"),
+    "responsive": ("polygon_ui.layout.core", "responsive"),
+    "cols": ("polygon_ui.layout.core", "cols"),
+    "spacing": ("polygon_ui.layout.core", "spacing"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache on the module so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
 
-# Add layout components to exports if available
-if _layout_core_available:
-    __all__.extend(
-        [
-            # Layout Core
-            "LayoutComponent",
-            "GridComponent",
-            "UtilityComponent",
-            "Breakpoint",
-            "BreakpointSystem",
-            "ResponsiveProps",
-            "responsive",
-            "cols",
-            "spacing",
-        ]
-    )
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 
 def hello():
@@ -2,11 +2,38 @@
 Base component class for Polygon UI components.
 """
 
-from typing import Dict, Any, Optional, Union
+import sys
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import ClassVar, Dict, Any, Iterator, Mapping, Optional, Union
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import QObject, Signal, Property
+from PySide6.QtCore import QObject, QTimer, Signal, Slot, Property
 
-from .provider import PolygonProvider
+from .provider import PolygonProvider, _props_key
+
+
+# Base variant/size style tables, shared read-only across all instances
+_EMPTY_STYLES: Mapping[str, Any] = MappingProxyType({})
+
+_VARIANT_STYLES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "filled": MappingProxyType({"bg": "primary"}),
+        "outline": MappingProxyType({"bd": "1px solid primary", "bg": "transparent"}),
+        "light": MappingProxyType({"bg": "primary.1"}),
+        "subtle": MappingProxyType({"bg": "gray.1"}),
+        "transparent": MappingProxyType({"bg": "transparent"}),
+    }
+)
+
+_SIZE_STYLES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        "xs": MappingProxyType({"py": "xs", "px": "sm"}),
+        "sm": MappingProxyType({"py": "sm", "px": "md"}),
+        "md": MappingProxyType({"py": "md", "px": "lg"}),
+        "lg": MappingProxyType({"py": "lg", "px": "xl"}),
+        "xl": MappingProxyType({"py": "xl", "px": "xxl"}),
+    }
+)
 
 
 class PolygonComponent(QWidget):
@@ -15,32 +42,68 @@ class PolygonComponent(QWidget):
     Provides theme integration, style props, and component utilities.
     """
 
+    # No __slots__ here: with PySide6 (checked on 6.12) a Python subclass of a
+    # slotted QWidget subclass is laid out with the parent's basicsize, and
+    # assigning a slot on it segfaults. Every component subclasses this class,
+    # and Shiboken wrappers keep a per-instance __dict__ regardless.
+
+    # Lower-cased class name used as the QSS selector/object name
+    _component_name: ClassVar[str] = "polygoncomponent"
+
+    # Set by PolygonProvider on construction and cleared by its reset()
+    _default_provider: ClassVar[Optional[PolygonProvider]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._component_name = sys.intern(cls.__name__.lower())
+
     def __init__(self, parent: Optional[QWidget] = None, **kwargs):
         super().__init__(parent)
 
         # Style props
         self._style_props = {}
 
+        # Generated QSS layers, recombined on every change instead of appended
+        self._base_qss = ""
+        # Set by subclasses that generate their own QSS (e.g. Box)
+        self._component_qss = ""
+        self._variant_qss = ""
+        self._overrides_qss = ""
+        self._applied_qss = ""
+
+        # Inputs of the last applied styling passes; identical inputs skip work
+        self._last_style_key: Optional[tuple] = None
+        self._last_variant_key: Optional[tuple] = None
+
+        # Deferred styling state: prop/variant mutations are coalesced into a
+        # single flush on the next event-loop turn (or on batch exit)
+        self._style_dirty = False
+        self._variant_dirty = False
+        self._style_pending = False
+        self._style_batch_depth = 0
+
         # Component variant
         self._variant = kwargs.get("variant", "default")
         self._size = kwargs.get("size", "md")
 
-        # Get PolygonProvider instance
-        self._provider = (
-            PolygonProvider.get_instance() if PolygonProvider.is_initialized() else None
-        )
+        # Get PolygonProvider instance and register for theme changes
+        self._provider = self._default_provider
+        if self._provider is not None:
+            self._provider._live_components.add(self)
 
-        # Apply initial style props
+        # Apply initial style props and theme-based styling in one flush.
+        # Keys are interned so the many lookups per flush hit the identity
+        # fast path in dict comparisons.
         style_props = {
-            k: v for k, v in kwargs.items() if k not in ["parent", "variant", "size"]
+            sys.intern(k): v
+            for k, v in kwargs.items()
+            if k not in ["parent", "variant", "size"]
         }
-        self.set_style_props(style_props)
-
-        # Apply theme-based styling
-        self._apply_theme_styling()
+        self._style_props.update(style_props)
+        self._schedule_style_update(variant=True)
 
         # Set object name for CSS targeting
-        self.setObjectName(self.__class__.__name__.lower())
+        self.setObjectName(self._component_name)
 
     def set_style_props(self, props: Dict[str, Any]) -> None:
         """
@@ -49,8 +112,8 @@ class PolygonComponent(QWidget):
         Args:
             props: Dictionary of style props
         """
-        self._style_props.update(props)
-        self._update_styling()
+        self._style_props.update({sys.intern(k): v for k, v in props.items()})
+        self._schedule_style_update()
 
     def get_style_prop(self, prop_name: str, default: Any = None) -> Any:
         """
@@ -73,8 +136,62 @@ class PolygonComponent(QWidget):
             prop_name: Name of the style prop
             value: Value to set
         """
-        self._style_props[prop_name] = value
-        self._update_styling()
+        self._style_props[sys.intern(prop_name)] = value
+        self._schedule_style_update()
+
+    @contextmanager
+    def batch_style_updates(self) -> Iterator[None]:
+        """
+        Suppress styling flushes while mutating several props at once.
+
+        Pending updates are flushed exactly once when the outermost batch exits.
+
+        Example:
+            with component.batch_style_updates():
+                component.set_style_prop("bg", "gray.1")
+                component.variant = "outline"
+        """
+        self._style_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._style_batch_depth -= 1
+            if self._style_batch_depth == 0:
+                self._flush_styling()
+
+    def _schedule_style_update(self, variant: bool = False) -> None:
+        """
+        Mark styling as dirty and schedule a single deferred flush.
+
+        Args:
+            variant: Whether the variant/size layer also needs regenerating
+        """
+        self._style_dirty = True
+        if variant:
+            self._variant_dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Schedule _flush_styling for the next event-loop turn, at most once."""
+        if self._style_pending or self._style_batch_depth:
+            return
+        self._style_pending = True
+        QTimer.singleShot(0, self._flush_styling)
+
+    @Slot()
+    def _flush_styling(self) -> None:
+        """Apply any pending style updates."""
+        self._style_pending = False
+        if self._style_batch_depth:
+            return
+        # Flags are cleared only once their pass succeeds, so an update that
+        # raises stays pending for the next flush instead of being dropped
+        if self._variant_dirty:
+            self._apply_theme_styling()
+            self._variant_dirty = False
+        if self._style_dirty:
+            self._update_styling()
+            self._style_dirty = False
 
     @Property(str)
     def variant(self) -> str:
@@ -85,7 +202,7 @@ class PolygonComponent(QWidget):
     def variant(self, value: str) -> None:
         """Set component variant."""
         self._variant = value
-        self._apply_theme_styling()
+        self._schedule_style_update(variant=True)
 
     @Property(str)
     def size(self) -> str:
@@ -96,16 +213,19 @@ class PolygonComponent(QWidget):
     def size(self, value: str) -> None:
         """Set component size."""
         self._size = value
-        self._apply_theme_styling()
+        self._schedule_style_update(variant=True)
 
     def _apply_theme_styling(self) -> None:
         """Apply theme-based styling to the component."""
         if not self._provider:
             return
 
-        # Apply component-specific theme overrides
-        component_type = self.__class__.__name__.lower()
-        self._provider.apply_component_theme_overrides(self, component_type)
+        # Nothing to do if variant, size and theme are unchanged since last apply
+        key = (self._variant, self._size, self._provider.theme_version)
+        if key == self._last_variant_key:
+            return
+
+        component_type = self._component_name
 
         # Apply variant and size based styling
         variant_styles = self._get_variant_styles()
@@ -113,77 +233,89 @@ class PolygonComponent(QWidget):
 
         if variant_styles or size_styles:
             combined_styles = {**variant_styles, **size_styles}
-            component_qss = self._provider.generate_component_qss(
+            self._variant_qss = self._provider.generate_component_qss(
                 component_type, combined_styles
             )
-            current_style = self.styleSheet()
-            self.setStyleSheet(current_style + "\n" + component_qss)
+        else:
+            self._variant_qss = ""
+
+        # Apply component-specific theme overrides (re-applies the stylesheet)
+        self._provider.apply_component_theme_overrides(self, component_type)
+        # Remember the inputs only once applied, so a failed pass is retried
+        self._last_variant_key = key
 
-    def _get_variant_styles(self) -> Dict[str, Any]:
+    def _get_variant_styles(self) -> Mapping[str, Any]:
         """Get styles based on component variant."""
         # Base implementation - should be overridden by subclasses
-        variant_styles = {
-            "filled": {"bg": "primary"},
-            "outline": {"bd": "1px solid primary", "bg": "transparent"},
-            "light": {"bg": "primary.1"},
-            "subtle": {"bg": "gray.1"},
-            "transparent": {"bg": "transparent"},
-        }
-        return variant_styles.get(self._variant, {})
+        return _VARIANT_STYLES.get(self._variant, _EMPTY_STYLES)
 
-    def _get_size_styles(self) -> Dict[str, Any]:
+    def _get_size_styles(self) -> Mapping[str, Any]:
         """Get styles based on component size."""
         # Base implementation - should be overridden by subclasses
-        size_styles = {
-            "xs": {"py": "xs", "px": "sm"},
-            "sm": {"py": "sm", "px": "md"},
-            "md": {"py": "md", "px": "lg"},
-            "lg": {"py": "lg", "px": "xl"},
-            "xl": {"py": "xl", "px": "xxl"},
-        }
-        return size_styles.get(self._size, {})
+        return _SIZE_STYLES.get(self._size, _EMPTY_STYLES)
 
     def _update_styling(self) -> None:
         """Update component styling based on current style props."""
         if not self._provider:
             return
 
-        component_name = self.__class__.__name__.lower()
+        component_name = self._component_name
         combined_props = {
             **self._style_props,
             "variant": self._variant,
             "size": self._size,
         }
 
-        # Add layout-specific props to combined if it's a layout component
-        if hasattr(self, "_gap"):
-            combined_props.update(
-                {
-                    "gap": self._gap,
-                    "justify": self._justify,
-                    "align": self._align,
-                    "direction": getattr(self, "_direction", "column"),
-                }
-            )
-        if hasattr(self, "_columns"):
-            combined_props.update(
-                {
-                    "columns": self._columns,
-                    "gutter": self._gutter,
-                }
-            )
-        # Add responsive props
-        if hasattr(self, "_responsive_props"):
-            combined_props["responsive"] = self._responsive_props
+        self._collect_extra_props(combined_props)
+
+        key = (self._provider.theme_version, _props_key(combined_props))
+        if key == self._last_style_key:
+            return
 
         # Generate QSS from style props
-        component_qss = self._provider.generate_component_qss(
+        self._base_qss = self._provider.generate_component_qss(
             component_name, combined_props
         )
+        self._apply_stylesheet()
+        # Remember the inputs only once applied, so a failed pass is retried
+        self._last_style_key = key
 
-        # Apply to widget
-        current_style = self.styleSheet()
-        self.setStyleSheet(current_style + "\n" + component_qss)
+    def _collect_extra_props(self, out: Dict[str, Any]) -> None:
+        """
+        Add subclass-specific props to the props used for QSS generation.
+
+        Called on every styling pass; the base component adds nothing.
+
+        Args:
+            out: Combined style props, updated in place
+        """
+
+    def set_overrides_qss(self, qss: str) -> None:
+        """
+        Set the theme-override QSS layer and re-apply the stylesheet.
+
+        Args:
+            qss: Override QSS generated from the theme's component overrides
+        """
+        self._overrides_qss = qss
+        self._apply_stylesheet()
+
+    def _apply_stylesheet(self) -> None:
+        """Replace the widget stylesheet with the current QSS layers."""
+        qss = "\n".join(
+            layer
+            for layer in (
+                self._base_qss,
+                self._component_qss,
+                self._variant_qss,
+                self._overrides_qss,
+            )
+            if layer
+        )
+        # Skip the Qt reparse when nothing changed
+        if qss != self._applied_qss:
+            self._applied_qss = qss
+            self.setStyleSheet(qss)
 
     def get_theme_value(self, path: str, default: Any = None) -> Any:
         """
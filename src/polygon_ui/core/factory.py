@@ -2,6 +2,7 @@
 Component factory for Polygon UI components.
 """
 
+import sys
 from typing import Type, Dict, Any, Optional
 from ..theme.theme import Theme
 
@@ -26,9 +27,10 @@ class ComponentFactory:
             component_class: Component class
             config: Component configuration
         """
+        name = sys.intern(name)
         self._component_classes[name] = component_class
-        if config:
-            self._component_configs[name] = config
+        # Private copy, so later edits to the caller's dict don't leak in
+        self._component_configs[name] = dict(config or {})
 
     def create_component(
         self, name: str, parent: Optional[Any] = None, **kwargs
@@ -44,14 +46,18 @@ class ComponentFactory:
         Returns:
             Component instance
         """
-        if name not in self._component_classes:
+        component_class = self._component_classes.get(name)
+        if component_class is None:
             raise ValueError(f"Component '{name}' not registered")
 
-        component_class = self._component_classes[name]
-        config = self._component_configs.get(name, {})
-
-        # Merge config with kwargs
-        merged_props = {**config, **kwargs}
+        # Merge config with kwargs; kwargs is already a fresh dict, so it is
+        # passed through untouched when there is no config to merge
+        config = self._component_configs.get(name)
+        if config:
+            merged_props = config.copy()
+            merged_props.update(kwargs)
+        else:
+            merged_props = kwargs
 
         return component_class(parent=parent, **merged_props)
 
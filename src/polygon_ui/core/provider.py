@@ -1,15 +1,22 @@
-from typing import Optional
+import sys
+import weakref
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QObject, QSettings, Qt, QTimer, Signal, Slot
+from shiboken6 import isValid
 
 from ..theme.theme import ColorScheme, Theme
 from ..styles.qss_generator import QSSGenerator
 
 
-class PolygonProvider:
+class PolygonProvider(QObject):
     """Provides theme management and QSS generation for Polygon UI applications."""
 
+    # Emitted after the theme changed, with (theme, theme version). Declared
+    # with plain object types so emitting needs no Qt type conversion.
+    theme_changed = Signal(object, object)
+
     _instance: Optional["PolygonProvider"] = None
     _initialized: bool = False
 
@@ -18,14 +25,40 @@ class PolygonProvider:
             raise RuntimeError(
                 "PolygonProvider is a singleton. Use get_instance() instead."
             )
+        super().__init__()
 
         self.theme = theme
         self._theme_provider = self  # For compatibility
         self._settings = QSettings("PolygonUI", "PolyBook")
+        self._settings.beginGroup("theme")
+
+        # Preferences are read once; saves update this cache and the backing
+        # store is flushed by a single deferred sync()
+        self._pref_cache: Dict[str, Any] = {
+            "color_scheme": self._settings.value("color_scheme", "light"),
+            "primary_color": self._settings.value("primary_color", "blue"),
+        }
+        self._sync_pending = False
+
+        # Component QSS memo, keyed by (component, frozen props, theme version)
+        self._qss_generator = QSSGenerator()
+        self._qss_cache: Dict[Tuple[Any, ...], str] = {}
+        self._theme_version = 0
+
+        # Flat "colors.blue.6" -> value index for O(1) theme lookups
+        self._theme_index: Dict[str, Any] = self._flatten_theme(theme)
+
+        # Components restyled on theme change; weak so widgets are not kept alive
+        self._live_components: "weakref.WeakSet[Any]" = weakref.WeakSet()
 
         PolygonProvider._instance = self
         PolygonProvider._initialized = True
 
+        # Hand the instance to components so construction is one attribute read
+        from .component import PolygonComponent
+
+        PolygonComponent._default_provider = self
+
     @classmethod
     def get_instance(cls) -> Optional["PolygonProvider"]:
         """Get the singleton instance of PolygonProvider."""
@@ -37,22 +70,37 @@ class PolygonProvider:
         return cls._initialized
 
     @classmethod
-    def initialize(cls, theme: Theme) -> "PolygonProvider":
-        """Initialize the singleton PolygonProvider with a theme."""
-        if cls._instance is None:
-            return cls(theme)
-        return cls._instance
+    def initialize(cls, theme: Optional[Theme] = None) -> "PolygonProvider":
+        """
+        Get the singleton PolygonProvider, creating it on first call only.
+
+        Later calls return the existing instance without doing any work, so
+        this is the safe entry point for code that may run more than once.
+
+        Args:
+            theme: Theme for the first initialization (defaults to Theme())
+
+        Returns:
+            The singleton PolygonProvider
+        """
+        instance = cls._instance
+        if instance is None:
+            instance = cls(theme if theme is not None else Theme())
+        return instance
 
     @classmethod
     def reset(cls) -> None:
         """Reset the singleton instance (useful for testing)."""
+        from .component import PolygonComponent
+
         cls._instance = None
         cls._initialized = False
+        PolygonComponent._default_provider = None
 
     def _load_preferences(self) -> None:
         """Load saved theme preferences."""
-        saved_scheme = self._settings.value("color_scheme", "light")
-        saved_primary = self._settings.value("primary_color", "blue")
+        saved_scheme = self._pref_cache["color_scheme"]
+        saved_primary = self._pref_cache["primary_color"]
 
         # Update current theme if different
         current_scheme = self.theme.color_scheme.value
@@ -60,9 +108,28 @@ class PolygonProvider:
             self.update_theme(color_scheme=saved_scheme, primary_color=saved_primary)
 
     def _save_preferences(self) -> None:
-        """Save current theme preferences."""
-        self._settings.setValue("color_scheme", self.theme.color_scheme.value)
-        self._settings.setValue("primary_color", self.theme.primary_color)
+        """Save current theme preferences, deferring the write to disk."""
+        prefs = {
+            "color_scheme": self.theme.color_scheme.value,
+            "primary_color": self.theme.primary_color,
+        }
+        changed = False
+        for key, value in prefs.items():
+            if self._pref_cache.get(key) != value:
+                self._pref_cache[key] = value
+                self._settings.setValue(key, value)
+                changed = True
+
+        # Rapid toggles collapse into one sync()
+        if changed and not self._sync_pending:
+            self._sync_pending = True
+            QTimer.singleShot(200, self._sync_preferences)
+
+    @Slot()
+    def _sync_preferences(self) -> None:
+        """Flush pending preference writes to the settings store."""
+        self._sync_pending = False
+        self._settings.sync()
 
     def toggle_color_scheme(self) -> None:
         """Toggle between light and dark themes."""
@@ -71,6 +138,11 @@ class PolygonProvider:
         else:
             self.update_theme(color_scheme="light")
 
+    @property
+    def theme_version(self) -> int:
+        """Counter bumped on every theme change; use it to key theme-derived caches."""
+        return self._theme_version
+
     def update_theme(
         self, color_scheme: Optional[str] = None, primary_color: Optional[str] = None
     ) -> None:
@@ -80,11 +152,177 @@ class PolygonProvider:
         if primary_color:
             self.theme.primary_color = primary_color
 
-        qss_generator = QSSGenerator(self.theme)
-        qss = qss_generator.generate_theme_qss()
+        self._on_theme_changed()
 
         app = QApplication.instance()
         if app:
-            app.setStyleSheet(qss)
+            # Build the global stylesheet in one buffer and join it once
+            buf: List[str] = []
+            self._qss_generator.generate_theme_qss_into(buf, self.theme)
+            app.setStyleSheet("".join(buf))
 
         self._save_preferences()
+
+    def generate_component_qss(self, component_name: str, props: Dict[str, Any]) -> str:
+        """
+        Generate QSS for a component, memoized per (component, props, theme).
+
+        Args:
+            component_name: Name of the component
+            props: Component style props
+
+        Returns:
+            Component-specific QSS string
+        """
+        component_name = sys.intern(component_name)
+        key = (component_name, _props_key(props), self._theme_version)
+        qss = self._qss_cache.get(key)
+        if qss is None:
+            qss = self._qss_generator.generate_component_qss(
+                component_name, props, self.theme
+            )
+            self._qss_cache[key] = qss
+        return qss
+
+    def apply_component_theme_overrides(self, widget: Any, component_type: str) -> None:
+        """
+        Write the theme's overrides for a component type into the widget's
+        override QSS layer (instead of appending to its stylesheet).
+
+        Args:
+            widget: PolygonComponent instance to style
+            component_type: Lower-case component name, e.g. "box"
+        """
+        props = self._get_component_override_props(component_type)
+        qss = self.generate_component_qss(component_type, props) if props else ""
+        widget.set_overrides_qss(qss)
+
+    def _get_component_override_props(self, component_type: str) -> Dict[str, Any]:
+        """Get root style overrides registered on the theme for a component type."""
+        for name, overrides in self.theme.components.component_overrides.items():
+            if name.lower() == component_type:
+                return overrides.get("styles", {}).get("root", {})
+        return {}
+
+    def get_theme_value(self, path: str, default: Any = None) -> Any:
+        """
+        Get a theme value by dot-separated path (e.g. "spacing.md", "colors.blue.6").
+
+        Args:
+            path: Dot-separated path to the theme value
+            default: Default value if path is not found
+
+        Returns:
+            Theme value or default
+        """
+        value = self._theme_index.get(path, _MISSING)
+        if value is _MISSING:
+            # Slow path for values outside the flattened index (custom attributes)
+            value = self._resolve_theme_path(path)
+            if value is _MISSING:
+                return default
+        return value
+
+    def _resolve_theme_path(self, path: str) -> Any:
+        """Walk theme attributes/dict keys for a dot-separated path."""
+        node: Any = self.theme
+        for part in path.split("."):
+            if isinstance(node, dict):
+                node = node.get(part, _MISSING)
+            elif isinstance(node, (list, tuple)) and part.isdigit():
+                index = int(part)
+                node = node[index] if index < len(node) else _MISSING
+            else:
+                node = getattr(node, part, _MISSING)
+            if node is _MISSING:
+                break
+        return node
+
+    @staticmethod
+    def _flatten_theme(theme: Theme) -> Dict[str, Any]:
+        """Flatten the theme's design tokens into a dot-path -> value dict."""
+        index: Dict[str, Any] = {}
+
+        def walk(prefix: str, value: Any) -> None:
+            index[prefix] = value
+            if isinstance(value, dict):
+                items = value.items()
+            elif isinstance(value, (list, tuple)):
+                items = enumerate(value)
+            else:
+                return
+            for key, child in items:
+                walk(f"{prefix}.{key}", child)
+
+        for key, value in theme.to_dict().items():
+            walk(key, value)
+
+        # Bare color names resolve to their default shade, like Colors.get_color
+        for name in theme.colors.get_available_colors():
+            index[f"colors.{name}"] = theme.colors.get_color(name)
+        index["colors.primary"] = theme.get_primary_color()
+
+        return index
+
+    def add_theme_listener(self, listener: Callable[[Theme, int], None]) -> None:
+        """
+        Call a listener synchronously whenever the theme changes.
+
+        Args:
+            listener: Callable receiving the theme and the new theme version
+        """
+        self.theme_changed.connect(listener, Qt.DirectConnection)
+
+    def remove_theme_listener(self, listener: Callable[[Theme, int], None]) -> None:
+        """
+        Stop calling a listener registered with add_theme_listener.
+
+        Args:
+            listener: Previously registered listener
+        """
+        self.theme_changed.disconnect(listener)
+
+    def _on_theme_changed(self) -> None:
+        """Invalidate theme-derived caches and restyle live components."""
+        self._theme_version += 1
+        self._qss_cache.clear()
+        self._theme_index = self._flatten_theme(self.theme)
+
+        # Restyle only live components rather than repolishing the whole tree;
+        # iterate a snapshot since restyling may create or drop widgets
+        for widget in list(self._live_components):
+            if isValid(widget):
+                widget._apply_theme_styling()
+                widget._update_styling()
+
+        self.theme_changed.emit(self.theme, self._theme_version)
+
+
+_MISSING = object()
+_NESTED_TYPES = (dict, list, tuple, set)
+
+
+def _props_key(props: Dict[str, Any]) -> FrozenSet[Tuple[Any, ...]]:
+    """
+    Build the hashable, order-independent cache key for a props dict.
+
+    Values are paired with their type, since 1, True and 1.0 compare and hash
+    equal but can generate different QSS. Flat props (the common case) are
+    frozen directly; only props holding nested containers take the recursive
+    _freeze path.
+    """
+    for value in props.values():
+        if isinstance(value, _NESTED_TYPES):
+            return _freeze(props)
+    return frozenset((k, type(v), v) for k, v in props.items())
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists/sets into hashable, type-tagged keys."""
+    if isinstance(value, dict):
+        return frozenset((k, type(v), _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple((type(v), _freeze(v)) for v in value)
+    if isinstance(value, set):
+        return frozenset((type(v), _freeze(v)) for v in value)
+    return value
@@ -2,12 +2,33 @@
 Components for the Polygon UI layout system.
 """
 
-from .container import Container
-from .stack import Stack
-from .group import Group
+import importlib
+
+# Components are imported on first access (PEP 562) so importing the package
+# only loads the modules that are actually used.
+_LAZY = {
+    "Container": ".container",
+    "Stack": ".stack",
+    "Group": ".group",
+}
 
 __all__ = [
     "Container",
     "Stack",
     "Group",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
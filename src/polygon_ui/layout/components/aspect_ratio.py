@@ -6,14 +6,21 @@ Supports numeric ratios, preset ratios (16/9, 4/3, 1/1, etc.), and responsive be
 Ensures content preserves its proportions while fitting within available space.
 """
 
-from typing import Optional, Any, Dict, Union, Tuple
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
-from PySide6.QtCore import Qt, Property, QSize, QRect
+import sys
+from types import MappingProxyType
+from typing import Callable, ClassVar, Optional, Any, Dict, Mapping, Union, Tuple
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Property, QTimer, Slot
 from fractions import Fraction
 
-from ...core.provider import PolygonProvider
 from ..core.base import LayoutComponent
-from ..core.responsive import ResponsiveProps
+from ..core.responsive import Breakpoint, ResponsiveProps
+
+# Breakpoint names, smallest first
+_BREAKPOINTS: Tuple[str, ...] = ("base", "sm", "md", "lg", "xl")
+
+# Ratio denominators rejected without attempting a division
+_ZERO_TERMS = frozenset(("", "0", "0.0"))
 
 
 class AspectRatio(LayoutComponent):
@@ -28,17 +35,37 @@ class AspectRatio(LayoutComponent):
     - Style props integration
     """
 
-    # Common aspect ratio presets
-    RATIOS = {
-        "square": 1.0,  # 1:1
-        "golden": 1.618,  # Golden ratio (~1.618:1)
-        "widescreen": 16 / 9,  # 16:9
-        "standard": 4 / 3,  # 4:3
-        "cinema": 2.39,  # CinemaScope (~2.39:1)
-        "portrait": 3 / 4,  # 3:4 (inverse of standard)
-        "photo": 4 / 3,  # Photo standard
-        "panorama": 3 / 1,  # 3:1 (very wide)
-    }
+    # No __slots__: as with PolygonComponent, slotting works for AspectRatio
+    # itself but any Python subclass of it segfaults on slot assignment.
+
+    # Common aspect ratio presets, with interned keys so lookups with
+    # interned names compare by identity
+    RATIOS: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {
+            sys.intern(name): value
+            for name, value in {
+                "square": 1.0,  # 1:1
+                "golden": 1.618,  # Golden ratio (~1.618:1)
+                "widescreen": 16 / 9,  # 16:9
+                "standard": 4 / 3,  # 4:3
+                "cinema": 2.39,  # CinemaScope (~2.39:1)
+                "portrait": 3 / 4,  # 3:4 (inverse of standard)
+                "photo": 4 / 3,  # Photo standard
+                "panorama": 3 / 1,  # 3:1 (very wide)
+            }.items()
+        }
+    )
+
+    # Parsed ratio strings shared by all instances, bounded so arbitrary
+    # user-supplied strings cannot grow it without limit
+    _RATIO_CACHE: ClassVar[Dict[str, float]] = {}
+    # Exact (numerator, denominator) pairs for cached integer "a/b" strings
+    _RATIO_FRACTION: ClassVar[Dict[str, Tuple[int, int]]] = {}
+    _RATIO_CACHE_SIZE: ClassVar[int] = 128
+
+    # True while the ratio is a plain number and there are no minimum sizes,
+    # in which case nothing varies by breakpoint and resolution is skipped
+    _is_fixed = False
 
     def __init__(
         self,
@@ -52,94 +79,155 @@ class AspectRatio(LayoutComponent):
     ):
         super().__init__(parent=parent, **kwargs)
 
+        # Current aspect settings, replaced by _update_aspect_properties
+        self._current_ratio = 1.0
+        self._ratio_fraction: Optional[Tuple[int, int]] = None
+        self._preserve_content = True
+        self._overflow = "hidden"
+
+        # Bursts of resize events (e.g. a window drag) are coalesced into a
+        # single responsive/layout refresh per event-loop turn
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._handle_resize_timeout)
+
+        # Set while the content container is being resized, so geometry
+        # changes we make ourselves don't schedule another refresh
+        self._applying_layout = False
+
+        # Ratio and min sizes resolved for the current breakpoint; cleared by
+        # the setters and whenever the breakpoint changes
+        self._resolved: Dict[str, Any] = {}
+        self._resolved_breakpoint: Optional[str] = None
+
         # Responsive props handler
         self._responsive = ResponsiveProps(self)
 
+        # Responsive refreshes are deferred until construction is complete,
+        # then the aspect properties are applied once
+        self._initializing = True
+
         # Set initial responsive properties
-        self._set_ratio(ratio)
+        if isinstance(ratio, (int, float)) and not min_width and not min_height:
+            self._is_fixed = True
+            self._current_ratio = float(ratio)
+            self._responsive.set("ratio", ratio)
+            self._responsive.set("min_width", 0)
+            self._responsive.set("min_height", 0)
+        else:
+            self._set_ratio(ratio)
+            self._set_min_width(min_width)
+            self._set_min_height(min_height)
         self._responsive.set("preserve_content", preserve_content)
         self._responsive.set("overflow", overflow)
-        self._set_min_width(min_width)
-        self._set_min_height(min_height)
 
         # Setup aspect ratio layout
         self._setup_aspect_layout()
 
+        self._initializing = False
+        self._update_aspect_properties()
+
     def _setup_aspect_layout(self) -> None:
         """Set up the layout for maintaining aspect ratio."""
-        # Main layout
-        self._main_layout = QVBoxLayout(self)
-        self._main_layout.setContentsMargins(0, 0, 0, 0)
-        self._main_layout.setSpacing(0)
-
-        # Content container (will maintain aspect ratio)
-        self._content_container = QWidget()
-        self._content_container.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Expanding
-        )
+        # Content container (will maintain aspect ratio). It and its children
+        # are positioned directly in _update_aspect_layout rather than through
+        # QLayouts, so a resize doesn't have to be solved by two layouts.
+        self._content_container = QWidget(self)
 
-        # Layout for content container
-        self._content_layout = QVBoxLayout(self._content_container)
-        self._content_layout.setContentsMargins(0, 0, 0, 0)
-        self._content_layout.setSpacing(0)
-        self._content_layout.setAlignment(Qt.AlignCenter)
-
-        # Add content container to main layout
-        self._main_layout.addWidget(self._content_container)
-
-        # Apply initial responsive properties
-        self._update_aspect_properties()
+        # (x, y, width, height) last written to the content container. Qt
+        # always clips child widgets to their parent, so overflow doesn't
+        # change the geometry.
+        self._last_applied: Tuple[Any, ...] = (None, None, None, None)
 
     def _get_ratio_value(self, ratio_input: Union[float, str]) -> float:
         """Convert ratio input to float value."""
         if isinstance(ratio_input, (int, float)):
             return float(ratio_input)
-        elif isinstance(ratio_input, str):
-            # Handle fraction format "16/9"
-            if "/" in ratio_input:
+        if not isinstance(ratio_input, str):
+            # Default to square if invalid
+            return 1.0
+
+        value = self._RATIO_CACHE.get(ratio_input)
+        if value is None:
+            value = self._parse_ratio(ratio_input)
+            if len(self._RATIO_CACHE) < self._RATIO_CACHE_SIZE:
+                self._RATIO_CACHE[ratio_input] = value
+                fraction = _integer_fraction(ratio_input)
+                if fraction is not None:
+                    self._RATIO_FRACTION[ratio_input] = fraction
+        return value
+
+    def _parse_ratio(self, ratio_input: str) -> float:
+        """Parse a preset name, fraction or decimal ratio string to a float."""
+        # Handle preset ratios (the common case)
+        preset = self.RATIOS.get(sys.intern(ratio_input.lower()))
+        if preset is not None:
+            return preset
+
+        # Handle fraction format "16/9". Empty, zero and extra terms are
+        # rejected up front; a string containing "/" is never a decimal.
+        num, sep, denom = ratio_input.partition("/")
+        if sep:
+            if num.strip() and denom.strip() not in _ZERO_TERMS and "/" not in denom:
                 try:
-                    num, denom = ratio_input.split("/")
                     return float(num) / float(denom)
                 except (ValueError, ZeroDivisionError):
                     pass
+            # Default to square if invalid
+            return 1.0
 
-            # Handle preset ratios
-            ratio_lower = ratio_input.lower()
-            if ratio_lower in self.RATIOS:
-                return self.RATIOS[ratio_lower]
-
-            # Handle decimal string
-            try:
-                return float(ratio_input)
-            except ValueError:
-                pass
+        # Handle decimal string
+        try:
+            return float(ratio_input)
+        except ValueError:
+            pass
 
         # Default to square if invalid
         return 1.0
 
+    def _invalidate_resolved(self) -> None:
+        """Drop the cached breakpoint-resolved values."""
+        self._resolved.clear()
+
     def _update_aspect_properties(self) -> None:
         """Update aspect ratio properties based on responsive values."""
-        ratio = self._responsive._resolve_value(self._responsive.get("ratio", 1.0))
-        preserve_content = self._responsive.get("preserve_content", True)
-        overflow = self._responsive.get("overflow", "hidden")
-        min_width = self._responsive._resolve_value(
-            self._responsive.get("min_width", 0)
-        )
-        min_height = self._responsive._resolve_value(
-            self._responsive.get("min_height", 0)
-        )
+        # Store current settings
+        self._preserve_content = self._responsive.get("preserve_content", True)
+        self._overflow = self._responsive.get("overflow", "hidden")
 
-        # Convert ratio to float if needed
-        if ratio is None:
-            self._current_ratio = 1.0  # Default to square
-        elif isinstance(ratio, str):
-            self._current_ratio = self._get_ratio_value(ratio)
-        else:
-            self._current_ratio = float(ratio)
+        if not self._is_fixed:
+            self._apply_resolved_properties()
 
-        # Store current settings
-        self._preserve_content = preserve_content
-        self._overflow = overflow
+        # Update layout
+        self._update_aspect_layout()
+
+    def _apply_resolved_properties(self) -> None:
+        """Apply the ratio and minimum sizes for the current breakpoint."""
+        resolved = self._resolved
+        if not resolved:
+            # The props are stored as string-keyed breakpoint dicts, which
+            # resolve_fast handles (get() only matches Breakpoint keys)
+            responsive = self._responsive
+            ratio = responsive.resolve_fast("ratio", 1.0)
+
+            # Convert ratio to float if needed
+            resolved["fraction"] = None
+            if ratio is None:
+                resolved["ratio"] = 1.0  # Default to square
+            elif isinstance(ratio, str):
+                resolved["ratio"] = self._get_ratio_value(ratio)
+                resolved["fraction"] = self._RATIO_FRACTION.get(ratio)
+            else:
+                resolved["ratio"] = float(ratio)
+
+            resolved["min_width"] = responsive.resolve_fast("min_width", 0)
+            resolved["min_height"] = responsive.resolve_fast("min_height", 0)
+
+        self._current_ratio = resolved["ratio"]
+        self._ratio_fraction = resolved["fraction"]
+        min_width = resolved["min_width"]
+        min_height = resolved["min_height"]
 
         # Apply minimum size constraints
         if min_width and min_width > 0:
@@ -147,118 +235,104 @@ class AspectRatio(LayoutComponent):
         if min_height and min_height > 0:
             self.setMinimumHeight(min_height)
 
-        # Update layout
-        self._update_aspect_layout()
-
     def _update_aspect_layout(self) -> None:
         """Update the layout to maintain aspect ratio."""
-        if not hasattr(self, "_current_ratio"):
-            return
-
-        # Calculate target size based on available space and aspect ratio
-        available_size = self.sizeHint()
-        available_width = available_size.width()
-        available_height = available_size.height()
+        # Calculate target size based on the current (not preferred) size;
+        # resize events are coalesced, so this is read once the burst is over.
+        # (size() itself is shadowed by the component's size style prop.)
+        available_width = self.width()
+        available_height = self.height()
 
         if available_width <= 0 or available_height <= 0:
             return
 
         # Calculate dimensions that maintain aspect ratio
-        target_width = available_height * self._current_ratio
-        target_height = available_width / self._current_ratio
-
-        # Choose dimensions that fit within available space
-        if target_width <= available_width:
-            # Width-limited: use calculated width, full height
-            final_width = int(target_width)
-            final_height = available_height
-        else:
-            # Height-limited: use full width, calculated height
-            final_width = available_width
-            final_height = int(target_height)
+        final_width, final_height = _compute_target_size(
+            available_width, available_height, self._current_ratio, self._ratio_fraction
+        )
 
-        # Apply content container size
-        self._content_container.setFixedSize(final_width, final_height)
+        # Center the content container in the available space
+        x = (available_width - final_width) // 2
+        y = (available_height - final_height) // 2
 
-        # Handle overflow
-        if self._overflow == "hidden":
-            self._content_container.setClipChildren(True)
-        else:
-            self._content_container.setClipChildren(False)
+        # Redundant setGeometry calls still post resize and move events
+        key = (x, y, final_width, final_height)
+        if key == self._last_applied:
+            return
+
+        # Suspend painting so the container and children are repainted once,
+        # unless an outer caller has already done so
+        batch_updates = self.updatesEnabled()
+        if batch_updates:
+            self.setUpdatesEnabled(False)
+        self._applying_layout = True
+        try:
+            if key[2:] == self._last_applied[2:]:
+                # Only the offset changed (e.g. resizing along the fitted
+                # axis), so the children keep their geometry
+                self._content_container.move(x, y)
+            else:
+                # Apply content container geometry; children fill it
+                self._content_container.setGeometry(x, y, final_width, final_height)
+                for child in self._children:
+                    child.setGeometry(0, 0, final_width, final_height)
+            self._last_applied = key
+        finally:
+            self._applying_layout = False
+            if batch_updates:
+                # Re-enabling updates schedules a repaint of the whole widget
+                self.setUpdatesEnabled(True)
 
     def _set_ratio(
         self, value: Union[float, str, Dict[str, Union[float, str]]]
     ) -> None:
         """Private method to set ratio with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_ratio = {}
-
-        if isinstance(value, (int, float, str)):
-            full_ratio = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = "square"  # Default
-            full_ratio["base"] = value.get("base", current)
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_ratio[bp] = current
-        else:
-            full_ratio = {bp: "square" for bp in breakpoints_order}
-
-        self._responsive.set("ratio", full_ratio)
+        if not isinstance(value, (int, float, str, dict)):
+            value = "square"
+        self._responsive.set("ratio", _expand_breakpoints(value, "square"))
 
     def _set_min_width(self, value: Union[int, Dict[str, int]]) -> None:
         """Private method to set min_width with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_min_width = {}
-
-        if isinstance(value, int):
-            full_min_width = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = 0
-            full_min_width["base"] = value.get("base", 0)
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_min_width[bp] = current
-        else:
-            full_min_width = {bp: 0 for bp in breakpoints_order}
-
-        # Ensure non-negative values
-        for bp in breakpoints_order:
-            full_min_width[bp] = max(0, full_min_width[bp])
-
-        self._responsive.set("min_width", full_min_width)
+        if not isinstance(value, (int, dict)):
+            value = 0
+        self._responsive.set(
+            "min_width", _expand_breakpoints(value, 0, _clamp_non_negative)
+        )
 
     def _set_min_height(self, value: Union[int, Dict[str, int]]) -> None:
         """Private method to set min_height with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_min_height = {}
-
-        if isinstance(value, int):
-            full_min_height = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = 0
-            full_min_height["base"] = value.get("base", 0)
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_min_height[bp] = current
-        else:
-            full_min_height = {bp: 0 for bp in breakpoints_order}
-
-        # Ensure non-negative values
-        for bp in breakpoints_order:
-            full_min_height[bp] = max(0, full_min_height[bp])
-
-        self._responsive.set("min_height", full_min_height)
+        if not isinstance(value, (int, dict)):
+            value = 0
+        self._responsive.set(
+            "min_height", _expand_breakpoints(value, 0, _clamp_non_negative)
+        )
 
     def _update_responsive_props(self) -> None:
         """Update responsive properties and aspect ratio behavior."""
+        if self._initializing:
+            return
+
+        breakpoint = self._get_current_breakpoint()
+        if breakpoint != self._resolved_breakpoint:
+            self._resolved_breakpoint = breakpoint
+            self._responsive.update_breakpoint(Breakpoint(breakpoint))
+            self._invalidate_resolved()
+
         super()._update_responsive_props()
         self._update_aspect_properties()
 
     def resizeEvent(self, event) -> None:
         """Handle resize events to maintain aspect ratio."""
-        super().resizeEvent(event)
-        self._update_aspect_layout()
+        # Skip LayoutComponent's synchronous responsive refresh; the timer
+        # runs it (and the aspect layout) once the resize burst is over
+        super(LayoutComponent, self).resizeEvent(event)
+        if not self._applying_layout:
+            self._resize_timer.start()
+
+    @Slot()
+    def _handle_resize_timeout(self) -> None:
+        """Refresh responsive props and the aspect layout after resizing."""
+        self._update_responsive_props()
 
     # AspectRatio Properties (with responsive support)
 
@@ -270,7 +344,9 @@ class AspectRatio(LayoutComponent):
     @ratio.setter
     def ratio(self, value: Union[float, str, Dict[str, Union[float, str]]]) -> None:
         """Set the aspect ratio (responsive)."""
+        self._is_fixed = False
         self._set_ratio(value)
+        self._invalidate_resolved()
         self._update_responsive_props()
 
     @Property(bool)
@@ -305,7 +381,9 @@ class AspectRatio(LayoutComponent):
     @min_width.setter
     def min_width(self, value: Union[int, Dict[str, int]]) -> None:
         """Set the min_width constraint (responsive)."""
+        self._is_fixed = False
         self._set_min_width(value)
+        self._invalidate_resolved()
         self._update_responsive_props()
 
     @Property(object)
@@ -316,15 +394,19 @@ class AspectRatio(LayoutComponent):
     @min_height.setter
     def min_height(self, value: Union[int, Dict[str, int]]) -> None:
         """Set the min_height constraint (responsive)."""
+        self._is_fixed = False
         self._set_min_height(value)
+        self._invalidate_resolved()
         self._update_responsive_props()
 
     def add_child(self, child: QWidget, **layout_props: Any) -> None:
         """Add a child widget to the aspect ratio container."""
         super().add_child(child, **layout_props)
-        # Add to content layout
-        if self._content_layout:
-            self._content_layout.addWidget(child)
+        # Host the child in the content container, sized to the ratio box
+        child.setParent(self._content_container)
+        if self._content_container.isVisible():
+            child.show()
+        child.setGeometry(self._content_container.rect())
 
     # Convenience methods
 
@@ -364,21 +446,109 @@ class AspectRatio(LayoutComponent):
 
     def get_current_ratio(self) -> float:
         """Get the currently resolved aspect ratio value."""
-        if hasattr(self, "_current_ratio"):
-            return self._current_ratio
-        return 1.0
+        return self._current_ratio
 
     def get_target_size(
         self, available_width: int, available_height: int
     ) -> Tuple[int, int]:
         """Calculate target size for given available dimensions."""
-        if not hasattr(self, "_current_ratio"):
-            return available_width, available_height
+        return _compute_target_size(
+            available_width, available_height, self._current_ratio, self._ratio_fraction
+        )
 
-        target_width = available_height * self._current_ratio
-        target_height = available_width / self._current_ratio
 
-        if target_width <= available_width:
-            return int(target_width), available_height
-        else:
-            return available_width, int(target_height)
+def _compute_target_size(
+    available_width: int,
+    available_height: int,
+    ratio: float,
+    fraction: Optional[Tuple[int, int]] = None,
+) -> Tuple[int, int]:
+    """
+    Fit a box of the given aspect ratio inside the available space.
+
+    Args:
+        available_width: Width of the available space
+        available_height: Height of the available space
+        ratio: Width / height ratio as a float
+        fraction: Exact (numerator, denominator) form of ratio, if known
+
+    Returns:
+        Tuple of (width, height) that maintains the ratio
+    """
+    # Exact ratios use integer arithmetic so the result can't drift by a
+    # pixel between otherwise identical passes
+    if fraction is not None:
+        num, den = fraction
+        if available_height * num <= available_width * den:
+            return available_height * num // den, available_height
+        return available_width, available_width * den // num
+
+    target_width = available_height * ratio
+    if target_width <= available_width:
+        return int(target_width), available_height
+    return available_width, int(available_width / ratio)
+
+
+def _integer_fraction(ratio: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse an "a/b" ratio string with positive integer terms.
+
+    Args:
+        ratio: Ratio string such as "16/9"
+
+    Returns:
+        The reduced (numerator, denominator) pair, or None if the string
+        isn't an integer fraction
+    """
+    num, sep, den = ratio.partition("/")
+    if not sep:
+        return None
+    try:
+        fraction = Fraction(int(num), int(den))
+    except (ValueError, ZeroDivisionError):
+        return None
+    if fraction <= 0:
+        return None
+    return fraction.numerator, fraction.denominator
+
+
+def _clamp_non_negative(value: int) -> int:
+    """Clamp a size constraint to be non-negative."""
+    return max(0, value)
+
+
+def _expand_breakpoints(
+    value: Any, default: Any, clamp: Optional[Callable[[Any], Any]] = None
+) -> Dict[str, Any]:
+    """
+    Expand a scalar or partial breakpoint dict to a value for every breakpoint.
+
+    Breakpoints missing from a dict inherit the value of the nearest smaller
+    breakpoint, starting from default.
+
+    Args:
+        value: A single value or a dict of breakpoint values
+        default: Value used until the dict sets one
+        clamp: Optional function applied to each resulting value
+
+    Returns:
+        Dict mapping every breakpoint name to its value
+    """
+    if not isinstance(value, dict):
+        return dict.fromkeys(_BREAKPOINTS, value if clamp is None else clamp(value))
+
+    if clamp is None:
+        expanded = {}
+        current = default
+        for bp in _BREAKPOINTS:
+            current = expanded[bp] = value.get(bp, current)
+        return expanded
+
+    # Clamp each distinct value once rather than once per breakpoint
+    expanded = {}
+    current = clamp(default)
+    for bp in _BREAKPOINTS:
+        if bp in value:
+            current = clamp(value[bp])
+        expanded[bp] = current
+    return expanded
@@ -7,9 +7,14 @@ For advanced flex/grid, consider using dedicated Flex/Grid components.
 Integrates with theme system via PolygonProvider for spacing and colors.
 """
 
-from typing import Optional, Any, Dict, Union
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QGridLayout
-from PySide6.QtCore import Qt, Property
+import sys
+import warnings
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Any, ClassVar, Dict, Mapping, Tuple, Union
+from PySide6.QtWidgets import QWidget, QBoxLayout, QGridLayout
+from PySide6.QtCore import Qt, Property, Slot
+from shiboken6 import delete
 
 from ...core.provider import PolygonProvider
 from ..core.base import LayoutComponent
@@ -43,6 +48,72 @@ class Box(LayoutComponent):
         card = Box.card(p="lg")
     """
 
+    # No __slots__: as with AspectRatio, slotting works for Box itself but
+    # any Python subclass of it segfaults on slot assignment.
+
+    # Style props used by Box.card() unless overridden
+    _CARD_DEFAULTS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "p": "md",
+            "bg": "white",
+            "c": "text",
+            "border": "1px solid gray.300",
+            "borderRadius": "md",
+            "boxShadow": "0 1px 3px rgba(0, 0, 0, 0.12)",
+        }
+    )
+
+    # Set once the basic-wrap warning has been emitted for any Box
+    _wrap_warned = False
+
+    # Style props and the QSS declaration each one renders to, in output order.
+    # Pixel padding is applied as contents margins instead of QSS.
+    _QSS_PROPS = (
+        ("m", "margin: %s;"),
+        ("p", "padding: %s;"),
+        ("bg", "background-color: %s;"),
+        ("c", "color: %s;"),
+        ("border", "border: %s;"),
+        ("borderRadius", "border-radius: %s;"),
+        ("boxShadow", "box-shadow: %s;"),
+    )
+
+    # Flex direction prop to the equivalent QBoxLayout direction
+    _FLEX_DIRECTIONS = {
+        "row": QBoxLayout.LeftToRight,
+        "row-reverse": QBoxLayout.RightToLeft,
+        "column": QBoxLayout.TopToBottom,
+        "column-reverse": QBoxLayout.BottomToTop,
+    }
+
+    # QBoxLayout directions that lay children out in a row
+    _HORIZONTAL_DIRECTIONS = (QBoxLayout.LeftToRight, QBoxLayout.RightToLeft)
+
+    # justify/align prop to Qt alignment for horizontal and vertical flex
+    # layouts; values not listed fall back to the .get default at the call
+    _H_JUSTIFY = {
+        "start": Qt.AlignLeft,
+        "center": Qt.AlignHCenter,
+        "end": Qt.AlignRight,
+    }
+    _H_ALIGN = {
+        "start": Qt.AlignTop,
+        "center": Qt.AlignVCenter,
+        "end": Qt.AlignBottom,
+        "stretch": Qt.AlignTop,
+    }
+    _V_JUSTIFY = {
+        "start": Qt.AlignTop,
+        "center": Qt.AlignVCenter,
+        "end": Qt.AlignBottom,
+    }
+    _V_ALIGN = {
+        "start": Qt.AlignLeft,
+        "center": Qt.AlignHCenter,
+        "end": Qt.AlignRight,
+        "stretch": Qt.AlignLeft,
+    }
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -72,36 +143,61 @@ class Box(LayoutComponent):
         # Responsive handler for both style and layout props
         self._responsive = ResponsiveProps(self)
 
-        # Initialize style props (responsive)
-        self._responsive.set("m", m or {})
-        self._responsive.set("p", p or {})
-        self._responsive.set("bg", bg or {})
-        self._responsive.set("c", c or {})
-        self._responsive.set("border", border or {})
-
-        # Layout props
-        self._responsive.set("display", display)
-        self._responsive.set("direction", direction)
-        self._responsive.set("justify", justify)
-        self._responsive.set("align", align)
-        self._responsive.set("gap", gap or {})
-        self._responsive.set("wrap", wrap or False)
-        self._responsive.set("width", width or {})
-        self._responsive.set("height", height or {})
-        self._responsive.set("borderRadius", borderRadius or {})
-        self._responsive.set("boxShadow", boxShadow or {})
+        # Props resolved for the current breakpoint, read by the Qt property
+        # getters; setters drop their entry and breakpoint changes clear it
+        self._resolved_props: Dict[str, Any] = {}
+
+        # Resolved CSS values keyed by (prop, breakpoint), valid for one theme
+        # version; setters drop the entries of the prop they change
+        self._style_value_cache: Dict[Tuple[str, str], str] = {}
+        self._style_value_version = -1
+
+        # Padding last applied as contents margins
+        self._applied_padding = 0
+
+        # Initialize style and layout props (responsive) in one pass
+        self._responsive.bulk_set(
+            {
+                "m": m or {},
+                "p": p or {},
+                "bg": bg or {},
+                "c": c or {},
+                "border": border or {},
+                "display": display,
+                "direction": direction,
+                "justify": justify,
+                "align": align,
+                "gap": gap or {},
+                "wrap": wrap or False,
+                "width": width or {},
+                "height": height or {},
+                "borderRadius": borderRadius or {},
+                "boxShadow": boxShadow or {},
+            }
+        )
 
         # Internal state
         self._display = display
         self._direction = direction
         self._layout_mode_set = False
 
+        # Breakpoint the responsive props were last resolved for; resizes
+        # within the same breakpoint leave them unchanged
+        self._last_breakpoint: Optional[str] = None
+
+        # Layout styling changes are coalesced with style changes into the
+        # deferred styling flush
+        self._layout_dirty = False
+
+        # Spacing and alignment last applied to the current Qt layout
+        self._applied_spacing: Optional[int] = None
+        self._applied_alignment: Optional[Qt.AlignmentFlag] = None
+
         # Setup layout mode based on display
         self._setup_layout_mode()
 
-        # Initial updates
-        self._update_styling()
-        self._update_layout_styling()
+        # Initial styling runs once, in the flush PolygonComponent scheduled
+        self._schedule_layout_update()
 
     def _setup_layout_mode(self) -> None:
         """
@@ -110,23 +206,41 @@ class Box(LayoutComponent):
         - 'flex': QBoxLayout (H/V based on direction)
         - 'grid': QGridLayout (basic grid)
         """
-        if self._layout_mode_set:
-            # Clear existing layout if changing mode
-            if self._layout:
-                while self._layout.count():
-                    child = self._layout.takeAt(0)
-                    if child.widget():
-                        child.widget().setParent(None)
-                self._layout = None
+        display_val = self._resolved_prop("display", "block")
+        layout = self._layout
+
+        # Reuse the current layout when the kind is unchanged: children stay
+        # seated and a flex direction flip is a single setDirection call
+        if display_val == "flex" and isinstance(layout, QBoxLayout):
+            box_direction = self._flex_box_direction()
+            if layout.direction() != box_direction:
+                layout.setDirection(box_direction)
+            return
+        if display_val == "grid" and isinstance(layout, QGridLayout):
+            return
+        if (
+            display_val not in ("flex", "grid")
+            and layout is None
+            and self._layout_mode_set
+        ):
+            return
+
+        if layout is not None:
+            # Changing mode: empty the old layout (children stay parented to
+            # the box) and delete it now so the new one can be installed
+            while layout.count():
+                layout.takeAt(0)
+            delete(layout)
+            self._layout = None
 
-        display_val = self._responsive.get("display", "block")
+        # A new layout starts with Qt's defaults, not the values we applied
+        self._applied_spacing = None
+        self._applied_alignment = None
 
         if display_val == "flex":
-            direction_val = self._responsive.get("direction", "row")
-            if direction_val in ["row", "row-reverse"]:
-                self._layout = QHBoxLayout(self)
-            else:
-                self._layout = QVBoxLayout(self)
+            # One QBoxLayout class serves every direction, so flips never
+            # need a different layout type
+            self._layout = QBoxLayout(self._flex_box_direction(), self)
             self._layout.setContentsMargins(0, 0, 0, 0)
             self._layout.setSpacing(0)  # Gap handled via theme in styling
             self._layout_mode_set = True
@@ -140,36 +254,60 @@ class Box(LayoutComponent):
             self._layout = None
             self._layout_mode_set = True
 
-        # Re-add existing children to new layout
-        for child in self._children[:]:
-            self.add_child(child)
+        # Seat existing children in the new layout directly; they are already
+        # tracked in _children, so add_child's bookkeeping is not needed
+        if self._layout is not None:
+            add_widget = self._layout.addWidget
+            for child in self._children:
+                add_widget(child)
+
+    def _flex_box_direction(self) -> QBoxLayout.Direction:
+        """Map the flex direction prop to a QBoxLayout direction."""
+        direction_val = self._resolved_prop("direction", "row")
+        return self._FLEX_DIRECTIONS.get(direction_val, QBoxLayout.TopToBottom)
 
     def _get_responsive_style_value(self, prop_key: str, default: str = "") -> str:
         """
         Get the current responsive value for a style property and convert to CSS string.
-        Uses theme provider for spacing and colors.
+        Uses theme provider for spacing and colors. Results are cached per
+        breakpoint and theme version.
         """
         # Handle case where _responsive hasn't been initialized yet (during parent __init__)
         if not hasattr(self, "_responsive"):
             return default
 
-        value = self._responsive.get(prop_key, default)
+        cache = self._current_style_value_cache()
+        key = (prop_key, self._get_current_breakpoint())
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        css = cache[key] = self._resolve_style_value(prop_key, default)
+        return css
+
+    def _current_style_value_cache(self) -> Dict[Tuple[str, str], str]:
+        """Return the resolved style value cache, cleared on theme changes."""
+        version = self._provider.theme_version if self._provider else -1
+        if version != self._style_value_version:
+            self._style_value_cache.clear()
+            self._style_value_version = version
+        return self._style_value_cache
+
+    def _resolve_style_value(self, prop_key: str, default: str = "") -> str:
+        """Resolve a style property to its CSS string, bypassing the cache."""
+        # resolve_fast maps string-keyed breakpoint dicts to the value for the
+        # current width, falling back to the nearest smaller breakpoint set
+        value = self._responsive.resolve_fast(prop_key, default)
         if not value:
             return ""
 
-        if isinstance(value, dict):
-            # Use current breakpoint value
-            current_bp = self._get_current_breakpoint()
-            # Simple fallback to 'base' or first value
-            value = value.get("base", next(iter(value.values()), default))
-
         if prop_key in ["m", "p"] and isinstance(value, str) and self._provider:
             # Spacing from theme
-            px_value = self._provider.get_theme_value(f"spacing.{value}", 8)
+            px_value = self._provider.get_theme_value(_theme_key("spacing", value), 8)
             return f"{px_value}px"
         elif prop_key in ["bg", "c"] and isinstance(value, str) and self._provider:
             # Color from theme
-            theme_key = f"colors.{value}" if "." not in value else value
+            theme_key = _theme_key("colors", value) if "." not in value else value
             color_value = self._provider.get_theme_value(theme_key, value)
             return color_value
         elif prop_key == "border" and isinstance(value, str):
@@ -179,274 +317,291 @@ class Box(LayoutComponent):
                 pass
             return value
         elif prop_key == "borderRadius" and isinstance(value, str) and self._provider:
-            px_value = self._provider.get_theme_value(f"spacing.{value}", 4)
+            px_value = self._provider.get_theme_value(_theme_key("spacing", value), 4)
             return f"{px_value}px"
         return str(value)
 
     def _update_styling(self) -> None:
         """Generate and apply QSS based on current style props."""
+        if not hasattr(self, "_responsive"):
+            super()._update_styling()
+            return
+
+        # Inlined _get_responsive_style_value: the theme version and the
+        # breakpoint (a Qt width() call) are checked once per pass, not per prop
+        cache = self._current_style_value_cache()
+        breakpoint = self._get_current_breakpoint()
+        values = []
+        padding = 0
+        for prop_key, _template in self._QSS_PROPS:
+            key = (prop_key, breakpoint)
+            value = cache.get(key)
+            if value is None:
+                value = cache[key] = self._resolve_style_value(prop_key)
+            if prop_key == "p" and value:
+                # Pixel padding goes to the contents margins, which the
+                # layout honours without a stylesheet reparse
+                pixels = _css_pixels(value)
+                if pixels is not None:
+                    padding = pixels
+                    value = ""
+            values.append(value)
+
+        if padding != self._applied_padding:
+            self._applied_padding = padding
+            self.setContentsMargins(padding, padding, padding, padding)
+
+        # The box QSS is one of the component's stylesheet layers. Set it
+        # before the base pass so a changed base layer applies both at once;
+        # otherwise apply it here (a no-op when the sheet is unchanged).
+        self._component_qss = _join_qss(self._QSS_PROPS, tuple(values))
         super()._update_styling()
+        self._apply_stylesheet()
+
+    def _resolved_prop(self, prop_key: str, default: Any) -> Any:
+        """Return a prop's value for the current breakpoint via the flat cache."""
+        try:
+            return self._resolved_props[prop_key]
+        except KeyError:
+            value = self._responsive.resolve_fast(prop_key, default)
+            self._resolved_props[prop_key] = value
+            return value
 
-        qss_parts = []
-
-        # Margin
-        margin_val = self._get_responsive_style_value("m")
-        if margin_val:
-            qss_parts.append(f"margin: {margin_val};")
-
-        # Padding
-        padding_val = self._get_responsive_style_value("p")
-        if padding_val:
-            qss_parts.append(f"padding: {padding_val};")
-
-        # Background
-        bg_val = self._get_responsive_style_value("bg")
-        if bg_val:
-            qss_parts.append(f"background-color: {bg_val};")
-
-        # Color
-        color_val = self._get_responsive_style_value("c")
-        if color_val:
-            qss_parts.append(f"color: {color_val};")
-
-        # Border
-        border_val = self._get_responsive_style_value("border")
-        if border_val:
-            qss_parts.append(f"border: {border_val};")
-
-        # Border Radius
-        br_val = self._get_responsive_style_value("borderRadius")
-        if br_val:
-            qss_parts.append(f"border-radius: {br_val};")
-
-        # Box Shadow
-        shadow_val = self._get_responsive_style_value("boxShadow")
-        if shadow_val:
-            qss_parts.append(f"box-shadow: {shadow_val};")
-
-        if qss_parts:
-            self.setStyleSheet(" ".join(qss_parts))
+    def _set_prop(self, prop_key: str, value: Any) -> None:
+        """Store a responsive prop and drop its resolved value."""
+        self._responsive.set(prop_key, value)
+        self._resolved_props.pop(prop_key, None)
+
+    def _set_style_value(self, prop_key: str, value: Any) -> None:
+        """Store a style prop, drop its cached CSS and schedule a restyle."""
+        self._set_prop(prop_key, value)
+        for breakpoint in self._BREAKPOINT_NAMES:
+            self._style_value_cache.pop((prop_key, breakpoint), None)
+        self._schedule_style_update()
+
+    def _schedule_layout_update(self) -> None:
+        """Mark layout styling as dirty and schedule a deferred flush."""
+        if self._layout is None:
+            # Block mode: there is no layout to style
+            return
+        self._layout_dirty = True
+        self._schedule_flush()
+
+    @Slot()
+    def _flush_styling(self) -> None:
+        """Apply pending style updates, then any pending layout styling."""
+        super()._flush_styling()
+        if self._layout_dirty and not self._style_batch_depth:
+            self._layout_dirty = False
+            self._update_layout_styling()
 
     def _update_layout_styling(self) -> None:
         """Update layout-specific styling (gaps, alignment)."""
 
         if self._layout:
             # Gap
-            gap_val = self._responsive.get("gap", "none")
-            if gap_val != "none":
+            gap_val = self._resolved_prop("gap", "none")
+            if gap_val and gap_val != "none":
                 spacing = self._get_spacing_pixels(gap_val)
-                self._layout.setSpacing(spacing)
+                if spacing != self._applied_spacing:
+                    self._applied_spacing = spacing
+                    self._layout.setSpacing(spacing)
 
             # Alignment
-            justify_val = self._responsive.get("justify", "start")
-            align_val = self._responsive.get("align", "stretch")
-            if isinstance(self._layout, QHBoxLayout):
-                h_align = Qt.AlignLeft
-                if justify_val == "center":
-                    h_align = Qt.AlignHCenter
-                elif justify_val == "end":
-                    h_align = Qt.AlignRight
-                v_align = Qt.AlignVCenter
-                if align_val == "start":
-                    v_align = Qt.AlignTop
-                elif align_val == "center":
-                    v_align = Qt.AlignVCenter
-                elif align_val == "end":
-                    v_align = Qt.AlignBottom
-                elif align_val == "stretch":
-                    v_align = Qt.AlignTop
-                self._layout.setAlignment(h_align | v_align)
-            elif isinstance(self._layout, QVBoxLayout):
-                v_align = Qt.AlignTop
-                if justify_val == "center":
-                    v_align = Qt.AlignVCenter
-                elif justify_val == "end":
-                    v_align = Qt.AlignBottom
-                h_align = Qt.AlignLeft
-                if align_val == "start":
-                    h_align = Qt.AlignLeft
-                elif align_val == "center":
-                    h_align = Qt.AlignHCenter
-                elif align_val == "end":
-                    h_align = Qt.AlignRight
-                self._layout.setAlignment(h_align | v_align)
+            justify_val = self._resolved_prop("justify", "start")
+            align_val = self._resolved_prop("align", "stretch")
+            layout = self._layout
+            if isinstance(layout, QBoxLayout):
+                if layout.direction() in self._HORIZONTAL_DIRECTIONS:
+                    alignment = self._H_JUSTIFY.get(
+                        justify_val, Qt.AlignLeft
+                    ) | self._H_ALIGN.get(align_val, Qt.AlignVCenter)
+                else:
+                    alignment = self._V_JUSTIFY.get(
+                        justify_val, Qt.AlignTop
+                    ) | self._V_ALIGN.get(align_val, Qt.AlignLeft)
+                self._set_layout_alignment(alignment)
             # For GridLayout, basic alignment can be added if needed
 
+    def _set_layout_alignment(self, alignment: Qt.AlignmentFlag) -> None:
+        """Apply alignment to the Qt layout unless it is already set."""
+        if alignment != self._applied_alignment:
+            self._applied_alignment = alignment
+            self._layout.setAlignment(alignment)
+
     # Style Properties (responsive)
     @Property(str)
     def m(self) -> str:
         """Get current margin value."""
-        return self._responsive.get("m", "")
+        return self._resolved_prop("m", "")
 
     @m.setter
     def m(self, value: Union[str, Dict[str, str]]) -> None:
         """Set margin (e.g., 'md', {'base': 'sm', 'md': 'lg'})."""
-        self._responsive.set("m", value)
-        self._update_styling()
+        self._set_style_value("m", value)
 
     @Property(str)
     def p(self) -> str:
         """Get current padding value."""
-        return self._responsive.get("p", "")
+        return self._resolved_prop("p", "")
 
     @p.setter
     def p(self, value: Union[str, Dict[str, str]]) -> None:
         """Set padding (e.g., 'lg', {'sm': 'md'})."""
-        self._responsive.set("p", value)
-        self._update_styling()
+        self._set_style_value("p", value)
 
     @Property(str)
     def bg(self) -> str:
         """Get current background color key."""
-        return self._responsive.get("bg", "")
+        return self._resolved_prop("bg", "")
 
     @bg.setter
     def bg(self, value: Union[str, Dict[str, str]]) -> None:
         """Set background (e.g., 'blue.500', {'dark': 'gray.900'})."""
-        self._responsive.set("bg", value)
-        self._update_styling()
+        self._set_style_value("bg", value)
 
     @Property(str)
     def c(self) -> str:
         """Get current text color key."""
-        return self._responsive.get("c", "")
+        return self._resolved_prop("c", "")
 
     @c.setter
     def c(self, value: Union[str, Dict[str, str]]) -> None:
         """Set color (e.g., 'text', {'base': 'black'})."""
-        self._responsive.set("c", value)
-        self._update_styling()
+        self._set_style_value("c", value)
 
     @Property(str)
     def border(self) -> str:
         """Get current border style."""
-        return self._responsive.get("border", "")
+        return self._resolved_prop("border", "")
 
     @border.setter
     def border(self, value: Union[str, Dict[str, str]]) -> None:
         """Set border (e.g., '1px solid gray.300')."""
-        self._responsive.set("border", value)
-        self._update_styling()
+        self._set_style_value("border", value)
 
     # Layout Properties
     @Property(str)
     def display(self) -> str:
         """Get current display mode."""
-        return self._responsive.get("display", "block")
+        return self._resolved_prop("display", "block")
 
     @display.setter
     def display(self, value: Union[str, Dict[str, str]]) -> None:
         """Set display mode ('block', 'flex', 'grid')."""
-        self._responsive.set("display", value)
-        self._display = self._responsive.get("display", "block")
+        self._set_prop("display", value)
+        self._display = self._resolved_prop("display", "block")
         self._setup_layout_mode()
-        self._update_layout_styling()
+        self._schedule_layout_update()
 
     @Property(str)
     def direction(self) -> str:
         """Get current direction for flex/grid."""
-        return self._responsive.get("direction", "row")
+        return self._resolved_prop("direction", "row")
 
     @direction.setter
     def direction(self, value: Union[str, Dict[str, str]]) -> None:
         """Set direction ('row', 'column', etc.)."""
-        self._responsive.set("direction", value)
-        self._direction = self._responsive.get("direction", "row")
+        self._set_prop("direction", value)
+        self._direction = self._resolved_prop("direction", "row")
         if self.display == "flex":
             self._setup_layout_mode()
-        self._update_layout_styling()
+        self._schedule_layout_update()
 
     # Additional Layout Properties
     @Property(str)
     def justify(self) -> str:
         """Get the current justify-content value."""
-        return self._responsive.get("justify", "start")
+        return self._resolved_prop("justify", "start")
 
     @justify.setter
     def justify(self, value: Union[str, Dict[str, str]]) -> None:
         """Set the justify-content."""
-        self._responsive.set("justify", value)
-        self._update_layout_styling()
+        self._set_prop("justify", value)
+        self._schedule_layout_update()
 
     @Property(str)
     def align(self) -> str:
         """Get the current align-items value."""
-        return self._responsive.get("align", "stretch")
+        return self._resolved_prop("align", "stretch")
 
     @align.setter
     def align(self, value: Union[str, Dict[str, str]]) -> None:
         """Set the align-items."""
-        self._responsive.set("align", value)
-        self._update_layout_styling()
+        self._set_prop("align", value)
+        self._schedule_layout_update()
 
     @Property(str)
     def gap(self) -> str:
         """Get the current gap spacing."""
-        return self._responsive.get("gap", "none")
+        return self._resolved_prop("gap", "none")
 
     @gap.setter
     def gap(self, value: Union[str, Dict[str, str]]) -> None:
         """Set the gap spacing."""
-        self._responsive.set("gap", value)
-        self._update_layout_styling()
+        self._set_prop("gap", value)
+        self._schedule_layout_update()
 
     @Property(bool)
     def wrap(self) -> bool:
         """Get the current wrap behavior."""
-        return self._responsive.get("wrap", False)
+        return self._resolved_prop("wrap", False)
 
     @wrap.setter
     def wrap(self, value: Union[bool, Dict[str, bool]]) -> None:
         """Set the wrap behavior. Note: Basic support only in Box."""
-        self._responsive.set("wrap", value)
-        if self.display == "flex" and value:
-            print("Warning: For full wrapping support, use the Flex component.")
-        self._update_layout_styling()
+        self._set_prop("wrap", value)
+        if value and not Box._wrap_warned and self.display == "flex":
+            Box._wrap_warned = True
+            warnings.warn(
+                "For full wrapping support, use the Flex component.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        self._schedule_layout_update()
 
     # Additional Style Properties
     @Property(str)
     def size_width(self) -> str:
         """Get the current width value."""
-        return self._responsive.get("width", "auto")
+        return self._resolved_prop("width", "auto")
 
     @size_width.setter
     def size_width(self, value: Union[str, Dict[str, str]]) -> None:
         """Set width (supports px, %, auto, theme keys)."""
-        self._responsive.set("width", value)
+        self._set_prop("width", value)
         self._update_size_props()
 
     @Property(str)
     def size_height(self) -> str:
         """Get the current height value."""
-        return self._responsive.get("height", "auto")
+        return self._resolved_prop("height", "auto")
 
     @size_height.setter
     def size_height(self, value: Union[str, Dict[str, str]]) -> None:
         """Set height (supports px, %, auto, theme keys)."""
-        self._responsive.set("height", value)
+        self._set_prop("height", value)
         self._update_size_props()
 
     @Property(str)
     def borderRadius(self) -> str:
         """Get the current border-radius value."""
-        return self._responsive.get("borderRadius", "")
+        return self._resolved_prop("borderRadius", "")
 
     @borderRadius.setter
     def borderRadius(self, value: Union[str, Dict[str, str]]) -> None:
         """Set border-radius (e.g., "md", "8px")."""
-        self._responsive.set("borderRadius", value)
-        self._update_styling()
+        self._set_style_value("borderRadius", value)
 
     @Property(str)
     def boxShadow(self) -> str:
         """Get the current box-shadow value."""
-        return self._responsive.get("boxShadow", "")
+        return self._resolved_prop("boxShadow", "")
 
     @boxShadow.setter
     def boxShadow(self, value: Union[str, Dict[str, str]]) -> None:
         """Set box-shadow (full CSS string)."""
-        self._responsive.set("boxShadow", value)
-        self._update_styling()
+        self._set_style_value("boxShadow", value)
 
     # Event Handling Integration
     def mousePressEvent(self, event) -> None:
@@ -463,12 +618,20 @@ class Box(LayoutComponent):
 
     def resizeEvent(self, event) -> None:
         """Handle resize to update responsive props and relayout."""
-        super().resizeEvent(event)
-        if hasattr(self, "_responsive"):
-            self._responsive._invalidate_all_cache()
-        self._update_styling()
+        # Skip LayoutComponent's per-event refresh; responsive values only
+        # change when the width crosses into another breakpoint
+        super(LayoutComponent, self).resizeEvent(event)
+        breakpoint = self._get_current_breakpoint()
+        if breakpoint == self._last_breakpoint:
+            return
+        self._last_breakpoint = breakpoint
+
+        self._responsive._invalidate_all_cache()
+        self._resolved_props.clear()
+        # Also regenerates the QSS
         self._update_responsive_props()
-        self._update_layout_styling()
+        if self._layout is not None:
+            self._update_layout_styling()
 
     # Override add_child to respect layout mode
     def add_child(self, child: QWidget, **layout_props: Any) -> None:
@@ -500,33 +663,69 @@ class Box(LayoutComponent):
     @classmethod
     def card(cls, **kwargs) -> "Box":
         """Class method to create a card-style Box with common defaults."""
-        defaults = {
-            "p": "md",
-            "bg": "white",
-            "c": "text",
-            "border": "1px solid gray.300",
-            "borderRadius": "md",
-            "boxShadow": "0 1px 3px rgba(0, 0, 0, 0.12)",
-        }
-        defaults.update(kwargs)
-        return cls(**defaults)
-
-    def _get_current_breakpoint(self) -> str:
-        """Helper from base, but ensure it's available."""
-        # Copied from base.py for completeness
-        breakpoints = {"base": 0, "sm": 576, "md": 768, "lg": 992, "xl": 1200}
-        width = self.width()
-        current_bp = "base"
-        for bp_name, bp_width in breakpoints.items():
-            if width >= bp_width:
-                current_bp = bp_name
-        return current_bp
+        if not kwargs:
+            return cls(**cls._CARD_DEFAULTS)
+        return cls(**(cls._CARD_DEFAULTS | kwargs))
 
     def _get_spacing_pixels(self, spacing_value: Union[str, int]) -> int:
         """Convert spacing value to pixels using theme."""
         if self._provider:
             if isinstance(spacing_value, str):
-                return self._provider.get_theme_value(f"spacing.{spacing_value}", 8)
+                return self._provider.get_theme_value(
+                    _theme_key("spacing", spacing_value), 8
+                )
             elif isinstance(spacing_value, int):
                 return spacing_value
         return 8 if isinstance(spacing_value, str) else int(spacing_value)
+
+
+@lru_cache(maxsize=128)
+def _join_qss(props: Tuple[Tuple[str, str], ...], values: Tuple[str, ...]) -> str:
+    """
+    Interpolate resolved style values into a Box stylesheet.
+
+    Boxes sharing a style signature (e.g. many cards) share one cached string.
+
+    Args:
+        props: (prop, template) pairs, as in Box._QSS_PROPS
+        values: Resolved CSS value per prop; empty values are skipped
+
+    Returns:
+        The space-joined QSS declarations
+    """
+    return " ".join(
+        template % value for (_, template), value in zip(props, values) if value
+    )
+
+
+@lru_cache(maxsize=256)
+def _theme_key(kind: str, value: str) -> str:
+    """
+    Build an interned theme lookup key such as "spacing.md".
+
+    Args:
+        kind: Theme section, e.g. "spacing" or "colors"
+        value: Key within the section
+
+    Returns:
+        The dotted key, shared across calls with the same arguments
+    """
+    return sys.intern(f"{kind}.{value}")
+
+
+def _css_pixels(css: str) -> Optional[int]:
+    """
+    Parse a CSS length in whole pixels.
+
+    Args:
+        css: Resolved CSS value such as "16px" or "16"
+
+    Returns:
+        The pixel count, or None for other units and non-integer values
+    """
+    if css.endswith("px"):
+        css = css[:-2]
+    try:
+        return int(css)
+    except ValueError:
+        return None
@@ -6,14 +6,73 @@ Supports inline/block behavior, fluid positioning, and max-width constraints.
 Uses Qt's built-in layout capabilities for optimal performance and reliability.
 """
 
-from typing import Optional, Any, Dict, Union
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy
-from PySide6.QtCore import Qt, Property, QSize
+import sys
+from typing import Callable, Optional, Any, Dict, Mapping, Tuple, Union
+from PySide6.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QVBoxLayout,
+    QHBoxLayout,
+    QSizePolicy,
+)
+from PySide6.QtCore import Qt, QSize, QTimer, Slot
 
-from ...core.provider import PolygonProvider
 from ..core.base import LayoutComponent
 from ..core.responsive import ResponsiveProps
 
+# Breakpoint names, smallest first. Interned so every normalized dict is
+# keyed by the same string objects and lookups compare by identity.
+_BREAKPOINTS: Tuple[str, ...] = tuple(
+    sys.intern(bp) for bp in ("base", "sm", "md", "lg", "xl")
+)
+
+# Qt's QWIDGETSIZE_MAX (no maximum), which PySide6 does not export
+_QWIDGETSIZE_MAX = (1 << 24) - 1
+
+# Size policies shared by every Center; Qt copies them on setSizePolicy
+_SP_EXPANDING = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+_SP_PREFERRED = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+
+
+def _is_bool(value: Any) -> bool:
+    """Accept only real booleans for inline/fluid."""
+    return isinstance(value, bool)
+
+
+def _is_size(value: Any) -> bool:
+    """Accept pixel ints and CSS/theme size strings for max sizes."""
+    return isinstance(value, (int, str))
+
+
+class _ResponsiveProp:
+    """
+    Descriptor for a Center responsive prop.
+
+    Setting normalizes the value to every breakpoint and refreshes only the
+    centering, in one call rather than a Qt Property setter chain. Reading
+    returns the value for the current breakpoint.
+    """
+
+    __slots__ = ("name", "default", "validator")
+
+    def __init__(self, default: Any, validator: Callable[[Any], bool]) -> None:
+        self.default = default
+        self.validator = validator
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = sys.intern(name)
+
+    def __get__(self, instance: Optional["Center"], owner: type) -> Any:
+        if instance is None:
+            return self
+        return instance._responsive.resolve_fast(self.name, self.default)
+
+    def __set__(self, instance: "Center", value: Any) -> None:
+        instance._responsive.set(
+            self.name, _normalize_responsive(value, self.default, self.validator)
+        )
+        instance._update_centering_properties()
+
 
 class Center(LayoutComponent):
     """
@@ -26,6 +85,10 @@ class Center(LayoutComponent):
     - Responsive behavior for all properties
     """
 
+    # No __slots__: LayoutComponent and PolygonComponent keep a __dict__, so
+    # slots here would save nothing, and slotting Center would make any Python
+    # subclass of it segfault on slot assignment (see PolygonComponent).
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -40,281 +103,204 @@ class Center(LayoutComponent):
         # Responsive props handler
         self._responsive = ResponsiveProps(self)
 
+        # Bursts of resize events (e.g. a window drag) are coalesced into one
+        # responsive refresh per frame
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._handle_resize_timeout)
+
+        # Resolved centering inputs last applied to the Qt widgets
+        self._last_resolved: Optional[Tuple[Any, ...]] = None
+
+        # Theme groups of named max sizes ("maxWidths", "maxHeights"), fetched
+        # once per theme version instead of one path lookup per name
+        self._theme_sizes: Dict[str, Mapping[str, Any]] = {}
+        self._theme_sizes_version: Any = -1
+
+        # Breakpoint at the last resize; resizes within it change nothing
+        self._last_breakpoint: Optional[str] = None
+
         # Set initial responsive properties
-        self._set_inline(inline)
-        self._set_fluid(fluid)
-        self._set_max_width(max_width)
-        self._set_max_height(max_height)
+        self._responsive.set("inline", _normalize_responsive(inline, False, _is_bool))
+        self._responsive.set("fluid", _normalize_responsive(fluid, True, _is_bool))
+        self._responsive.set(
+            "max_width", _normalize_responsive(max_width, None, _is_size)
+        )
+        self._responsive.set(
+            "max_height", _normalize_responsive(max_height, None, _is_size)
+        )
 
         # Setup centering layout
         self._setup_center_layout()
 
     def _setup_center_layout(self) -> None:
         """Set up the layout for perfect centering."""
-        # Main layout that provides centering
-        self._main_layout = QVBoxLayout(self)
+        # A single grid cell centers the content directly, without the
+        # intermediate centering widget and layout
+        self._main_layout = QGridLayout(self)
         self._main_layout.setContentsMargins(0, 0, 0, 0)
         self._main_layout.setSpacing(0)
 
-        # Center container that holds content
-        self._center_container = QWidget()
-        self._center_container.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Expanding
-        )
-
-        # Layout for center container
-        self._center_layout = QVBoxLayout(self._center_container)
-        self._center_layout.setContentsMargins(0, 0, 0, 0)
-        self._center_layout.setSpacing(0)
-
-        # Set center alignment
-        self._center_layout.setAlignment(Qt.AlignCenter)
-
-        # Add center container to main layout
-        self._main_layout.addWidget(self._center_container)
-
-        # Content container (will hold added children)
-        self._content_container = QWidget()
-        self._content_layout = QVBoxLayout(self._content_container)
-        self._content_layout.setContentsMargins(0, 0, 0, 0)
-        self._content_layout.setSpacing(0)
-        self._content_layout.setAlignment(Qt.AlignCenter)
-
-        # Add content container to center layout
-        self._center_layout.addWidget(self._content_container)
+        # Content container (will hold added children), created by the first
+        # add_child so empty placeholder Centers skip the extra widget
+        self._content_container: Optional[QWidget] = None
+        self._content_layout: Optional[QVBoxLayout] = None
 
         # Apply initial responsive properties
         self._update_centering_properties()
 
     def _update_centering_properties(self) -> None:
         """Update centering properties based on responsive values."""
-        inline = self._responsive._resolve_value(self._responsive.get("inline", False))
-        fluid = self._responsive.get("fluid", True)
-        max_width = self._responsive._resolve_value(
-            self._responsive.get("max_width", None)
-        )
-        max_height = self._responsive._resolve_value(
-            self._responsive.get("max_height", None)
-        )
+        responsive = self._responsive
+        inline = responsive.resolve_fast("inline", False)
+        fluid = responsive.resolve_fast("fluid", True)
+        max_width = responsive.resolve_fast("max_width")
+        max_height = responsive.resolve_fast("max_height")
+
+        # Resize bursts mostly re-resolve the same values; skip the Qt calls
+        # unless an input (or the theme behind named sizes) has changed
+        provider = self._provider
+        theme_version = provider.theme_version if provider else None
+        key = (inline, fluid, max_width, max_height, theme_version)
+        if key == self._last_resolved:
+            return
+        self._last_resolved = key
+        content = self._content_container
 
         # Handle inline vs block behavior
         if inline:
             # Inline behavior: don't expand to fill available space
-            self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-            self._center_container.setSizePolicy(
-                QSizePolicy.Preferred, QSizePolicy.Preferred
-            )
+            self.setSizePolicy(_SP_PREFERRED)
         else:
             # Block behavior: expand to fill available space
-            self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            self._center_container.setSizePolicy(
-                QSizePolicy.Expanding, QSizePolicy.Expanding
-            )
-
-        # Handle fluid positioning
-        if isinstance(fluid, dict):
-            resolved_fluid = self._responsive._resolve_value(fluid)
-        else:
-            resolved_fluid = fluid
+            self.setSizePolicy(_SP_EXPANDING)
+
+        if content is None:
+            return
 
-        if not resolved_fluid:
+        # Handle fluid positioning. An unaligned grid item fills the cell up
+        # to its maximum size and is centered in any remaining space; an
+        # AlignCenter item is kept at its size hint.
+        if not fluid:
             # Not fluid: use content size
-            self._content_container.setSizePolicy(
-                QSizePolicy.Preferred, QSizePolicy.Preferred
-            )
+            content.setSizePolicy(_SP_PREFERRED)
+            self._main_layout.setAlignment(content, Qt.AlignCenter)
         else:
             # Fluid: expand within constraints
-            self._content_container.setSizePolicy(
-                QSizePolicy.Expanding, QSizePolicy.Expanding
-            )
+            content.setSizePolicy(_SP_EXPANDING)
+            self._main_layout.setAlignment(content, Qt.Alignment())
 
-        # Apply max-width constraint
+        # Resolve max-width constraint
         if max_width is not None:
             if isinstance(max_width, str):
                 # Theme value (e.g., "md", "lg", "xl")
-                if self._provider:
-                    max_width_px = self._provider.get_theme_value(
-                        f"maxWidths.{max_width}", None
-                    )
-                else:
-                    max_width_px = None
+                max_width_px = self._theme_size("maxWidths", max_width, theme_version)
             else:
                 # Pixel value
                 max_width_px = max_width
-
-            if max_width_px is not None:
-                self._content_container.setMaximumWidth(max_width_px)
-            else:
-                self._content_container.setMaximumWidth(16777215)  # Qt's max value
         else:
-            self._content_container.setMaximumWidth(16777215)
+            max_width_px = None
 
-        # Apply max-height constraint
+        # Resolve max-height constraint
         if max_height is not None:
             if isinstance(max_height, str):
                 # Theme value
-                if self._provider:
-                    max_height_px = self._provider.get_theme_value(
-                        f"maxHeights.{max_height}", None
-                    )
-                else:
-                    max_height_px = None
+                max_height_px = self._theme_size(
+                    "maxHeights", max_height, theme_version
+                )
             else:
                 # Pixel value
                 max_height_px = max_height
-
-            if max_height_px is not None:
-                self._content_container.setMaximumHeight(max_height_px)
-            else:
-                self._content_container.setMaximumHeight(16777215)  # Qt's max value
-        else:
-            self._content_container.setMaximumHeight(16777215)
-
-    def _set_inline(self, value: Union[bool, Dict[str, bool]]) -> None:
-        """Private method to set inline property with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_inline = {}
-
-        if isinstance(value, bool):
-            full_inline = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = False
-            full_inline["base"] = value.get("base", False)
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_inline[bp] = current
-        else:
-            full_inline = {bp: False for bp in breakpoints_order}
-
-        self._responsive.set("inline", full_inline)
-
-    def _set_fluid(self, value: Union[bool, Dict[str, bool]]) -> None:
-        """Private method to set fluid property with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_fluid = {}
-
-        if isinstance(value, bool):
-            full_fluid = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = True
-            full_fluid["base"] = value.get("base", True)
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_fluid[bp] = current
         else:
-            full_fluid = {bp: True for bp in breakpoints_order}
+            max_height_px = None
 
-        self._responsive.set("fluid", full_fluid)
-
-    def _set_max_width(
-        self, value: Union[int, str, Dict[str, Union[int, str, None]]]
-    ) -> None:
-        """Private method to set max_width with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_max_width = {}
-
-        if value is None:
-            full_max_width = {bp: None for bp in breakpoints_order}
-        elif isinstance(value, (int, str)):
-            full_max_width = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = None
-            full_max_width["base"] = value.get("base")
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_max_width[bp] = current
-        else:
-            full_max_width = {bp: None for bp in breakpoints_order}
-
-        self._responsive.set("max_width", full_max_width)
-
-    def _set_max_height(
-        self, value: Union[int, str, Dict[str, Union[int, str, None]]]
-    ) -> None:
-        """Private method to set max_height with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_max_height = {}
-
-        if value is None:
-            full_max_height = {bp: None for bp in breakpoints_order}
-        elif isinstance(value, (int, str)):
-            full_max_height = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = None
-            full_max_height["base"] = value.get("base")
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_max_height[bp] = current
-        else:
-            full_max_height = {bp: None for bp in breakpoints_order}
+        # Both constraints in one call, so the layout is invalidated once
+        content.setMaximumSize(
+            _QWIDGETSIZE_MAX if max_width_px is None else max_width_px,
+            _QWIDGETSIZE_MAX if max_height_px is None else max_height_px,
+        )
 
-        self._responsive.set("max_height", full_max_height)
+    def _theme_size(self, group: str, name: str, theme_version: Any) -> Any:
+        """
+        Look up a named size, fetching its theme group once per theme version.
+
+        Args:
+            group: Theme group holding the sizes ("maxWidths" or "maxHeights")
+            name: Size name within the group (e.g. "md")
+            theme_version: Version of the provider's current theme
+
+        Returns:
+            Pixel size, or None if the theme does not define it
+        """
+        if theme_version != self._theme_sizes_version:
+            self._theme_sizes_version = theme_version
+            self._theme_sizes.clear()
+        sizes = self._theme_sizes.get(group)
+        if sizes is None:
+            provider = self._provider
+            sizes = provider.get_theme_value(group) if provider else None
+            if not isinstance(sizes, Mapping):
+                sizes = {}
+            self._theme_sizes[group] = sizes
+        return sizes.get(name)
 
     def _update_responsive_props(self) -> None:
         """Update responsive properties and centering behavior."""
         super()._update_responsive_props()
         self._update_centering_properties()
 
-    # Center Properties (with responsive support)
-
-    @Property(object)
-    def inline(self) -> Union[bool, Dict[str, bool]]:
-        """Get the current inline setting (responsive)."""
-        return self._responsive.get("inline", False)
-
-    @inline.setter
-    def inline(self, value: Union[bool, Dict[str, bool]]) -> None:
-        """Set the inline behavior (responsive)."""
-        self._set_inline(value)
-        self._update_responsive_props()
-
-    @Property(object)
-    def fluid(self) -> Union[bool, Dict[str, bool]]:
-        """Get the current fluid setting (responsive)."""
-        return self._responsive.get("fluid", True)
-
-    @fluid.setter
-    def fluid(self, value: Union[bool, Dict[str, bool]]) -> None:
-        """Set the fluid behavior (responsive)."""
-        self._set_fluid(value)
-        self._update_responsive_props()
-
-    @Property(object)
-    def max_width(self) -> Union[int, str, Dict[str, Union[int, str, None]]]:
-        """Get the current max_width constraint (responsive)."""
-        return self._responsive.get("max_width", None)
-
-    @max_width.setter
-    def max_width(
-        self, value: Union[int, str, Dict[str, Union[int, str, None]]]
-    ) -> None:
-        """Set the max_width constraint (responsive)."""
-        self._set_max_width(value)
-        self._update_responsive_props()
-
-    @Property(object)
-    def max_height(self) -> Union[int, str, Dict[str, Union[int, str, None]]]:
-        """Get the current max_height constraint (responsive)."""
-        return self._responsive.get("max_height", None)
-
-    @max_height.setter
-    def max_height(
-        self, value: Union[int, str, Dict[str, Union[int, str, None]]]
-    ) -> None:
-        """Set the max_height constraint (responsive)."""
-        self._set_max_height(value)
-        self._update_responsive_props()
+    # Center Properties (with responsive support). Plain descriptors rather
+    # than Qt Properties: nothing reads them through Qt's meta-object system.
+    inline = _ResponsiveProp(False, _is_bool)  # Don't expand to fill space
+    fluid = _ResponsiveProp(True, _is_bool)  # Expand within the max constraints
+    max_width = _ResponsiveProp(None, _is_size)  # Pixels or theme maxWidths name
+    max_height = _ResponsiveProp(None, _is_size)  # Pixels or theme maxHeights name
 
     def add_child(self, child: QWidget, **layout_props: Any) -> None:
         """Add a child widget to the centered content area."""
         super().add_child(child, **layout_props)
+        if self._content_container is None:
+            self._setup_content_container()
         # Add to content layout which handles centering
-        if self._content_layout:
-            self._content_layout.addWidget(child)
+        self._content_layout.addWidget(child)
+
+    def _setup_content_container(self) -> None:
+        """Create the content container and apply the current constraints."""
+        self._content_container = QWidget()
+        self._content_layout = QVBoxLayout(self._content_container)
+        self._content_layout.setContentsMargins(0, 0, 0, 0)
+        self._content_layout.setSpacing(0)
+        self._content_layout.setAlignment(Qt.AlignCenter)
+
+        # Add content container to the centering grid cell
+        self._main_layout.addWidget(self._content_container, 0, 0, Qt.AlignCenter)
+
+        # Force the constraints onto the new container
+        self._last_resolved = None
+        self._update_centering_properties()
 
     def resizeEvent(self, event) -> None:
         """Handle resize events to update responsive props."""
-        super().resizeEvent(event)
+        # Skip LayoutComponent's synchronous responsive refresh; the timer
+        # runs it once the resize burst is over. The first resize (on show)
+        # is applied immediately so the widget never appears unstyled.
+        super(LayoutComponent, self).resizeEvent(event)
+        # Every responsive value is keyed by breakpoint, so resizes that stay
+        # within the current one have nothing to update
+        breakpoint = self._get_current_breakpoint()
+        if breakpoint == self._last_breakpoint:
+            return
+        self._last_breakpoint = breakpoint
+        if event.oldSize().width() == -1:
+            self._resize_timer.stop()
+            self._update_responsive_props()
+        else:
+            self._resize_timer.start()
+
+    @Slot()
+    def _handle_resize_timeout(self) -> None:
+        """Refresh responsive props after a burst of resize events."""
         self._update_responsive_props()
 
     # Convenience methods
@@ -354,3 +340,37 @@ class Center(LayoutComponent):
         """Convenience method: Remove all width/height constraints."""
         self.max_width = None
         self.max_height = None
+
+
+def _normalize_responsive(
+    value: Any, default: Any, validator: Optional[Callable[[Any], bool]] = None
+) -> Dict[str, Any]:
+    """
+    Expand a scalar or partial breakpoint dict to a value for every breakpoint.
+
+    Breakpoints missing from a dict inherit the value of the nearest smaller
+    breakpoint, starting from default.
+
+    Args:
+        value: A single value or a dict of breakpoint values
+        default: Value used until the dict sets one, and for rejected scalars
+        validator: Optional check a scalar must pass to be used
+
+    Returns:
+        Dict mapping every breakpoint name to its value
+    """
+    if not isinstance(value, dict):
+        if value is None or (validator is not None and not validator(value)):
+            value = default
+        # Built in C rather than by a per-breakpoint comprehension
+        return dict.fromkeys(_BREAKPOINTS, value)
+
+    expanded = dict.fromkeys(_BREAKPOINTS, default)
+    if not value:
+        return expanded
+    current = default
+    for bp in _BREAKPOINTS:
+        if bp in value:
+            current = value[bp]
+        expanded[bp] = current
+    return expanded
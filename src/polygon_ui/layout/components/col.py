@@ -6,19 +6,24 @@ Automatically integrates with Grid parent for layout properties.
 Uses QVBoxLayout internally for child content arrangement.
 """
 
-from typing import Optional, Any, Dict, Union
+from typing import Callable, Optional, Any, Dict, Tuple, Union
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from PySide6.QtCore import Qt, Property, QTimer
+from PySide6.QtCore import Qt, Property, QEvent, QTimer, Slot
 
-from ...core.provider import PolygonProvider
 from ..core.base import LayoutComponent
-from ..core.responsive import ResponsiveProps, BreakpointSystem
+from ..core.responsive import ResponsiveProps
 
 try:
     from .grid import Grid
 except ImportError:
     Grid = None  # Fallback if grid not available yet
 
+# Breakpoint names, smallest first
+_BREAKPOINTS: Tuple[str, ...] = ("base", "sm", "md", "lg", "xl")
+
+# Keys of the layout props Col reports to its Grid, in resolution order
+_LAYOUT_PROP_NAMES: Tuple[str, ...] = ("colspan", "offset", "order")
+
 
 class Col(LayoutComponent):
     """
@@ -29,10 +34,18 @@ class Col(LayoutComponent):
     Internally uses QVBoxLayout for vertical arrangement of child content.
     """
 
+    # No __slots__: LayoutComponent and PolygonComponent keep a __dict__, so
+    # slots here would save nothing, and slotting Col would make any Python
+    # subclass of it segfault on slot assignment (see PolygonComponent).
+
+    # Defaults for ParentChange events delivered before __init__ finishes
+    _grid_parent: Optional[QWidget] = None
+    _cached_max_cols = 12
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
-        span: Union[int, Dict[str, int]] = 12,
+        span: Union[int, Dict[str, int], None] = None,
         offset: Union[int, Dict[str, int]] = 0,
         order: Union[int, Dict[str, int]] = 0,
         visible: Union[bool, Dict[str, bool]] = True,
@@ -45,9 +58,46 @@ class Col(LayoutComponent):
         # Responsive props handler
         self._responsive = ResponsiveProps(self)
 
-        # Set initial responsive properties
-        self._set_span(span)
-        self._set_offset(offset)
+        # Bursts of resize events (e.g. a window drag) are coalesced into one
+        # responsive refresh per frame
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._handle_resize_timeout)
+
+        # Prop setters request a refresh; consecutive requests within one
+        # event-loop turn collapse into a single responsive update
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._do_update_responsive_props)
+
+        # Delayed updateGeometry after a responsive change; restarting it
+        # collapses back-to-back changes into one geometry update
+        self._geom_timer = QTimer(self)
+        self._geom_timer.setSingleShot(True)
+        self._geom_timer.timeout.connect(self.updateGeometry)
+
+        # Parent, layout props and visibility last pushed to Qt and the Grid
+        self._last_resolved: Optional[Tuple[Any, ...]] = None
+        # Resolved (span, offset, order) and the (breakpoint, responsive
+        # version) they were resolved for
+        self._layout_values: Tuple[Any, Any, Any] = (12, 0, 0)
+        self._layout_values_key: Optional[Tuple[str, int]] = None
+
+        # Breakpoint at the last resize; resizes within it change nothing
+        self._last_breakpoint: Optional[str] = None
+
+        # Parent Grid (None outside a Grid) and its column count, refreshed
+        # when the parent changes rather than probed on every update
+        self._refresh_grid_parent()
+
+        # Set initial responsive properties. Span and offset are stored raw
+        # and validated once the Grid parent has been bound below; without a
+        # span the column is full width and its offset is only kept in the row.
+        if span is not None:
+            self._responsive.set("span", span)
+        self._responsive.set("offset", offset)
         self._set_order(order)
         self._set_visible(visible)
         self._set_min_width(min_width)
@@ -56,236 +106,207 @@ class Col(LayoutComponent):
         # Setup internal layout for children
         self._setup_layout()
 
-        # Auto-integrate if parent is Grid
-        self._auto_integrate_parent()
+        # Register with a Grid parent now, but leave the props hand-off and
+        # grid relayout to the first showEvent so populating a Grid with N
+        # Cols does not relayout it N times
+        self._integrated = False
+        if self._grid_parent is not None:
+            self._grid_parent._adopt_child(self)
+
+        # Validate span and offset against the final column count
+        self._set_offset(offset, self._set_span(span))
 
     def _setup_layout(self) -> None:
         """Set up the internal QVBoxLayout for child content."""
+        # Passing self installs the layout; no separate setLayout call
         self._layout = QVBoxLayout(self)
-        self.setLayout(self._layout)
         self._layout.setContentsMargins(0, 0, 0, 0)
         self._layout.setSpacing(0)  # Can be made responsive later
 
     def _get_layout_props(self) -> Dict[str, Any]:
         """Get layout properties for Grid integration (colspan, offset, order, etc.)."""
-
-        def resolve_prop(prop_name, default):
-            val = self._responsive.get(prop_name, default)
-            if isinstance(val, dict):
-                current_bp = BreakpointSystem.get_breakpoint_for_width(self.width())
-                return self._responsive._resolve_value(val)
-            return val
-
-        resolved_span = resolve_prop("span", {"base": 12})
-        resolved_offset = resolve_prop("offset", {"base": 0})
-        resolved_order = resolve_prop("order", {"base": 0})
-
-        return {
-            "colspan": resolved_span,
-            "offset": resolved_offset,
-            "order": resolved_order,
-        }
+        return dict(zip(_LAYOUT_PROP_NAMES, self._resolve_layout_values()))
+
+    def _resolve_layout_values(self) -> Tuple[Any, Any, Any]:
+        """Resolve span, offset and order for the current breakpoint."""
+        # Resize storms within one breakpoint reuse the last resolution until
+        # a responsive prop is set again
+        key = (self._get_current_breakpoint(), self._responsive._version)
+        if key == self._layout_values_key:
+            return self._layout_values
+        # Each prop is a precompiled per-breakpoint tuple, so this is three
+        # tuple indexes rather than three dict walks
+        resolve = self._responsive.resolve_fast
+        values = (resolve("span", 12), resolve("offset", 0), resolve("order", 0))
+        self._layout_values_key = key
+        self._layout_values = values
+        return values
+
+    def _refresh_grid_parent(self) -> None:
+        """Re-detect the parent Grid and its column count."""
+        parent = self.parent()
+        if parent is not None and Grid and isinstance(parent, Grid):
+            self._grid_parent = parent
+            self._cached_max_cols = getattr(parent, "columns", 12)
+        else:
+            self._grid_parent = None
+            self._cached_max_cols = 12
+
+    def invalidate_max_cols(self) -> None:
+        """Re-read the parent Grid's column count and re-clamp span and offset to it."""
+        self._refresh_grid_parent()
+        # Re-normalize the stored per-breakpoint dicts
+        config = self._responsive.get_config
+        spans = self._set_span(config("span"))
+        # Also schedules the responsive update, which notifies the grid
+        self._set_offset(config("offset", 0), spans)
+
+    def changeEvent(self, event) -> None:
+        """Keep the cached Grid parent in sync with reparenting."""
+        super().changeEvent(event)
+        # Layouts reparent children in C++, bypassing setParent
+        if event.type() == QEvent.ParentChange:
+            self._refresh_grid_parent()
 
     def _auto_integrate_parent(self) -> None:
         """Auto-detect and integrate with Grid parent."""
-        parent = self.parent()
-        if parent and Grid and isinstance(parent, Grid):
-            # Ensure in parent's children list
-            if hasattr(parent, "_children") and self not in parent._children:
-                parent._children.append(self)
-            # Set layout props
-            if hasattr(parent, "_child_layout_props"):
-                parent._child_layout_props[self] = self._get_layout_props()
-            # Trigger parent update
-            if hasattr(parent, "_update_grid_layout"):
-                parent._update_grid_layout()
+        self._refresh_grid_parent()
+        parent = self._grid_parent
+        # _grid_parent is only ever a Grid, so its bookkeeping can be used as is
+        if parent is not None:
+            parent._adopt_child(self)
+            parent._child_layout_props[self] = self._get_layout_props()
+            parent._schedule_grid_update()
+
+    def showEvent(self, event) -> None:
+        """Integrate with the Grid parent the first time the Col is shown."""
+        super().showEvent(event)
+        if not self._integrated:
+            self._integrated = True
+            self._auto_integrate_parent()
 
     def setParent(self, parent: Optional[QWidget]) -> None:
         """Override setParent to auto-integrate with new Grid parent."""
         old_parent = self.parent()
         super().setParent(parent)
         # Revalidate properties with new parent context
-        self._set_span(self._responsive.get("span", 1))
-        self._set_offset(self._responsive.get("offset", 0))
-        self._set_order(self._responsive.get("order", 0))
-        if parent != old_parent and parent and Grid and isinstance(parent, Grid):
+        config = self._responsive.get_config
+        spans = self._set_span(config("span"))
+        self._set_offset(config("offset", 0), spans)
+        self._set_order(config("order", 0))
+        if parent != old_parent and self._grid_parent is not None:
             self._auto_integrate_parent()
 
     def _update_responsive_props(self) -> None:
+        """Schedule a responsive update for the next event-loop turn."""
+        self._update_timer.start()
+
+    @Slot()
+    def _do_update_responsive_props(self) -> None:
         """Update responsive properties and notify Grid parent if applicable."""
+        self._update_timer.stop()
         super()._update_responsive_props()
         # Invalidate cache to ensure fresh resolution
         if hasattr(self._responsive, "_invalidate_all_cache"):
             self._responsive._invalidate_all_cache()
         parent = self.parent()
-        if parent and Grid and isinstance(parent, Grid):
-            if hasattr(parent, "_child_layout_props"):
-                parent._child_layout_props[self] = self._get_layout_props()
-            if hasattr(parent, "_update_grid_layout"):
-                parent._update_grid_layout()
+        layout_values = self._resolve_layout_values()
+        resolved_visible = self._responsive.resolve_fast("visible", True)
+
+        # Resize bursts mostly re-resolve the same values; skip the Grid
+        # relayout and Qt calls unless something has changed
+        key = (parent, layout_values, resolved_visible)
+        last_key = self._last_resolved
+        if key == last_key:
+            return
+        self._last_resolved = key
+
+        grid = self._grid_parent
+        # Only a new parent or new layout values need the Grid; a visibility
+        # change alone does not
+        if grid is not None and (last_key is None or last_key[:2] != key[:2]):
+            grid._child_layout_props[self] = dict(
+                zip(_LAYOUT_PROP_NAMES, layout_values)
+            )
+            # Resizing a Grid resizes every Col; coalesce their notifications
+            # into one grid relayout per event-loop turn
+            grid._schedule_grid_update()
         # Update visibility based on responsive props
-        resolved_visible = self._responsive._resolve_value(
-            self._responsive.get("visible", True)
-        )
         self.setVisible(resolved_visible)
         # Smooth transition: slight delay for layout update if needed
-        QTimer.singleShot(
-            50,
-            lambda: self.updateGeometry() if hasattr(self, "updateGeometry") else None,
-        )
-
-    def _set_span(self, value: Union[int, Dict[str, int]]) -> None:
-        """Private method to set span with validation against parent Grid columns and inheritance."""
-        parent = self.parent()
-        if parent and Grid and isinstance(parent, Grid):
-            max_cols = getattr(parent, "columns", 12)
-        else:
-            max_cols = 12
+        self._geom_timer.start(50)
+
+    def _set_span(
+        self, value: Union[int, Dict[str, int], None]
+    ) -> Optional[Dict[str, int]]:
+        """Private method to set span with validation against parent Grid columns and inheritance.
+        Returns the stored per-breakpoint spans so callers can validate offsets without re-reading them.
+        None leaves the span unset (full width) and returns None.
+        """
+        if value is None:
+            return None
+        max_cols = self._cached_max_cols
 
-        def validate_span(v):
+        def validate_span(v, bp):
             if not isinstance(v, int) or v < 1:
                 return 1
             return min(v, max_cols)
 
-        # Normalize to full breakpoint dict with inheritance (mobile-first)
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_span = {}
-        current_span = 12  # Default base span for full width on mobile
-
-        if isinstance(value, int):
-            current_span = validate_span(value)
-            full_span = {bp: current_span for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            # Start with default base if not specified
-            if "base" not in value:
-                current_span = 12
-            else:
-                current_span = validate_span(value.get("base", 12))
-            full_span["base"] = current_span
-
-            # Propagate forward with inheritance for larger breakpoints
-            for bp in breakpoints_order[1:]:  # Skip base
-                if bp in value:
-                    current_span = validate_span(value[bp])
-                full_span[bp] = current_span
-        else:
-            full_span = {bp: 12 for bp in breakpoints_order}
-
-        # Ensure all values are validated
-        for bp in breakpoints_order:
-            full_span[bp] = validate_span(full_span[bp])
-
-        self._responsive.set("span", full_span)
-
-    def _validate_offset_config(
-        self, value: Union[int, Dict[str, int]]
-    ) -> Union[int, Dict[str, int]]:
-        """Validate and clamp offset config against current span and max columns."""
-        parent = self.parent()
-        max_cols = 12
-        if parent and Grid and isinstance(parent, Grid):
-            max_cols = getattr(parent, "columns", 12)
-        span_config = self._responsive.get("span", 1)
-
-        def validate_for_key(v: int, key: str) -> int:
-            if not isinstance(v, int) or v < 0:
-                return 0
-            span_v = (
-                span_config if isinstance(span_config, int) else span_config.get(key, 1)
-            )
-            max_possible = max_cols - span_v
-            return min(v, max_possible)
-
-        if isinstance(value, int):
-            return validate_for_key(value, "base")
-        elif isinstance(value, dict):
-            return {
-                k: validate_for_key(vv, k)
-                for k, vv in value.items()
-                if isinstance(vv, (int, float))
-            }
-        return 0
+        # Default base span is full width on mobile
+        spans = _normalize_responsive(value, 12, validate_span)
+        self._responsive.set("span", spans)
+        return spans
 
-    def _set_offset(self, value: Union[int, Dict[str, int]]) -> None:
+    def _set_offset(
+        self,
+        value: Union[int, Dict[str, int]],
+        span_config: Union[int, Dict[str, int], None] = None,
+    ) -> None:
         """Private method to set offset with validation against parent Grid columns and current span.
-        Normalizes to full breakpoint dict with mobile-first inheritance."""
-        parent = self.parent()
-        max_cols = 12
-        if parent and Grid and isinstance(parent, Grid):
-            max_cols = getattr(parent, "columns", 12)
+        Normalizes to full breakpoint dict with mobile-first inheritance.
+        span_config may be passed by callers that already hold the span."""
+        max_cols = self._cached_max_cols
 
         # Get current span config for validation
-        span_config = self._responsive.get(
-            "span", {bp: 12 for bp in ["base", "sm", "md", "lg", "xl"]}
-        )
-
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_offset = {}
-        current_offset = 0  # Default base offset
-
-        if isinstance(value, int):
-            current_offset = value
-            full_offset = {bp: current_offset for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            # Base
-            if "base" not in value:
-                current_offset = 0
-            else:
-                current_offset = value.get("base", 0)
-            full_offset["base"] = current_offset
-
-            # Inherit forward for larger breakpoints
-            for bp in breakpoints_order[1:]:
-                if bp in value:
-                    current_offset = value[bp]
-                full_offset[bp] = current_offset
-        else:
-            full_offset = {bp: 0 for bp in breakpoints_order}
+        if span_config is None:
+            span_config = self._responsive.get_config("span")
 
         # Validate each breakpoint's offset against corresponding span
-        def validate_offset_for_bp(bp: str, off: int) -> int:
+        def validate_offset_for_bp(off: int, bp: str) -> int:
             if not isinstance(off, int) or off < 0:
                 return 0
-            span_bp = (
-                span_config.get(bp, 12)
-                if isinstance(span_config, dict)
-                else span_config
-            )
-            max_off = max_cols - span_bp
-            return min(off, max_off)
-
-        validated_full = {
-            bp: validate_offset_for_bp(bp, off) for bp, off in full_offset.items()
-        }
+            return min(off, max_cols - _span_at(span_config, bp))
+
+        # Offsets only vary per breakpoint when the span does
+        validated_full = _normalize_responsive(
+            value,
+            0,
+            validate_offset_for_bp,
+            per_breakpoint=isinstance(span_config, dict),
+        )
 
         self._responsive.set("offset", validated_full)
         self._update_responsive_props()
 
-    def _revalidate_offset(self) -> None:
+    def _revalidate_offset(
+        self, span_config: Union[int, Dict[str, int], None] = None
+    ) -> None:
         """Revalidate current offset config after span or parent changes."""
-        parent = self.parent()
-        max_cols = 12
-        if parent and Grid and isinstance(parent, Grid):
-            max_cols = getattr(parent, "columns", 12)
+        max_cols = self._cached_max_cols
 
-        span_config = self._responsive.get("span", 12)
-        current_offset = self._responsive.get("offset", 0)
+        if span_config is None:
+            span_config = self._responsive.get_config("span")
+        current_offset = self._responsive.get_config("offset", 0)
 
         # Ensure current_offset is dict
         if isinstance(current_offset, int):
-            current_offset = {
-                bp: current_offset for bp in ["base", "sm", "md", "lg", "xl"]
-            }
+            current_offset = dict.fromkeys(_BREAKPOINTS, current_offset)
 
         # Validate each
         def validate(bp, off):
             if not isinstance(off, int) or off < 0:
                 return 0
-            span_bp = (
-                span_config if isinstance(span_config, int) else span_config.get(bp, 12)
-            )
-            max_off = max_cols - span_bp
-            return min(off, max_off)
+            return min(off, max_cols - _span_at(span_config, bp))
 
         validated = {bp: validate(bp, off) for bp, off in current_offset.items()}
         self._responsive.set("offset", validated)
@@ -318,82 +339,39 @@ class Col(LayoutComponent):
 
     def _set_visible(self, value: Union[bool, Dict[str, bool]]) -> None:
         """Private method to set visibility with responsive support."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_visible = {}
-
-        if isinstance(value, bool):
-            full_visible = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = True
-            full_visible["base"] = value.get("base", True)
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_visible[bp] = current
-        else:
-            full_visible = {bp: True for bp in breakpoints_order}
-
-        self._responsive.set("visible", full_visible)
+        self._responsive.set(
+            "visible", _normalize_responsive(value, True, _validate_visible)
+        )
 
     def _set_min_width(self, value: Union[int, Dict[str, int]]) -> None:
         """Private method to set min_width with responsive support (pixels)."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_min_width = {}
-
-        if isinstance(value, int):
-            full_min_width = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = 0
-            full_min_width["base"] = value.get("base", 0)
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_min_width[bp] = current
-        else:
-            full_min_width = {bp: 0 for bp in breakpoints_order}
-
-        # Ensure non-negative
-        for bp in breakpoints_order:
-            full_min_width[bp] = max(0, full_min_width[bp])
-
-        self._responsive.set("min_width", full_min_width)
+        self._responsive.set(
+            "min_width", _normalize_responsive(value, 0, _validate_min_width)
+        )
 
     def _set_max_width(self, value: Union[int, Dict[str, Optional[int]]]) -> None:
         """Private method to set max_width with responsive support (pixels, None means no max)."""
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        full_max_width = {}
-
-        if value is None:
-            full_max_width = {bp: None for bp in breakpoints_order}
-        elif isinstance(value, int):
-            full_max_width = {bp: value for bp in breakpoints_order}
-        elif isinstance(value, dict):
-            current = None
-            full_max_width["base"] = value.get("base")
-            for bp in breakpoints_order[1:]:
-                current = value.get(bp, current)
-                full_max_width[bp] = current
-        else:
-            full_max_width = {bp: None for bp in breakpoints_order}
-
-        self._responsive.set("max_width", full_max_width)
+        self._responsive.set(
+            "max_width", _normalize_responsive(value, None, _validate_max_width)
+        )
 
     # Col Properties (integrated with responsive system)
 
     @Property(object)
     def span(self) -> Union[int, Dict[str, int]]:
         """Get the current column span (responsive)."""
-        return self._responsive.get("span", 1)
+        return self._responsive.get_config("span", 12)
 
     @span.setter
     def span(self, value: Union[int, Dict[str, int]]) -> None:
         """Set the column span (responsive)."""
-        self._set_span(value)
-        self._revalidate_offset()
+        self._revalidate_offset(self._set_span(value))
         self._update_responsive_props()
 
     @Property(object)
     def offset(self) -> Union[int, Dict[str, int]]:
         """Get the current column offset (responsive)."""
-        return self._responsive.get("offset", 0)
+        return self._responsive.get_config("offset", 0)
 
     @offset.setter
     def offset(self, value: Union[int, Dict[str, int]]) -> None:
@@ -404,7 +382,7 @@ class Col(LayoutComponent):
     @Property(object)
     def order(self) -> Union[int, Dict[str, int]]:
         """Get the current visual order (responsive). Order 0 means fallback to DOM order."""
-        return self._responsive.get("order", 0)
+        return self._responsive.get_config("order", 0)
 
     @order.setter
     def order(self, value: Union[int, Dict[str, int]]) -> None:
@@ -415,7 +393,7 @@ class Col(LayoutComponent):
     @Property(bool)
     def visible(self) -> bool:
         """Get the current visibility state (resolved for current breakpoint)."""
-        return self._responsive._resolve_value(self._responsive.get("visible", True))
+        return self._responsive.resolve_fast("visible", True)
 
     @visible.setter
     def visible(self, value: Union[bool, Dict[str, bool]]) -> None:
@@ -426,7 +404,7 @@ class Col(LayoutComponent):
     @Property(object)
     def min_width(self) -> Union[int, Dict[str, int]]:
         """Get the current min_width constraint (responsive, in pixels)."""
-        return self._responsive.get("min_width", 0)
+        return self._responsive.get_config("min_width", 0)
 
     @min_width.setter
     def min_width(self, value: Union[int, Dict[str, int]]) -> None:
@@ -437,7 +415,7 @@ class Col(LayoutComponent):
     @Property(object)
     def max_width(self) -> Union[int, Dict[str, Optional[int]]]:
         """Get the current max_width constraint (responsive, in pixels; None means no max)."""
-        return self._responsive.get("max_width", None)
+        return self._responsive.get_config("max_width", None)
 
     @max_width.setter
     def max_width(self, value: Union[int, Dict[str, Optional[int]]]) -> None:
@@ -447,8 +425,26 @@ class Col(LayoutComponent):
 
     def resizeEvent(self, event) -> None:
         """Handle resize events to update responsive props with smoothing."""
-        super().resizeEvent(event)
-        self._update_responsive_props()
+        # Skip LayoutComponent's synchronous responsive refresh; the timer
+        # runs it once the resize burst is over. The first resize (on show)
+        # is applied immediately so the widget never appears unstyled.
+        super(LayoutComponent, self).resizeEvent(event)
+        # Every responsive value is keyed by breakpoint, so resizes that stay
+        # within the current one have nothing to update
+        breakpoint = self._get_current_breakpoint()
+        if breakpoint == self._last_breakpoint:
+            return
+        self._last_breakpoint = breakpoint
+        if event.oldSize().width() == -1:
+            self._resize_timer.stop()
+            self._do_update_responsive_props()
+        else:
+            self._resize_timer.start()
+
+    @Slot()
+    def _handle_resize_timeout(self) -> None:
+        """Refresh responsive props after a burst of resize events."""
+        self._do_update_responsive_props()
 
     def add_child(self, child: QWidget, **layout_props: Any) -> None:
         """Add a child widget to the Col's internal layout."""
@@ -476,41 +472,33 @@ class Col(LayoutComponent):
 
     def offset_center(self) -> None:
         """Convenience method: Center the column responsively based on span and grid columns."""
-        parent = self.parent()
-        max_cols = 12
-        if parent and Grid and isinstance(parent, Grid):
-            max_cols = getattr(parent, "columns", 12)
+        max_cols = self._cached_max_cols
 
-        span_config = self._responsive.get("span", 12)
+        span_config = self._responsive.get_config("span", 12)
         if isinstance(span_config, int):
-            span_config = {bp: span_config for bp in ["base", "sm", "md", "lg", "xl"]}
+            span_config = dict.fromkeys(_BREAKPOINTS, span_config)
 
         offset_config = {}
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        for bp in breakpoints_order:
+        for bp in _BREAKPOINTS:
             span_bp = span_config.get(bp, 12)
             offset_config[bp] = (max_cols - span_bp) // 2
 
-        self.offset = offset_config
+        self._set_offset(offset_config, span_config)
 
     def offset_right(self) -> None:
         """Convenience method: Move column to the right edge responsively."""
-        parent = self.parent()
-        max_cols = 12
-        if parent and Grid and isinstance(parent, Grid):
-            max_cols = getattr(parent, "columns", 12)
+        max_cols = self._cached_max_cols
 
-        span_config = self._responsive.get("span", 12)
+        span_config = self._responsive.get_config("span", 12)
         if isinstance(span_config, int):
-            span_config = {bp: span_config for bp in ["base", "sm", "md", "lg", "xl"]}
+            span_config = dict.fromkeys(_BREAKPOINTS, span_config)
 
         offset_config = {}
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        for bp in breakpoints_order:
+        for bp in _BREAKPOINTS:
             span_bp = span_config.get(bp, 12)
             offset_config[bp] = max(0, max_cols - span_bp)
 
-        self.offset = offset_config
+        self._set_offset(offset_config, span_config)
 
     def offset_left(self) -> None:
         """Convenience method: Reset offset to 0 (left alignment) responsively."""
@@ -518,22 +506,85 @@ class Col(LayoutComponent):
 
     def offset_auto(self) -> None:
         """Convenience method: Dynamic offset based on span (center if not full width)."""
-        parent = self.parent()
-        max_cols = 12
-        if parent and Grid and isinstance(parent, Grid):
-            max_cols = getattr(parent, "columns", 12)
+        max_cols = self._cached_max_cols
 
-        span_config = self._responsive.get("span", 12)
+        span_config = self._responsive.get_config("span", 12)
         if isinstance(span_config, int):
-            span_config = {bp: span_config for bp in ["base", "sm", "md", "lg", "xl"]}
+            span_config = dict.fromkeys(_BREAKPOINTS, span_config)
 
         offset_config = {}
-        breakpoints_order = ["base", "sm", "md", "lg", "xl"]
-        for bp in breakpoints_order:
+        for bp in _BREAKPOINTS:
             span_bp = span_config.get(bp, 12)
             if span_bp >= max_cols:
                 offset_config[bp] = 0
             else:
                 offset_config[bp] = (max_cols - span_bp) // 2  # Center as auto
 
-        self.offset = offset_config
+        self._set_offset(offset_config, span_config)
+
+
+def _normalize_responsive(
+    value: Any,
+    base_default: Any,
+    validator: Callable[[Any, str], Any],
+    per_breakpoint: bool = False,
+) -> Dict[str, Any]:
+    """
+    Expand a scalar or partial breakpoint dict to a validated value per breakpoint.
+
+    Breakpoints missing from a dict inherit the value of the nearest smaller
+    breakpoint (mobile-first); a missing base uses base_default. Values that
+    are neither a dict nor an int/bool fall back to base_default everywhere.
+
+    Args:
+        value: A single value or a dict of breakpoint values
+        base_default: Base value when none is given
+        validator: Called with (value, breakpoint) and returns the value to store
+        per_breakpoint: Whether the validator's result depends on the breakpoint;
+            when True inherited values are re-validated at every breakpoint,
+            when False a value is validated once and its result inherited
+
+    Returns:
+        Dict mapping every breakpoint name to its validated value
+    """
+    if isinstance(value, dict):
+        raw = value.get("base", base_default)
+        current = validator(raw, "base")
+        out = {"base": current}
+        for bp in _BREAKPOINTS[1:]:
+            if bp in value:
+                raw = value[bp]
+                current = validator(raw, bp)
+            elif per_breakpoint:
+                current = validator(raw, bp)
+            out[bp] = current
+        return out
+    if not isinstance(value, (int, bool)):
+        value = base_default
+    if per_breakpoint:
+        return {bp: validator(value, bp) for bp in _BREAKPOINTS}
+    return dict.fromkeys(_BREAKPOINTS, validator(value, "base"))
+
+
+def _validate_visible(value: Any, bp: str) -> bool:
+    """Coerce a visibility value to a bool."""
+    return bool(value)
+
+
+def _validate_min_width(value: Any, bp: str) -> int:
+    """Clamp a minimum width to a non-negative pixel int."""
+    return max(0, value) if isinstance(value, int) else 0
+
+
+def _validate_max_width(value: Any, bp: str) -> Optional[int]:
+    """Keep pixel ints; anything else means no maximum."""
+    return value if isinstance(value, int) else None
+
+
+def _span_at(span_config: Union[int, Dict[str, int], None], bp: str) -> int:
+    """Span an offset must leave room for at a breakpoint; an unset span needs one column."""
+    if span_config is None:
+        return 1
+    if isinstance(span_config, dict):
+        return span_config.get(bp, 12)
+    return span_config
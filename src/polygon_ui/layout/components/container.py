@@ -5,7 +5,8 @@ A responsive container component that centers content with configurable max-widt
 and padding, similar to Mantine's Container component.
 """
 
-from typing import Optional, Union, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Union, ClassVar, Dict, Any, Mapping, Tuple
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 from PySide6.QtCore import Qt, Property
 
@@ -20,6 +21,17 @@ class Container(LayoutComponent):
     and padding. Supports fluid behavior and theme-integrated spacing.
     """
 
+    # Size breakpoints (Mantine-inspired)
+    _SIZE_MAP: ClassVar[Mapping[str, int]] = MappingProxyType(
+        {
+            "xs": 540,
+            "sm": 720,
+            "md": 960,
+            "lg": 1140,
+            "xl": 1600,
+        }
+    )
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -44,14 +56,15 @@ class Container(LayoutComponent):
         self._responsive.set("px", px)
         self._responsive.set("py", py)
 
-        # Size breakpoints (Mantine-inspired)
-        self._size_map = {
-            "xs": 540,
-            "sm": 720,
-            "md": 960,
-            "lg": 1140,
-            "xl": 1600,
-        }
+        # (px, py, max_width, center) last pushed to Qt
+        self._applied_state: Optional[Tuple[int, int, int, bool]] = None
+
+        # Theme spacing lookups, valid for one provider theme version
+        self._spacing_cache: Dict[str, int] = {}
+        self._spacing_cache_version: Any = -1
+
+        # Breakpoint the responsive props were last resolved for
+        self._last_breakpoint: Optional[str] = None
 
         # Set up vertical layout for stacking children
         self._setup_layout()
@@ -68,12 +81,22 @@ class Container(LayoutComponent):
 
     def _get_spacing_pixels(self, spacing_value: Union[str, int]) -> int:
         """Convert spacing value to pixels using theme or fallback."""
-        if self._provider:
-            if isinstance(spacing_value, str):
-                return self._provider.get_theme_value(f"spacing.{spacing_value}", 16)
+        provider = self._provider
+        if not isinstance(spacing_value, str):
+            return int(spacing_value) if provider else spacing_value
+
+        version = (id(provider), provider.theme_version) if provider else None
+        if version != self._spacing_cache_version:
+            self._spacing_cache_version = version
+            self._spacing_cache.clear()
+        pixels = self._spacing_cache.get(spacing_value)
+        if pixels is None:
+            if provider:
+                pixels = provider.get_theme_value(f"spacing.{spacing_value}", 16)
             else:
-                return int(spacing_value)
-        return 16 if isinstance(spacing_value, str) else spacing_value
+                pixels = 16
+            self._spacing_cache[spacing_value] = pixels
+        return pixels
 
     def _update_container_styling(self) -> None:
         """Update container styling based on current properties."""
@@ -83,20 +106,24 @@ class Container(LayoutComponent):
         px_val = self._responsive.get("px", "md")
         py_val = self._responsive.get("py", "md")
 
-        # Update padding
         px_pixels = self._get_spacing_pixels(px_val)
         py_pixels = self._get_spacing_pixels(py_val)
+        # QWidget max size when fluid
+        max_width = 16777215 if fluid_val else self._SIZE_MAP.get(size_val, 960)
+
+        # Each Qt setter below invalidates geometry; skip them all when nothing changed
+        state = (px_pixels, py_pixels, max_width, self._center)
+        if state == self._applied_state:
+            return
+        self._applied_state = state
+
+        # Update padding
         if self._layout:
             self._layout.setContentsMargins(px_pixels, py_pixels, px_pixels, py_pixels)
 
         # Update sizing
-        if fluid_val:
-            self.setMaximumWidth(16777215)  # QWidget max size
-            self.setMaximumHeight(16777215)
-        else:
-            max_width = self._size_map.get(size_val, 960)
-            self.setMaximumWidth(max_width)
-            self.setMaximumHeight(16777215)  # No height limit
+        self.setMaximumWidth(max_width)
+        self.setMaximumHeight(16777215)  # No height limit
 
         # Update alignment if center toggled
         if self._layout:
@@ -174,7 +201,14 @@ class Container(LayoutComponent):
 
     def resizeEvent(self, event) -> None:
         """Handle resize events with responsive updates."""
-        super().resizeEvent(event)
+        # Skip LayoutComponent's unconditional refresh; every responsive value
+        # is keyed by breakpoint, so resizes within the current one change nothing
+        super(LayoutComponent, self).resizeEvent(event)
+        breakpoint = self._get_current_breakpoint()
+        if breakpoint == self._last_breakpoint:
+            return
+        self._last_breakpoint = breakpoint
+        self._update_responsive_props()
         # Invalidate responsive cache and update styling
         self._responsive._invalidate_all_cache()
         self._update_container_styling()
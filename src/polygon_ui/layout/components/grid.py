@@ -8,7 +8,7 @@ Children are placed sequentially in row-major order across the grid columns.
 
 from typing import Optional, Any, Dict, Union
 from PySide6.QtWidgets import QWidget, QGridLayout
-from PySide6.QtCore import Qt, Property
+from PySide6.QtCore import Qt, Property, QTimer, Slot
 
 from ...core.provider import PolygonProvider
 from ..core.base import LayoutComponent
@@ -56,6 +56,11 @@ class Grid(LayoutComponent):
         self._responsive.set("row_gap", row_gap)
 
         self._child_layout_props = {}
+        # Mirrors _children for O(1) membership checks when Cols register
+        self._children_set = set()
+
+        # Set while a coalesced _update_grid_layout is queued for Col children
+        self._grid_dirty = False
 
         # Setup grid layout
         self._setup_layout()
@@ -138,6 +143,21 @@ class Grid(LayoutComponent):
         default_alignment = h_align | v_align
         self._place_children(default_alignment)
 
+    def _schedule_grid_update(self) -> None:
+        """Schedule _update_grid_layout for the next event-loop turn, at most once."""
+        if self._grid_dirty:
+            return
+        self._grid_dirty = True
+        QTimer.singleShot(0, self._flush_grid_update)
+
+    @Slot()
+    def _flush_grid_update(self) -> None:
+        """Run a pending grid layout update."""
+        if not self._grid_dirty:
+            return
+        self._grid_dirty = False
+        self._update_grid_layout()
+
     def _update_responsive_props(self) -> None:
         """Update all responsive properties based on current breakpoint."""
         super()._update_responsive_props()
@@ -150,9 +170,26 @@ class Grid(LayoutComponent):
         Children are placed sequentially in row-major order with reflow on updates.
         """
         super().add_child(child, **layout_props)
+        self._children_set.add(child)
         self._child_layout_props[child] = layout_props
         self._update_grid_layout()
 
+    def remove_child(self, child: QWidget) -> None:
+        """Remove a child widget from the grid container."""
+        super().remove_child(child)
+        self._children_set.discard(child)
+
+    def _adopt_child(self, child: QWidget) -> None:
+        """
+        Track a child that parented itself to this grid (e.g. a Col).
+
+        Args:
+            child: The widget to append to the grid's children, if not yet present
+        """
+        if child not in self._children_set:
+            self._children_set.add(child)
+            self._children.append(child)
+
     # Grid Properties (integrated with responsive system)
 
     @Property(object)
@@ -164,6 +201,11 @@ class Grid(LayoutComponent):
     def columns(self, value: Union[int, Dict[str, int]]) -> None:
         """Set the number of columns (responsive)."""
         self._responsive.set("columns", value)
+        # Cols cache the column count for span/offset validation
+        for child in self._children:
+            invalidate = getattr(child, "invalidate_max_cols", None)
+            if invalidate is not None:
+                invalidate()
         self._update_grid_layout()
 
     @Property(object)
@@ -2,7 +2,8 @@
 Base classes for layout components in Polygon UI.
 """
 
-from typing import Dict, Any, Optional, Union, List
+from bisect import bisect_right
+from typing import ClassVar, Dict, Any, Optional, Tuple, Union, List
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLayout, QGridLayout
 from PySide6.QtCore import Qt, QMargins, Signal, Property
 
@@ -18,6 +19,19 @@ class LayoutComponent(PolygonComponent):
     and enhanced styling capabilities for layout components.
     """
 
+    # Breakpoint names and their minimum widths, smallest first
+    _BREAKPOINT_NAMES: ClassVar[Tuple[str, ...]] = ("base", "sm", "md", "lg", "xl")
+    _BREAKPOINT_MIN_WIDTHS: ClassVar[Tuple[int, ...]] = (0, 576, 768, 992, 1200)
+
+    # Breakpoints to try for each active breakpoint, nearest first
+    _BREAKPOINT_FALLBACKS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "base": ("base",),
+        "sm": ("sm", "base"),
+        "md": ("md", "sm", "base"),
+        "lg": ("lg", "md", "sm", "base"),
+        "xl": ("xl", "lg", "md", "sm", "base"),
+    }
+
     def __init__(self, parent: Optional[QWidget] = None, **kwargs):
         super().__init__(parent, **kwargs)
 
@@ -26,6 +40,10 @@ class LayoutComponent(PolygonComponent):
         self._layout: Optional[QLayout] = None
         self._responsive_props: Dict[str, Any] = {}
 
+        # Width the current breakpoint was last computed for
+        self._breakpoint_width = -1
+        self._breakpoint = "base"
+
         # Common layout props
         self._gap = kwargs.get("gap", "md")
         self._justify = kwargs.get("justify", "start")
@@ -39,6 +57,14 @@ class LayoutComponent(PolygonComponent):
         # Override in subclasses
         pass
 
+    def _collect_extra_props(self, out: Dict[str, Any]) -> None:
+        """Add layout and responsive props to the styling props."""
+        out["gap"] = self._gap
+        out["justify"] = self._justify
+        out["align"] = self._align
+        out["direction"] = getattr(self, "_direction", "column")
+        out["responsive"] = self._responsive_props
+
     def add_child(self, child: QWidget, **layout_props: Any) -> None:
         """
         Add a child widget to this layout component.
@@ -130,19 +156,14 @@ class LayoutComponent(PolygonComponent):
         value = self._responsive_props[prop_name]
 
         if isinstance(value, dict):
-            # Get value for current breakpoint
-            current_breakpoint = self._get_current_breakpoint()
-
-            # Find the best matching breakpoint value
-            for bp in ["xl", "lg", "md", "sm", "base"]:
-                if bp in value and (
-                    bp == current_breakpoint
-                    or self._breakpoint_ge(bp, current_breakpoint)
-                ):
+            # Use the value for the current breakpoint, else the nearest
+            # smaller one that is set
+            for bp in self._BREAKPOINT_FALLBACKS[self._get_current_breakpoint()]:
+                if bp in value:
                     return value[bp]
 
             # Fallback to first available value
-            return next(iter(value.values()))
+            return next(iter(value.values()), default)
 
         return value
 
@@ -153,32 +174,13 @@ class LayoutComponent(PolygonComponent):
         Returns:
             Current breakpoint: "base", "sm", "md", "lg", or "xl"
         """
-        # Define breakpoints
-        breakpoints = {"base": 0, "sm": 576, "md": 768, "lg": 992, "xl": 1200}
-
         width = self.width()
-
-        # Find the largest breakpoint that fits
-        current_bp = "base"
-        for bp_name, bp_width in breakpoints.items():
-            if width >= bp_width:
-                current_bp = bp_name
-
-        return current_bp
-
-    def _breakpoint_ge(self, bp1: str, bp2: str) -> bool:
-        """
-        Check if breakpoint 1 is greater than or equal to breakpoint 2.
-
-        Args:
-            bp1: First breakpoint
-            bp2: Second breakpoint
-
-        Returns:
-            True if bp1 >= bp2
-        """
-        bp_order = ["base", "sm", "md", "lg", "xl"]
-        return bp_order.index(bp1) >= bp_order.index(bp2)
+        if width != self._breakpoint_width:
+            # Largest breakpoint whose minimum width fits
+            index = bisect_right(self._BREAKPOINT_MIN_WIDTHS, width) - 1
+            self._breakpoint = self._BREAKPOINT_NAMES[max(index, 0)]
+            self._breakpoint_width = width
+        return self._breakpoint
 
     def _update_responsive_props(self) -> None:
         """Update all responsive properties based on current breakpoint."""
@@ -299,6 +301,12 @@ class GridComponent(LayoutComponent):
         self._columns = kwargs.get("columns", 12)
         self._gutter = kwargs.get("gutter", "md")
 
+    def _collect_extra_props(self, out: Dict[str, Any]) -> None:
+        """Add grid props on top of the layout props."""
+        super()._collect_extra_props(out)
+        out["columns"] = self._columns
+        out["gutter"] = self._gutter
+
     @Property(int)
     def columns(self) -> int:
         """Get the number of grid columns."""
@@ -5,9 +5,10 @@ Provides breakpoint management, responsive props handling, and
 window resize monitoring for adaptive layouts.
 """
 
-from typing import Dict, Any, Optional, Union, Callable
+from bisect import bisect_right
+from typing import Dict, Any, Optional, Tuple, Union, Callable
 from enum import Enum
-from PySide6.QtCore import QObject, Signal, QTimer, QEvent
+from PySide6.QtCore import QObject, Signal, Slot, QTimer, QEvent
 from PySide6.QtWidgets import QWidget
 
 
@@ -47,12 +48,7 @@ class BreakpointSystem:
         Returns:
             The largest breakpoint that fits the width
         """
-        current_bp = Breakpoint.BASE
-        for bp in [Breakpoint.SM, Breakpoint.MD, Breakpoint.LG, Breakpoint.XL]:
-            if width >= cls.BREAKPOINTS[bp]:
-                current_bp = bp
-
-        return current_bp
+        return _BP_ORDER[bisect_right(_BP_THRESHOLDS, width)]
 
     @classmethod
     def get_min_width(cls, breakpoint: Breakpoint) -> int:
@@ -110,6 +106,17 @@ class BreakpointSystem:
         return bp_order.index(bp1) <= bp_order.index(bp2)
 
 
+# Breakpoints in order, and the minimum widths of all but the first, for
+# mapping a width to a breakpoint index with bisect. BREAKPOINTS lists
+# ascending widths in Breakpoint order, so the thresholds are sorted.
+_BP_ORDER: Tuple[Breakpoint, ...] = tuple(Breakpoint)
+_BP_THRESHOLDS: Tuple[int, ...] = tuple(
+    BreakpointSystem.BREAKPOINTS[bp] for bp in _BP_ORDER[1:]
+)
+
+_MISSING = object()
+
+
 class ResponsiveProps:
     """
     Handles responsive property values that can vary by breakpoint.
@@ -120,6 +127,12 @@ class ResponsiveProps:
         self._props: Dict[str, Union[Any, Dict[str, Any]]] = {}
         self._cached_values: Dict[str, Any] = {}
         self._current_breakpoint: Optional[Breakpoint] = None
+        # Per-prop value for each breakpoint index, used by resolve_fast
+        self._tables: Dict[str, Tuple[Any, ...]] = {}
+        self._bp_width = -1
+        self._bp_index = 0
+        # Bumped on every set, so callers can key caches on it
+        self._version = 0
 
     def set(self, prop_name: str, value: Union[Any, Dict[str, Any]]) -> None:
         """
@@ -132,6 +145,63 @@ class ResponsiveProps:
         """
         self._props[prop_name] = value
         self._invalidate_cache(prop_name)
+        self._tables.pop(prop_name, None)
+        self._version += 1
+
+    def bulk_set(self, props: Dict[str, Union[Any, Dict[str, Any]]]) -> None:
+        """
+        Set several responsive properties in one pass.
+
+        Args:
+            props: Mapping of property name to single or per-breakpoint value
+        """
+        self._props.update(props)
+        self._version += 1
+        if self._cached_values:
+            for prop_name in props:
+                self._cached_values.pop(prop_name, None)
+        if self._tables:
+            for prop_name in props:
+                self._tables.pop(prop_name, None)
+
+    def get_config(self, prop_name: str, default: Any = None) -> Any:
+        """
+        Get a property's stored value as set, without resolving breakpoints.
+
+        Args:
+            prop_name: Name of the property
+            default: Default value if property is not set
+
+        Returns:
+            The single value or per-breakpoint dict passed to set(), or default
+        """
+        return self._props.get(prop_name, default)
+
+    def resolve_fast(self, prop_name: str, default: Any = None) -> Any:
+        """
+        Resolve a property for the widget's current width via a lookup table.
+
+        The property is compiled once into one value per breakpoint, so each
+        call is a bisect on the width (skipped while it is unchanged) and a
+        tuple index.
+
+        Args:
+            prop_name: Name of the property
+            default: Default value if property is not set
+
+        Returns:
+            The value for the current breakpoint or default
+        """
+        table = self._tables.get(prop_name)
+        if table is None:
+            if prop_name not in self._props:
+                return default
+            table = self._tables[prop_name] = _compile_table(self._props[prop_name])
+        width = self._widget.width()
+        if width != self._bp_width:
+            self._bp_width = width
+            self._bp_index = bisect_right(_BP_THRESHOLDS, width)
+        return table[self._bp_index]
 
     def get(self, prop_name: str, default: Any = None) -> Any:
         """
@@ -223,6 +293,33 @@ class ResponsiveProps:
         self._cached_values.clear()
 
 
+def _compile_table(value: Union[Any, Dict[Any, Any]]) -> Tuple[Any, ...]:
+    """
+    Expand a responsive value to one value per breakpoint, smallest first.
+
+    Dict keys may be Breakpoint members or their names. A breakpoint without
+    a value uses the nearest smaller one, or the smallest set value if there
+    is none, matching _resolve_value.
+
+    Args:
+        value: Either a single value or dict of breakpoint values
+
+    Returns:
+        Tuple with the value for each breakpoint in _BP_ORDER
+    """
+    if not isinstance(value, dict):
+        return (value,) * len(_BP_ORDER)
+
+    found = [value.get(bp, value.get(bp.value, _MISSING)) for bp in _BP_ORDER]
+    current = next((v for v in found if v is not _MISSING), None)
+    table = []
+    for v in found:
+        if v is not _MISSING:
+            current = v
+        table.append(current)
+    return tuple(table)
+
+
 class ResponsiveMixin(QObject):
     """
     Mixin class that adds responsive functionality to Qt widgets.
@@ -339,6 +436,7 @@ class ResponsiveMixin(QObject):
         # Debounce resize events to avoid excessive recalculations
         self._resize_timer.start(100)  # 100ms debounce
 
+    @Slot()
     def _handle_resize_timeout(self) -> None:
         """Handle debounced resize timeout."""
         self._check_breakpoint_change()
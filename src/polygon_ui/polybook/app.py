@@ -12,6 +12,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QSplitter,
     QListWidget,
+    QListWidgetItem,
     QStackedWidget,
     QLabel,
     QTextEdit,
@@ -24,7 +25,7 @@ from PySide6.QtWidgets import (
     QCheckBox,
     QSpinBox,
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtGui import QFont
 
 from ..core.provider import PolygonProvider
@@ -352,8 +353,8 @@ class PolyBookMainWindow(QMainWindow):
         # Create theme
         theme = Theme(color_scheme=ColorScheme.LIGHT)
 
-        # Create and initialize PolygonProvider
-        self.polygon_provider = PolygonProvider(theme)
+        # Create (or reuse) the singleton PolygonProvider
+        self.polygon_provider = PolygonProvider.initialize(theme)
 
         # NOTE: Theme styling now applied in __init__ after UI creation
 
@@ -404,6 +405,7 @@ class PolyBookMainWindow(QMainWindow):
         for component_name in sorted(components):
             self.component_list.addItem(component_name)
 
+    @Slot(str)
     def on_search_components(self, text: str):
         """Handle component search."""
         if not text:
@@ -416,6 +418,7 @@ class PolyBookMainWindow(QMainWindow):
         for component_info in results:
             self.component_list.addItem(component_info.name)
 
+    @Slot(QListWidgetItem)
     def on_component_selected(self, item):
         """Handle component selection."""
         component_name = item.text()
@@ -452,6 +455,7 @@ class PolyBookMainWindow(QMainWindow):
         for story in stories:
             self.story_combo.addItem(story.name)
 
+    @Slot(str)
     def on_story_changed(self, story_name: str):
         """Handle story selection change."""
         if self.current_component and story_name:
@@ -653,6 +657,7 @@ layout.addWidget({component_name.lower()}_widget)
             lines.append(f"    {key}={repr(value)},")
         return "\n".join(lines)
 
+    @Slot()
     def toggle_theme(self):
         """Toggle between light and dark theme."""
         if self.polygon_provider:
@@ -662,6 +667,7 @@ layout.addWidget({component_name.lower()}_widget)
             if self.current_component and self.current_story:
                 self.render_component_placeholder(self.current_story)
 
+    @Slot(str)
     def change_primary_color(self, color: str):
         """Change the primary color."""
         if self.polygon_provider:
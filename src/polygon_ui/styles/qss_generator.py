@@ -3,7 +3,7 @@ QSS Generator - Converts theme values to Qt Style Sheets.
 Equivalent to CSS variables and styling system in Mantine.
 """
 
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Union
 from ..theme.theme import Theme, ColorScheme
 
 
@@ -24,29 +24,42 @@ class QSSGenerator:
         Returns:
             Complete QSS string for the theme
         """
-        qss_parts = []
+        buf: List[str] = []
+        self.generate_theme_qss_into(buf, theme)
+        return "".join(buf)
 
-        # CSS Variables (as comments for documentation)
-        qss_parts.append("/* Polygon UI Theme Variables */")
-        qss_parts.append(self._generate_css_variables_qss(theme))
-
-        # Base styles
-        qss_parts.append("/* Base Styles */")
-        qss_parts.append(self._generate_base_styles_qss(theme))
-
-        # Color scheme styles
-        qss_parts.append(f"/* {theme.color_scheme.value.capitalize()} Theme */")
-        qss_parts.append(self._generate_color_scheme_qss(theme))
-
-        # Typography
-        qss_parts.append("/* Typography */")
-        qss_parts.append(self._generate_typography_qss(theme))
+    def generate_theme_qss_into(self, buf: List[str], theme: Theme) -> None:
+        """
+        Append global QSS for the entire theme to a string buffer.
 
-        # Spacing and layout
-        qss_parts.append("/* Layout & Spacing */")
-        qss_parts.append(self._generate_layout_qss(theme))
+        Callers building a larger stylesheet pass one list through and join
+        it once at the end, instead of concatenating intermediate strings.
 
-        return "\n\n".join(filter(None, qss_parts))
+        Args:
+            buf: List the QSS fragments are appended to
+            theme: Theme object containing all design tokens
+        """
+        _append_joined(
+            buf,
+            (
+                # CSS Variables (as comments for documentation)
+                "/* Polygon UI Theme Variables */",
+                self._generate_css_variables_qss(theme),
+                # Base styles
+                "/* Base Styles */",
+                self._generate_base_styles_qss(theme),
+                # Color scheme styles
+                f"/* {theme.color_scheme.value.capitalize()} Theme */",
+                self._generate_color_scheme_qss(theme),
+                # Typography
+                "/* Typography */",
+                self._generate_typography_qss(theme),
+                # Spacing and layout
+                "/* Layout & Spacing */",
+                self._generate_layout_qss(theme),
+            ),
+            "\n\n",
+        )
 
     def generate_component_qss(
         self, component_name: str, props: Dict[str, Any], theme: Theme
@@ -62,10 +75,49 @@ class QSSGenerator:
         Returns:
             Component-specific QSS string
         """
-        qss_parts = []
-        selector = f".{component_name}"
+        buf: List[str] = []
+        self.generate_component_qss_into(buf, component_name, props, theme)
+        return "".join(buf)
+
+    def generate_component_qss_into(
+        self,
+        buf: List[str],
+        component_name: str,
+        props: Dict[str, Any],
+        theme: Theme,
+    ) -> None:
+        """
+        Append QSS for a specific component with given props to a string buffer.
+
+        Args:
+            buf: List the QSS fragments are appended to
+            component_name: Name of the component
+            props: Component properties
+            theme: Current theme
+        """
+        qss_parts = [self._generate_rule(f".{component_name}", props, theme)]
+
+        # Always generate states for better UX
+        state_styles = self._generate_state_styles(component_name, props, theme)
+        if state_styles:
+            qss_parts.append(state_styles)
 
-        # Base component style
+        _append_joined(buf, qss_parts, "\n")
+
+    def _generate_rule(
+        self, selector: str, props: Dict[str, Any], theme: Theme
+    ) -> Optional[str]:
+        """
+        Generate a single QSS rule for the given props, without state rules.
+
+        Args:
+            selector: QSS selector the rule applies to
+            props: Style properties
+            theme: Current theme
+
+        Returns:
+            The rule, or None if no prop maps to a QSS property
+        """
         style_props = []
 
         # Handle different prop types
@@ -101,26 +153,18 @@ class QSSGenerator:
                 if css_prop:
                     style_props.append(css_prop)
 
-        if style_props:
-            qss_parts.append(f"{selector} {{")
-            qss_parts.extend(f"  {prop}" for prop in style_props)
-            qss_parts.append("}")
-
-        # Always generate states for better UX
-        state_styles = self._generate_state_styles(component_name, props, theme)
-        if state_styles:
-            qss_parts.append(state_styles)
-
-        return "\n".join(qss_parts)
+        if not style_props:
+            return None
+        return "\n".join([f"{selector} {{", *(f"  {p};" for p in style_props), "}"])
 
     def _generate_css_variables_qss(self, theme: Theme) -> str:
         """Generate CSS-like variables as comments for documentation."""
         variables = []
 
         # Color variables
-        for color_name in theme.colors.list_colors():
-            color_shades = theme.colors.get_color_shades(color_name)
-            for i, shade_value in enumerate(color_shades.shades):
+        for color_name in theme.colors.get_available_colors():
+            color_shades = theme.colors.get_shades(color_name)
+            for i, shade_value in enumerate(color_shades):
                 variables.append(
                     f"/* --polygon-color-{color_name}-{i}: {shade_value}; */"
                 )
@@ -144,8 +188,8 @@ class QSSGenerator:
         """Generate base application styles."""
         base_styles = [
             "QWidget {",
-            f"  font-family: {theme.font_family};",
-            f"  font-size: {theme.get_font_size('md')}px;",
+            f"  font-family: {theme.typography.get_font_family(None)};",
+            f"  font-size: {theme.typography.get_font_size('md')}px;",
             f"  color: {theme.get_color('gray', 9 if theme.color_scheme == ColorScheme.LIGHT else 0)};",
             "  background-color: transparent;",
             "  border: none;",
@@ -187,9 +231,9 @@ class QSSGenerator:
                 "QPushButton[class='primary'] {",
                 f"  background-color: {primary_color};",
                 f"  border: 1px solid {primary_color};",
-                f"  color: {theme.get_color('white', 0)};",
+                f"  color: #ffffff;",
                 "  padding: 8px 16px;",
-                f"  border-radius: {theme.get_radius('md')}px;",
+                f"  border-radius: {theme.radius['md']}px;",
                 "}",
                 "",
                 "QPushButton[class='primary']:hover {",
@@ -212,7 +256,7 @@ class QSSGenerator:
                     f"QLabel[class='h{i+1}'] {{",
                     f"  font-size: {size}px;",
                     f"  font-weight: {weight};",
-                    f"  line-height: {theme.get_line_height('md')};",
+                    f"  line-height: {theme.typography.get_line_height('md')};",
                     "}",
                 ]
             )
@@ -261,12 +305,12 @@ class QSSGenerator:
             css_props = spacing_map[prop_name].split(", ")
             for i, value in enumerate(prop_value):
                 if i < len(css_props):
-                    spacing = theme.get_spacing(value)
+                    spacing = theme.spacing.get_spacing(value)
                     props.append(f"{css_props[i]}: {spacing}px")
             return "; ".join(props)
         else:
             # Single value
-            spacing = theme.get_spacing(prop_value)
+            spacing = theme.spacing.get_spacing(prop_value)
             css_prop = spacing_map[prop_name]
             if ", " in css_prop:
                 # Apply to multiple properties
@@ -298,7 +342,7 @@ class QSSGenerator:
         elif isinstance(prop_value, str):
             # Handle theme values like 'sm', 'md', 'lg'
             if prop_value in ["xs", "sm", "md", "lg", "xl"]:
-                spacing = theme.get_spacing(prop_value)
+                spacing = theme.spacing.get_spacing(prop_value)
                 return f"{size_map[prop_name]}: {spacing}px"
             return f"{size_map[prop_name]}: {prop_value}"
 
@@ -320,8 +364,8 @@ class QSSGenerator:
                 color = theme.get_color(color_name, int(shade))
             elif prop_value == "primary":
                 color = theme.get_primary_color()
-            elif prop_value in theme.colors.list_colors():
-                color = theme.get_color(prop_value)
+            elif prop_value in theme.colors.get_available_colors():
+                color = theme.get_color(prop_value, 6)
             else:
                 color = prop_value
 
@@ -341,21 +385,21 @@ class QSSGenerator:
         if prop_name == "fz":
             # Font size
             if isinstance(prop_value, str):
-                size = theme.get_font_size(prop_value)
+                size = theme.typography.get_font_size(prop_value)
             else:
                 size = prop_value
             return f"font-size: {size}px"
         elif prop_name == "fw":
             # Font weight
             if isinstance(prop_value, str):
-                weight = theme.get_font_weight(prop_value)
+                weight = theme.typography.get_font_weight(prop_value)
             else:
                 weight = prop_value
             return f"font-weight: {weight}"
         elif prop_name == "lh":
             # Line height
             if isinstance(prop_value, str):
-                height = theme.get_line_height(prop_value)
+                height = theme.typography.get_line_height(prop_value)
             else:
                 height = prop_value
             return f"line-height: {height}"
@@ -374,7 +418,7 @@ class QSSGenerator:
         if prop_name == "bdrs":
             # Border radius
             if isinstance(prop_value, str):
-                radius = theme.get_radius(prop_value)
+                radius = theme.radius.get(prop_value, prop_value)
             else:
                 radius = prop_value
             return f"border-radius: {radius}px"
@@ -433,26 +477,18 @@ class QSSGenerator:
             ):  # Auto-generate focus if not specified
                 if not state_props:
                     # Default focus: use theme focus_ring
-                    focus_props = {
-                        "border": f"2px solid {theme.get_primary_color()}",
-                        "outline": "none",
-                    }
-                    state_props = focus_props
-                state_qss = self.generate_component_qss(
-                    component_name, state_props, theme
-                )
-                state_qss = state_qss.replace(
-                    f".{component_name}", f".{component_name}{qss_selector}"
+                    state_props = {"bd": f"2px solid {theme.get_primary_color()}"}
+                # Only the state's own rule: state props never nest further states
+                state_styles.append(
+                    self._generate_rule(
+                        f".{component_name}{qss_selector}", state_props, theme
+                    )
                 )
-                state_styles.append(state_qss)
 
         # Variant-based hover darkening (if variant='filled')
         if props.get("variant") == "filled":
-            primary = theme.get_primary_color()
-            darker = theme.colors.get_color(
-                theme.primary_color,
-                theme.primary_shade + 1 if isinstance(theme.primary_shade, int) else 7,
-            )
+            # One shade darker than the default primary shade
+            darker = theme.get_primary_color(6)
             hover_state = f"""
 .{component_name}:hover {{
     background-color: {darker};
@@ -461,3 +497,14 @@ class QSSGenerator:
             state_styles.append(hover_state)
 
         return "\n\n".join(filter(None, state_styles)) if state_styles else None
+
+
+def _append_joined(buf: List[str], parts: Iterable[Optional[str]], sep: str) -> None:
+    """Append the non-empty parts to buf with sep between them."""
+    first = True
+    for part in parts:
+        if part:
+            if not first:
+                buf.append(sep)
+            buf.append(part)
+            first = False
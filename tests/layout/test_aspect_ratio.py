@@ -2,11 +2,19 @@
 Tests for AspectRatio component layout behavior and responsive functionality.
 """
 
+import sys
+
 import pytest
 from PySide6.QtWidgets import QLabel, QWidget, QPushButton
 from PySide6.QtCore import QSize
 
-from polygon_ui.layout.components.aspect_ratio import AspectRatio
+from polygon_ui.layout.components.aspect_ratio import (
+    AspectRatio,
+    _clamp_non_negative,
+    _compute_target_size,
+    _expand_breakpoints,
+    _integer_fraction,
+)
 
 
 class TestAspectRatioBasics:
@@ -55,6 +63,16 @@ class TestAspectRatioBasics:
         for child in children:
             assert child in aspect._content_container.children()
 
+    def test_content_is_positioned_without_layouts(self, qt_widget):
+        """Test content is placed by geometry rather than nested QLayouts."""
+        aspect = AspectRatio()
+        child = QLabel("Test Content")
+        aspect.add_child(child)
+
+        assert aspect.layout() is None
+        assert aspect._content_container.layout() is None
+        assert child.geometry() == aspect._content_container.rect()
+
     def test_aspect_ratio_size_calculation(self, qt_widget):
         """Test aspect ratio size calculation."""
         aspect = AspectRatio(ratio=2.0)  # 2:1 ratio
@@ -99,6 +117,22 @@ class TestAspectRatioRatios:
             aspect = AspectRatio(ratio=preset)
             assert abs(aspect.get_current_ratio() - expected) < 0.001
 
+    def test_string_ratio_shapes_widget(self, qt_widget):
+        """Test string and responsive ratios reach the widget's target size."""
+        aspect = AspectRatio(ratio="16/9")
+        aspect.resize(800, 600)
+        aspect._update_responsive_props()
+        assert abs(aspect.get_current_ratio() - 16 / 9) < 0.001
+        assert aspect.get_target_size(800, 400) == (711, 400)
+
+        aspect.ratio = {"base": "square", "md": "widescreen"}
+        aspect._update_responsive_props()
+        assert abs(aspect.get_current_ratio() - 16 / 9) < 0.001
+
+        aspect.resize(400, 600)
+        aspect._update_responsive_props()
+        assert aspect.get_current_ratio() == 1.0
+
     def test_invalid_ratio_fallback(self, qt_widget):
         """Test fallback to square for invalid ratios."""
         aspect = AspectRatio(ratio="invalid")
@@ -115,6 +149,52 @@ class TestAspectRatioRatios:
         aspect.ratio = "2.25"
         assert aspect.get_current_ratio() == 2.25
 
+    def test_parsed_ratio_strings_are_cached(self, qt_widget):
+        """Test ratio strings are parsed once and then served from the cache."""
+        aspect = AspectRatio()
+        assert aspect._get_ratio_value("21/9") == 21 / 9
+        assert AspectRatio._RATIO_CACHE["21/9"] == 21 / 9
+        assert aspect._get_ratio_value("Widescreen") == 16 / 9
+        assert aspect._get_ratio_value(None) == 1.0
+
+    def test_preset_names_are_interned(self, qt_widget):
+        """Test preset keys are interned and matched case-insensitively."""
+        assert all(name is sys.intern(name) for name in AspectRatio.RATIOS)
+        aspect = AspectRatio()
+        assert aspect._parse_ratio("".join(["Pano", "rama"])) == 3.0
+
+    def test_malformed_fractions_fall_back_to_square(self, qt_widget):
+        """Test malformed fraction strings parse to a square ratio."""
+        aspect = AspectRatio()
+        assert aspect._parse_ratio("3/2") == 1.5
+        assert aspect._parse_ratio(" 3 / 2 ") == 1.5
+        for text in ("4/0", "4/", "/3", "1/2/3", "a/b", "4/0.00"):
+            assert aspect._parse_ratio(text) == 1.0
+
+    def test_integer_fractions_are_parsed_exactly(self, qt_widget):
+        """Test integer "a/b" ratios are kept as exact fractions."""
+        assert _integer_fraction("32/18") == (16, 9)
+        assert _integer_fraction("1/1") == (1, 1)
+        assert _integer_fraction("1.5/1") is None
+        assert _integer_fraction("4/0") is None
+        assert _integer_fraction("square") is None
+
+        aspect = AspectRatio()
+        aspect._get_ratio_value("32/18")
+        assert AspectRatio._RATIO_FRACTION["32/18"] == (16, 9)
+
+        aspect._current_ratio = 16 / 9
+        aspect._ratio_fraction = (16, 9)
+        assert aspect.get_target_size(1600, 1000) == (1600, 900)
+        assert aspect.get_target_size(1000, 450) == (800, 450)
+
+    def test_compute_target_size_fits_available_space(self):
+        """Test the shared sizing kernel for float and exact ratios."""
+        assert _compute_target_size(400, 400, 2.0) == (400, 200)
+        assert _compute_target_size(400, 100, 2.0) == (200, 100)
+        assert _compute_target_size(1920, 1200, 16 / 9, (16, 9)) == (1920, 1080)
+        assert _compute_target_size(1000, 450, 16 / 9, (16, 9)) == (800, 450)
+
 
 class TestAspectRatioProperties:
     """Test AspectRatio component properties."""
@@ -244,6 +324,76 @@ class TestAspectRatioResponsive:
         assert min_height_config["sm"] == 200
         assert min_height_config["md"] == 250
 
+    def test_resolved_values_are_cached_per_breakpoint(self, qt_widget):
+        """Test responsive values are only re-resolved when inputs change."""
+        aspect = AspectRatio(ratio="16/9")
+        aspect._update_responsive_props()
+        resolve = aspect._responsive.resolve_fast
+        calls = []
+        aspect._responsive.resolve_fast = lambda name, default=None: (
+            calls.append(name) or resolve(name, default)
+        )
+
+        aspect._update_responsive_props()
+        aspect._update_responsive_props()
+        assert calls == []
+
+        aspect.min_width = 120
+        assert calls
+        calls.clear()
+
+        aspect.resize(1300, 600)
+        aspect._update_responsive_props()
+        assert calls
+        calls.clear()
+
+        aspect._update_responsive_props()
+        assert calls == []
+
+    def test_numeric_ratio_skips_responsive_resolution(self, qt_widget):
+        """Test a plain numeric ratio is applied without breakpoint resolution."""
+        aspect = AspectRatio(ratio=2.0)
+        assert aspect._is_fixed
+        assert aspect.ratio == 2.0
+        assert aspect.get_current_ratio() == 2.0
+
+        aspect.resize(1300, 600)
+        aspect._update_responsive_props()
+        assert aspect._resolved == {}
+
+        aspect.min_width = 120
+        assert not aspect._is_fixed
+        assert aspect._resolved
+        assert not AspectRatio(ratio=2.0, min_width=10)._is_fixed
+
+    def test_expand_breakpoints_cascades_upwards(self):
+        """Test partial breakpoint dicts inherit from the nearest smaller breakpoint."""
+        assert _expand_breakpoints({"base": 1, "lg": 2}, "square") == {
+            "base": 1,
+            "sm": 1,
+            "md": 1,
+            "lg": 2,
+            "xl": 2,
+        }
+        assert _expand_breakpoints({"md": -5}, 0, _clamp_non_negative) == dict.fromkeys(
+            ("base", "sm", "md", "lg", "xl"), 0
+        )
+        assert _expand_breakpoints(1.5, "square") == dict.fromkeys(
+            ("base", "sm", "md", "lg", "xl"), 1.5
+        )
+
+    def test_expand_breakpoints_clamps_each_value_once(self):
+        """Test the clamp runs once per distinct value, not per breakpoint."""
+        calls = []
+
+        def clamp(value):
+            calls.append(value)
+            return max(0, value)
+
+        expanded = _expand_breakpoints({"sm": -1, "lg": 40}, 10, clamp)
+        assert expanded == {"base": 10, "sm": 0, "md": 0, "lg": 40, "xl": 40}
+        assert calls == [10, -1, 40]
+
 
 class TestAspectRatioConvenienceMethods:
     """Test AspectRatio component convenience methods."""
@@ -372,6 +522,51 @@ class TestAspectRatioBehavior:
         target_size = aspect.get_target_size(1, 1)
         assert target_size == (1, 1)
 
+    def test_resize_bursts_are_coalesced(self, qtbot):
+        """Test a burst of resize events triggers a single layout refresh."""
+        aspect = AspectRatio(ratio=2.0)
+        qtbot.addWidget(aspect)
+        aspect.show()
+        qtbot.waitExposed(aspect)
+        qtbot.wait(10)
+
+        calls = []
+        aspect._update_aspect_layout = lambda: calls.append(
+            (aspect.width(), aspect.height())
+        )
+        for width in range(300, 400, 10):
+            aspect.resize(width, 200)
+        assert calls == []
+
+        qtbot.waitUntil(lambda: len(calls) == 1)
+        qtbot.wait(10)
+        assert calls == [(390, 200)]
+
+    def test_content_is_fitted_to_current_size(self, qtbot):
+        """Test the content box is fitted and centered in the current size."""
+        aspect = AspectRatio()
+        child = QLabel("Test Content")
+        aspect.add_child(child)
+        qtbot.addWidget(aspect)
+        aspect.resize(400, 200)
+        aspect.show()
+        qtbot.waitExposed(aspect)
+
+        container = aspect._content_container
+        qtbot.waitUntil(lambda: container.geometry().getRect() == (100, 0, 200, 200))
+        assert child.geometry() == container.rect()
+
+        child.setGeometry = lambda *args: pytest.fail("child was resized")
+        aspect.resize(500, 200)
+        qtbot.waitUntil(lambda: container.geometry().getRect() == (150, 0, 200, 200))
+        del child.setGeometry
+
+        aspect.setUpdatesEnabled(False)
+        aspect.resize(200, 400)
+        qtbot.waitUntil(lambda: container.geometry().getRect() == (0, 100, 200, 200))
+        assert not aspect.updatesEnabled()
+        aspect.setUpdatesEnabled(True)
+
 
 class TestAspectRatioPerformance:
     """Performance tests for AspectRatio component."""
@@ -395,6 +590,22 @@ class TestAspectRatioPerformance:
         # Should be fast (less than 100ms for 100 components)
         assert duration < 0.1, f"Too slow: {duration:.3f}s"
 
+    def test_construction_applies_aspect_properties_once(self, qt_widget):
+        """Test responsive refreshes are deferred until construction ends."""
+
+        class CountingAspectRatio(AspectRatio):
+            def _update_aspect_properties(self):
+                self.passes = getattr(self, "passes", 0) + 1
+                super()._update_aspect_properties()
+
+            def _set_min_height(self, value):
+                super()._set_min_height(value)
+                self._update_responsive_props()
+
+        aspect = CountingAspectRatio(ratio="16/9", min_width=10, min_height=10)
+        assert aspect.passes == 1
+        assert not aspect._initializing
+
     def test_aspect_ratio_resize_performance(self, qt_widget):
         """Test AspectRatio component resize performance."""
         import time
@@ -89,6 +89,36 @@ class TestLayoutComponent:
         component.align = "center"
         assert component.align == "center"
 
+    def test_responsive_value_falls_back_to_smaller_breakpoint(self, parent_widget):
+        """Test responsive values resolve mobile-first."""
+        component = LayoutComponent(parent_widget)
+        component.set_responsive_prop("span", {"base": 12, "md": 6})
+
+        for width, expected in [(320, 12), (600, 12), (800, 6), (1300, 6)]:
+            component.resize(width, 100)
+            assert component.get_responsive_value("span") == expected
+
+        component.set_responsive_prop("offset", {"lg": 2})
+        component.resize(320, 100)
+        assert component.get_responsive_value("offset") == 2
+
+    def test_current_breakpoint_boundaries(self, parent_widget):
+        """Test breakpoints switch exactly at their minimum widths."""
+        component = LayoutComponent(parent_widget)
+        for width, expected in [
+            (0, "base"),
+            (575, "base"),
+            (576, "sm"),
+            (767, "sm"),
+            (768, "md"),
+            (992, "lg"),
+            (1199, "lg"),
+            (1200, "xl"),
+            (5000, "xl"),
+        ]:
+            component.resize(width, 100)
+            assert component._get_current_breakpoint() == expected
+
 
 class TestGridComponent:
     """Test the GridComponent base class."""
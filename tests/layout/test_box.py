@@ -3,13 +3,18 @@
 Includes basic functionality, style props integration, responsive behavior, layout properties,
 and complex scenarios for production readiness."""
 
+import sys
+import warnings
+
 import pytest
-from PySide6.QtWidgets import QLabel, QApplication, QWidget
+from PySide6.QtWidgets import QLabel, QApplication, QWidget, QBoxLayout
 from PySide6.QtCore import Qt, QSize, QRect
 from PySide6.QtGui import QFont, QPalette, QColor
 
-from polygon_ui.layout.components.box import Box
+from polygon_ui.layout.components.box import Box, _join_qss, _theme_key
+from polygon_ui.core.provider import PolygonProvider
 from polygon_ui.layout.core.responsive import ResponsiveProps
+from polygon_ui.theme.theme import Theme
 from conftest import ResponsiveTestHelper
 import time
 import gc
@@ -109,7 +114,25 @@ class TestBoxStyleProps:
         # Child should be inset by padding
         assert child_labels[0].x() == 20
         assert child_labels[0].y() == 20
-        assert "padding: 20px" in box.styleSheet()
+        # Pixel padding is applied natively rather than through QSS
+        assert box.contentsMargins().left() == 20
+        assert "padding" not in box.styleSheet()
+
+    def test_pixel_padding_uses_contents_margins(self, parent_widget, qtbot):
+        """Test pixel padding insets laid-out children without QSS."""
+        box = Box(parent=parent_widget, display="flex", p=12, border="1px solid gray")
+        label = QLabel("Child")
+        box.add_child(label)
+        box.resize(200, 100)
+        box.show()
+        qtbot.waitUntil(lambda: box.contentsMargins().left() == 12)
+        QApplication.processEvents()
+        assert label.x() == 12 and label.y() == 12
+        assert "padding" not in box.styleSheet()
+
+        box.p = "2em"
+        qtbot.waitUntil(lambda: box.contentsMargins().left() == 0)
+        assert "padding: 2em;" in box.styleSheet()
 
     def test_background_color(self, box):
         """Test background color."""
@@ -242,6 +265,57 @@ class TestBoxLayoutProps:
         # Second child should wrap
         assert child_labels[1].y() > child_labels[0].y()
 
+    def test_display_switch_reseats_children(self, box, child_labels):
+        """Test switching layout kinds keeps children seated and visible."""
+        box.display = "flex"
+        for label in child_labels[:3]:
+            box.add_child(label)
+        box.display = "grid"
+        assert box.layout() is box._layout
+        assert box._layout.count() == 3
+        box.display = "block"
+        assert box.layout() is None
+        QApplication.processEvents()
+        assert all(label.parent() is box for label in child_labels[:3])
+        assert all(label.isVisible() for label in child_labels[:3])
+
+    def test_wrap_warning_is_emitted_once(self, box, monkeypatch):
+        """Test the basic-wrap warning is a one-shot RuntimeWarning."""
+        monkeypatch.setattr(Box, "_wrap_warned", False)
+        box.display = "flex"
+        with pytest.warns(RuntimeWarning, match="Flex component"):
+            box.wrap = True
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            box.wrap = {"base": False, "md": True}
+
+    def test_alignment_follows_layout_direction(self, box, qtbot):
+        """Test justify/align map to Qt alignment along the flex direction."""
+        box.display = "flex"
+        box.justify = "center"
+        box.align = "end"
+        qtbot.waitUntil(lambda: not box._layout_dirty)
+        assert box._layout.alignment() == Qt.AlignHCenter | Qt.AlignBottom
+
+        box.direction = "column"
+        qtbot.waitUntil(lambda: not box._layout_dirty)
+        assert box._layout.alignment() == Qt.AlignVCenter | Qt.AlignRight
+
+    def test_direction_flip_reuses_layout(self, box, child_labels):
+        """Test flex direction changes flip the existing QBoxLayout in place."""
+        box.display = "flex"
+        for label in child_labels[:2]:
+            box.add_child(label)
+        layout = box._layout
+        assert type(layout) is QBoxLayout
+        box.direction = "column"
+        assert box._layout is layout
+        assert layout.direction() == QBoxLayout.TopToBottom
+        box.direction = "row-reverse"
+        assert box._layout is layout
+        assert layout.direction() == QBoxLayout.RightToLeft
+        assert layout.count() == 2
+
 
 class TestBoxResponsive:
     """Tests for responsive behavior."""
@@ -274,6 +348,30 @@ class TestBoxResponsive:
         assert box.width() == 200  # 100% of parent? Wait, parent 500, but resize to 200
         # Adjust assertions based on implementation
 
+    def test_style_value_uses_nearest_breakpoint(self, box):
+        """Test dict style values resolve to the nearest set breakpoint."""
+        box._set_prop("border", {"base": "1px solid red", "md": "2px solid blue"})
+        box.resize(800, 100)
+        assert box._resolve_style_value("border") == "2px solid blue"
+        box.resize(1300, 100)
+        assert box._resolve_style_value("border") == "2px solid blue"
+        box.resize(300, 100)
+        assert box._resolve_style_value("border") == "1px solid red"
+        # Below the smallest set breakpoint, its value is used
+        box._set_prop("border", {"md": "2px solid blue"})
+        assert box._resolve_style_value("border") == "2px solid blue"
+
+    def test_responsive_dict_style_value_is_applied(self, parent_widget):
+        """Test a string-keyed breakpoint dict reaches the generated QSS."""
+        box = Box(parent=parent_widget, bg={"base": "red", "md": "blue"})
+        box.resize(300, 100)
+        box._update_styling()
+        assert "background-color: red" in box.styleSheet()
+
+        box.resize(800, 100)
+        box._update_styling()
+        assert "background-color: blue" in box.styleSheet()
+
 
 class TestBoxConvenienceMethods:
     """Tests for convenience methods."""
@@ -328,6 +426,15 @@ class TestBoxClassMethods:
         assert card_box.bg == "white"  # Or theme color
         assert "border" in card_box.styleSheet()
 
+    def test_card_overrides_leave_defaults_untouched(self, parent_widget):
+        """Test Box.card() overrides apply per call only."""
+        card_box = Box.card(parent=parent_widget, p="xl")
+        assert card_box.p == "xl"
+        assert Box._CARD_DEFAULTS["p"] == "md"
+        with pytest.raises(TypeError):
+            Box._CARD_DEFAULTS["p"] = "xl"
+        assert Box.card(parent=parent_widget).p == "md"
+
 
 class TestBoxComposition:
     """Tests for component composition and nesting."""
@@ -379,6 +486,18 @@ class TestBoxEvents:
         QApplication.processEvents()
         mock.assert_called_once()
 
+    def test_resize_within_breakpoint_skips_updates(self, box):
+        """Test resizes only refresh styling when the breakpoint changes."""
+        passes = []
+        box._update_styling = lambda: passes.append(box.width())
+        box.resize(600, 300)
+        box.resize(640, 300)
+        box.resize(700, 300)
+        assert passes == [600]
+
+        box.resize(800, 300)
+        assert passes == [600, 800]
+
     def test_mouse_events(self, box, mocker):
         """Test mouse press/release events."""
         mock_press = mocker.patch.object(Box, "mousePressEvent")
@@ -542,6 +661,158 @@ class TestBoxPerformance:
         for label in box.children()[:10]:
             assert label.x() >= 0 and label.y() >= 0
 
+    def test_unchanged_styling_skips_qt_calls(self, parent_widget):
+        """Test no-op style/layout updates don't call back into Qt."""
+        box = Box(parent=parent_widget, display="flex", p="md", gap=6)
+        QApplication.processEvents()
+        calls = []
+        box.setStyleSheet = lambda qss: calls.append(("qss", qss))
+        box._layout.setSpacing = lambda spacing: calls.append(("spacing", spacing))
+        box._layout.setAlignment = lambda align: calls.append(("align", align))
+
+        box._update_styling()
+        box._update_layout_styling()
+        assert calls == []
+
+        box.gap = 10
+        assert calls == []
+        QApplication.processEvents()
+        assert calls == [("spacing", 10)]
+
+    def test_box_qss_is_a_stylesheet_layer(self, parent_widget):
+        """Test the box QSS is combined with the base layer and applied once."""
+        PolygonProvider.reset()
+        try:
+            PolygonProvider(Theme())
+            box = Box(parent=parent_widget, bg="red")
+            QApplication.processEvents()
+            assert box._base_qss and box._component_qss
+            layers = (box._base_qss, box._component_qss, box._variant_qss)
+            assert box.styleSheet() == "\n".join(filter(None, layers))
+
+            calls = []
+            box.setStyleSheet = calls.append
+            box.bg = "blue"
+            QApplication.processEvents()
+            assert len(calls) == 1
+            assert box._component_qss in calls[0]
+            assert box._base_qss in calls[0]
+        finally:
+            PolygonProvider.reset()
+
+    def test_setter_bursts_are_coalesced(self, parent_widget, qtbot):
+        """Test a burst of setters triggers one styling and layout pass."""
+        box = Box(parent=parent_widget, display="flex", gap="sm")
+        QApplication.processEvents()
+        passes = []
+        box._update_styling = lambda: passes.append("style")
+        box._update_layout_styling = lambda: passes.append("layout")
+
+        box.p = "lg"
+        box.bg = "gray.1"
+        box.borderRadius = "sm"
+        box.justify = "center"
+        box.align = "center"
+        assert passes == []
+
+        qtbot.waitUntil(lambda: len(passes) == 2)
+        QApplication.processEvents()
+        assert passes == ["style", "layout"]
+
+    def test_construction_styles_once(self, parent_widget, qtbot):
+        """Test a new Box runs one styling and one layout pass."""
+        passes = []
+
+        class CountingBox(Box):
+            def _update_styling(self):
+                passes.append("style")
+                super()._update_styling()
+
+            def _update_layout_styling(self):
+                passes.append("layout")
+                super()._update_layout_styling()
+
+        box = CountingBox(parent=parent_widget, display="flex", p="md", gap="sm")
+        assert passes == []
+        assert box._responsive.get("p") == "md"
+        qtbot.waitUntil(lambda: len(passes) == 2)
+        QApplication.processEvents()
+        assert passes == ["style", "layout"]
+
+    def test_styling_pass_resolves_breakpoint_once(self, parent_widget):
+        """Test a styling pass reads the breakpoint once and reuses the cache."""
+        box = Box(parent=parent_widget, p="md", bg="gray.1", border="1px solid gray")
+        QApplication.processEvents()
+        qss = box.styleSheet()
+        lookups = []
+        original = box._get_current_breakpoint
+        box._get_current_breakpoint = lambda: lookups.append(1) or original()
+        box._resolve_style_value = lambda *args: pytest.fail("cache miss")
+
+        box._update_styling()
+        assert lookups == [1]
+        assert box.styleSheet() == qss
+
+    def test_block_mode_skips_layout_styling(self, box):
+        """Test layout setters on a block-mode Box schedule no layout pass."""
+        box._update_layout_styling = lambda: pytest.fail("layout styling")
+        box.justify = "center"
+        box.gap = "md"
+        assert not box._layout_dirty
+        box.resize(900, 300)
+        QApplication.processEvents()
+
+    def test_style_values_are_memoized(self, parent_widget):
+        """Test resolved style values are cached until their prop changes."""
+        box = Box(parent=parent_widget, border="1px solid gray")
+        QApplication.processEvents()
+        resolved = []
+        original = box._resolve_style_value
+        box._resolve_style_value = lambda key, default="": (
+            resolved.append(key) or original(key, default)
+        )
+
+        assert box._get_responsive_style_value("border") == "1px solid gray"
+        assert box._get_responsive_style_value("border") == "1px solid gray"
+        assert resolved == []
+
+        box.border = "2px solid red"
+        assert box._get_responsive_style_value("border") == "2px solid red"
+        assert box._get_responsive_style_value("border") == "2px solid red"
+        assert resolved == ["border"]
+
+    def test_property_getters_read_resolved_props(self, box):
+        """Test getters are served from the flat cache until a prop changes."""
+        box.justify = "center"
+        assert box.justify == "center"
+        assert box.display == "block"
+        box._responsive.get = lambda *args: pytest.fail("responsive lookup")
+        assert box.justify == "center"
+        assert box.display == "block"
+
+        del box._responsive.get
+        box.justify = "end"
+        assert box.justify == "end"
+
+    def test_same_style_signature_shares_qss(self, parent_widget):
+        """Test Boxes with identical resolved styles reuse one QSS string."""
+        first = Box(parent=parent_widget, bg="white", border="1px solid gray")
+        second = Box(parent=parent_widget, bg="white", border="1px solid gray")
+        QApplication.processEvents()
+        hits = _join_qss.cache_info().hits
+        first._update_styling()
+        second._update_styling()
+        assert _join_qss.cache_info().hits == hits + 2
+        assert first._applied_qss is second._applied_qss
+        assert "border: 1px solid gray;" in first._applied_qss
+
+    def test_theme_keys_are_interned(self):
+        """Test theme lookup keys are built once and shared."""
+        key = _theme_key("spacing", "".join(["m", "d"]))
+        assert key == "spacing.md"
+        assert key is _theme_key("spacing", "md")
+        assert key is sys.intern("spacing.md")
+
 
 class TestBoxEdgeCases:
     """Edge cases for Box."""
@@ -2,11 +2,17 @@
 Tests for Center component layout behavior and responsive functionality.
 """
 
+from types import SimpleNamespace
+
 import pytest
 from PySide6.QtWidgets import QLabel, QWidget, QPushButton
 from PySide6.QtCore import QSize
 
-from polygon_ui.layout.components.center import Center
+from polygon_ui.layout.components.center import (
+    Center,
+    _BREAKPOINTS,
+    _normalize_responsive,
+)
 
 
 class TestCenterBasics:
@@ -27,6 +33,13 @@ class TestCenterBasics:
         assert center.max_width == 400
         assert center.max_height == 300
 
+    def test_getters_resolve_normalized_props(self, qt_widget):
+        """Test getters return the current breakpoint's value, not None."""
+        center = Center(inline=True, max_width=300)
+        assert center.inline is True
+        assert center.max_width == 300
+        assert center.max_height is None
+
     def test_center_add_child(self, qt_widget):
         """Test adding children to Center component."""
         center = Center()
@@ -360,6 +373,132 @@ class TestCenterPerformance:
         # Should be fast (less than 50ms for 200 resizes)
         assert duration < 0.05, f"Too slow: {duration:.3f}s"
 
+    def test_unchanged_centering_skips_qt_calls(self, qt_widget):
+        """Test re-resolving unchanged props makes no Qt calls."""
+        center = Center(max_width=400)
+        center.add_child(QLabel("Content"))
+        calls = []
+        center.setSizePolicy = lambda *args: calls.append("policy")
+        center._content_container.setMaximumSize = lambda w, h: calls.append(w)
+
+        center.resize(800, 600)
+        center.resize(400, 300)
+        center._update_centering_properties()
+        assert calls == []
+
+        center.max_width = 300
+        assert calls == ["policy", 300]
+
+    def test_named_max_width_looked_up_once(self, qt_widget):
+        """Test theme size groups are re-read only when the theme changes."""
+        lookups = []
+        provider = SimpleNamespace(
+            theme_version=0,
+            get_theme_value=lambda path, default=None: lookups.append(path)
+            or {"md": 500, "lg": 700},
+        )
+        center = Center(max_width="md")
+        center.add_child(QLabel("Content"))
+        center._provider = provider
+        try:
+            center._update_centering_properties()
+            assert center._content_container.maximumWidth() == 500
+            assert lookups == ["maxWidths"]
+
+            center._responsive.set("max_width", dict.fromkeys(_BREAKPOINTS, "lg"))
+            center._update_centering_properties()
+            assert center._content_container.maximumWidth() == 700
+            assert lookups == ["maxWidths"]
+
+            provider.theme_version = 1
+            center._update_centering_properties()
+            assert lookups == ["maxWidths", "maxWidths"]
+        finally:
+            center._provider = None
+
+    def test_prop_setters_refresh_centering_only(self, qt_widget):
+        """Test prop setters normalize and refresh centering directly."""
+        center = Center()
+        calls = []
+        center._update_responsive_props = lambda: calls.append("responsive")
+        center._update_centering_properties = lambda: calls.append("centering")
+
+        center.max_width = {"md": 600}
+        assert calls == ["centering"]
+        assert center._responsive._props["max_width"]["xl"] == 600
+
+    def test_resize_bursts_are_debounced(self, qt_widget, qtbot):
+        """Test a burst of resizes triggers one responsive refresh."""
+        center = Center()
+        qtbot.addWidget(center)
+        center.show()
+        refreshes = []
+        center._update_responsive_props = lambda: refreshes.append(center.width())
+
+        for width in (500, 600, 700, 800):
+            center.resize(width, 300)
+        assert refreshes == []
+        qtbot.waitUntil(lambda: refreshes == [800])
+
+    def test_resizes_within_breakpoint_skip_refresh(self, qt_widget, qtbot):
+        """Test only resizes that cross a breakpoint refresh props."""
+        center = Center()
+        qtbot.addWidget(center)
+        center.resize(800, 300)
+        center.show()
+        refreshes = []
+        center._update_responsive_props = lambda: refreshes.append(center.width())
+
+        for width in (820, 850, 900):
+            center.resize(width, 300)
+        qtbot.wait(50)
+        assert refreshes == []
+
+        center.resize(1300, 300)
+        qtbot.waitUntil(lambda: refreshes == [1300])
+
+    def test_normalize_responsive(self):
+        """Test scalars fill every breakpoint and dicts cascade upwards."""
+        assert _normalize_responsive(True, False) == dict.fromkeys(
+            ("base", "sm", "md", "lg", "xl"), True
+        )
+        assert _normalize_responsive(None, 10)["xl"] == 10
+        assert _normalize_responsive({}, True) == dict.fromkeys(
+            ("base", "sm", "md", "lg", "xl"), True
+        )
+        assert _normalize_responsive("x", False, lambda v: v is True)["md"] is False
+        assert _normalize_responsive({"sm": 1, "lg": 3}, 0) == {
+            "base": 0,
+            "sm": 1,
+            "md": 1,
+            "lg": 3,
+            "xl": 3,
+        }
+
+    def test_normalized_keys_are_shared(self):
+        """Test normalized dicts reuse the interned breakpoint names."""
+        user_key = "".join(["m", "d"])
+        normalized = _normalize_responsive({user_key: 5}, 0)
+        assert normalized["md"] == 5
+        assert all(key is bp for key, bp in zip(normalized, _BREAKPOINTS))
+
+    def test_content_container_created_on_first_child(self, qt_widget):
+        """Test empty Centers skip the content container until needed."""
+        center = Center(max_width=400)
+        assert center._content_container is None
+
+        calls = []
+        center._update_centering_properties = lambda: calls.append("update")
+        center.add_child(QLabel("Content"))
+        container = center._content_container
+        assert container is not None
+        assert center._main_layout.indexOf(container) == 0
+        assert calls == ["update"]
+
+        center.add_child(QLabel("More"))
+        assert center._content_container is container
+        assert calls == ["update"]
+
 
 class TestCenterIntegration:
     """Integration tests with other components."""
@@ -5,7 +5,7 @@ import sys
 
 from pytestqt.qtbot import QtBot
 
-from polygon_ui.layout.components.col import Col
+from polygon_ui.layout.components.col import Col, _BREAKPOINTS, _normalize_responsive
 from polygon_ui.layout.components.grid import Grid  # Assuming Grid exists
 
 
@@ -145,8 +145,8 @@ class TestCol:
         col.offset_center()
         assert col.offset["base"] == 0  # Full width, offset 0
         col.offset = 6
-        col.offset_center()  # For span 6, offset 3
-        assert col.offset["base"] == 3
+        col.offset_center()  # For the md span 6, offset 3
+        assert col.offset["md"] == 3
 
     # Responsive behavior tests would require mocking resize and breakpoint system
     # For now, test prop resolution
@@ -846,3 +846,99 @@ class TestCol:
             props3_md = grid_parent._child_layout_props[col3]
             assert props3_md["colspan"] == 4
             assert props3_md["order"] == 1
+
+
+def test_normalize_responsive():
+    clamp = lambda v, bp: max(0, v)
+    assert _normalize_responsive(-3, 0, clamp) == dict.fromkeys(_BREAKPOINTS, 0)
+    assert _normalize_responsive("x", 5, clamp) == dict.fromkeys(_BREAKPOINTS, 5)
+    assert _normalize_responsive({"sm": 2, "lg": 4}, 1, clamp) == {
+        "base": 1,
+        "sm": 2,
+        "md": 2,
+        "lg": 4,
+        "xl": 4,
+    }
+
+    calls = []
+    record = lambda v, bp: calls.append(bp) or v
+    _normalize_responsive(3, 0, record)
+    assert calls == ["base"]
+    calls.clear()
+    _normalize_responsive(3, 0, record, per_breakpoint=True)
+    assert calls == list(_BREAKPOINTS)
+
+
+def test_set_offset_reuses_given_spans(qt_widget, monkeypatch):
+    col = Col(parent=qt_widget)
+    looked_up = []
+    real_get = col._responsive.get
+    monkeypatch.setattr(
+        col._responsive,
+        "get",
+        lambda name, *a: looked_up.append(name) or real_get(name, *a),
+    )
+
+    spans = col._set_span({"base": 12, "md": 8})
+    col._set_offset({"base": 6, "md": 6}, spans)
+
+    assert looked_up == []
+    assert col._responsive._props["offset"] == {
+        "base": 0,
+        "sm": 0,
+        "md": 4,
+        "lg": 4,
+        "xl": 4,
+    }
+
+
+def test_inherited_offsets_are_clamped_per_breakpoint(qt_widget):
+    col = Col(parent=qt_widget)
+    spans = col._set_span({"base": 6, "md": 12})
+    col._set_offset({"base": 6}, spans)
+
+    assert col._responsive._props["offset"] == {
+        "base": 6,
+        "sm": 6,
+        "md": 0,
+        "lg": 0,
+        "xl": 0,
+    }
+
+
+def test_invalidate_max_cols_reclamps_span_and_offset(qt_widget, monkeypatch):
+    col = Col(parent=qt_widget)
+    col._set_offset({"base": 0, "md": 4}, col._set_span({"base": 12, "md": 8}))
+
+    monkeypatch.setattr(col, "_refresh_grid_parent", lambda: None)
+    col._cached_max_cols = 6
+    col.invalidate_max_cols()
+
+    props = col._responsive._props
+    assert props["span"] == {"base": 6, "sm": 6, "md": 6, "lg": 6, "xl": 6}
+    assert props["offset"] == dict.fromkeys(_BREAKPOINTS, 0)
+    assert col._update_timer.isActive()
+
+
+def test_reparenting_keeps_stored_span_and_offset(qt_widget):
+    col = Col(parent=qt_widget, span=6, offset=2)
+    col.setParent(QWidget())
+
+    config = col._responsive.get_config
+    assert config("span") == dict.fromkeys(_BREAKPOINTS, 6)
+    assert config("offset") == dict.fromkeys(_BREAKPOINTS, 2)
+
+
+def test_offset_helpers_on_fixed_span(qt_widget):
+    col = Col(parent=qt_widget, span=6)
+    col.offset = 2
+    col.span = 4
+    assert col.span == dict.fromkeys(_BREAKPOINTS, 4)
+    assert col.offset == dict.fromkeys(_BREAKPOINTS, 2)
+
+    col.offset_center()
+    assert col.offset == dict.fromkeys(_BREAKPOINTS, 4)
+    col.offset_right()
+    assert col.offset == dict.fromkeys(_BREAKPOINTS, 8)
+    col.offset_left()
+    assert col.offset == dict.fromkeys(_BREAKPOINTS, 0)
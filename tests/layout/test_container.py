@@ -1,5 +1,7 @@
 """Unit tests for the Container component in Polygon UI."""
 
+from types import SimpleNamespace
+
 import pytest
 from PySide6.QtWidgets import QWidget, QApplication
 from PySide6.QtCore import Qt
@@ -291,3 +293,58 @@ class TestContainerEdgeCases:
         # Assuming it does
         layout = container.layout()
         assert layout.count() == 1
+
+
+class TestContainerPerformance:
+    """Test that redundant styling updates are skipped."""
+
+    def test_size_map_is_shared(self, app):
+        """Test that size breakpoints live on the class, not each instance."""
+        assert Container._SIZE_MAP["lg"] == 1140
+        assert "_size_map" not in vars(Container())
+
+    def test_unchanged_styling_skips_qt_calls(self, container, monkeypatch):
+        """Test that re-applying the same props does not touch Qt geometry."""
+        calls = []
+        monkeypatch.setattr(container, "setMaximumWidth", calls.append)
+
+        container.px = "md"
+        container.size = "md"
+        assert calls == []
+
+        container.size = "lg"
+        assert calls == [1140]
+
+    def test_spacing_lookup_cached_per_theme_version(self, container):
+        """Test that named spacing hits the theme once per theme version."""
+        lookups = []
+        container._provider = SimpleNamespace(
+            theme_version=0,
+            get_theme_value=lambda path, default: lookups.append(path) or 24,
+        )
+
+        assert container._get_spacing_pixels("lg") == 24
+        assert container._get_spacing_pixels("lg") == 24
+        assert lookups == ["spacing.lg"]
+
+        container._provider.theme_version = 1
+        container._get_spacing_pixels("lg")
+        assert lookups == ["spacing.lg", "spacing.lg"]
+
+    def test_resizes_within_breakpoint_skip_styling(self, container, monkeypatch):
+        """Test that only breakpoint-crossing resizes restyle the container."""
+        container.resize(800, 600)
+        QApplication.processEvents()
+        calls = []
+        monkeypatch.setattr(
+            container, "_update_container_styling", lambda: calls.append(1)
+        )
+
+        for width in (820, 900, 780):
+            container.resize(width, 600)
+            QApplication.processEvents()
+        assert calls == []
+
+        container.resize(700, 600)
+        QApplication.processEvents()
+        assert calls == [1]
@@ -76,3 +76,15 @@ def test_remove_child_from_layout(parent_widget):
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+def test_layout_components_resolve_lazily():
+    """Test layout components are imported on first access."""
+    import polygon_ui.layout.components as components
+    from polygon_ui.layout.components.group import Group
+
+    assert "Group" in dir(components)
+    assert components.Group is Group
+    assert components.__dict__["Group"] is Group
+    with pytest.raises(AttributeError):
+        components.NotAComponent
@@ -45,6 +45,16 @@ class TestBreakpointSystem:
         assert BreakpointSystem.get_breakpoint_for_width(1000) == Breakpoint.LG
         assert BreakpointSystem.get_breakpoint_for_width(1400) == Breakpoint.XL
 
+    def test_get_breakpoint_for_width_boundaries(self):
+        """Test that each minimum width belongs to its own breakpoint."""
+        assert BreakpointSystem.get_breakpoint_for_width(-1) == Breakpoint.BASE
+        for bp, min_width in BreakpointSystem.BREAKPOINTS.items():
+            assert BreakpointSystem.get_breakpoint_for_width(min_width) == bp
+            if min_width:
+                below = BreakpointSystem.get_breakpoint_for_width(min_width - 1)
+                assert below != bp
+                assert BreakpointSystem.breakpoint_le(below, bp)
+
     def test_get_min_width(self):
         """Test getting minimum width for breakpoints."""
         assert BreakpointSystem.get_min_width(Breakpoint.BASE) == 0
@@ -80,6 +90,53 @@ class TestResponsiveProps:
         widget.resize(800, 600)  # Should be MD breakpoint
         assert props.get("columns") == 3
 
+    def test_bulk_set(self, qt_widget):
+        """Test setting several values at once refreshes only those values."""
+        props = ResponsiveProps(qt_widget)
+        props.set("gap", "md")
+        props.set("wrap", False)
+        assert props.get("gap") == "md"
+        assert props.get("wrap") is False
+
+        props.bulk_set({"gap": "lg", "align": "center"})
+        assert props.get("gap") == "lg"
+        assert props.get("align") == "center"
+        assert props.get("wrap") is False
+
+    def test_version_bumps_on_set(self, qt_widget):
+        """Test every set or bulk_set bumps the version used by caches."""
+        props = ResponsiveProps(qt_widget)
+        version = props._version
+        props.set("gap", "md")
+        props.bulk_set({"gap": "lg", "wrap": True})
+        assert props._version == version + 2
+
+    def test_resolve_fast(self, qt_widget):
+        """Test table lookup follows the width and mobile-first inheritance."""
+        props = ResponsiveProps(qt_widget)
+        props.set("columns", {"sm": 2, Breakpoint.LG: 4})
+        props.set("gap", "md")
+
+        qt_widget.resize(300, 100)
+        assert props.resolve_fast("columns") == 2  # below sm: smallest set value
+        assert props.resolve_fast("gap") == "md"
+        assert props.resolve_fast("missing", 7) == 7
+        qt_widget.resize(800, 100)
+        assert props.resolve_fast("columns") == 2
+        qt_widget.resize(1000, 100)
+        assert props.resolve_fast("columns") == 4
+
+        props.set("columns", 3)
+        assert props.resolve_fast("columns") == 3
+
+    def test_get_config(self, qt_widget):
+        """Test the stored value is returned as set, without resolution."""
+        props = ResponsiveProps(qt_widget)
+        spans = {"base": 12, "md": 6}
+        props.set("span", spans)
+        assert props.get_config("span") is spans
+        assert props.get_config("missing", 3) == 3
+
     def test_default_value(self, widget):
         """Test getting default value when property not set."""
         props = ResponsiveProps(widget)
@@ -1,5 +1,24 @@
+import pytest
 from polygon_ui import hello
 
 
 def test_hello():
     assert hello() == "Hello from polygon_ui!"
+
+
+def test_exports_resolve_lazily():
+    import polygon_ui
+
+    assert "Theme" in dir(polygon_ui)
+    from polygon_ui import Theme
+    from polygon_ui.theme import Theme as ThemeImpl
+
+    assert Theme is ThemeImpl
+    assert polygon_ui.__dict__["Theme"] is ThemeImpl
+
+
+def test_unknown_export_raises_attribute_error():
+    import polygon_ui
+
+    with pytest.raises(AttributeError):
+        polygon_ui.NotAComponent
@@ -0,0 +1,245 @@
+import gc
+import sys
+
+import pytest
+from polygon_ui.core.component import PolygonComponent
+from polygon_ui.core.provider import PolygonProvider
+from polygon_ui.theme.theme import Theme
+
+
+class CountingComponent(PolygonComponent):
+    """PolygonComponent that counts styling passes instead of generating QSS."""
+
+    def __init__(self, *args, **kwargs):
+        self.style_passes = 0
+        self.theme_passes = 0
+        super().__init__(*args, **kwargs)
+
+    def _update_styling(self):
+        self.style_passes += 1
+
+    def _apply_theme_styling(self):
+        self.theme_passes += 1
+
+
+@pytest.fixture
+def component(qtbot):
+    widget = CountingComponent(bg="gray.1")
+    qtbot.addWidget(widget)
+    qtbot.waitUntil(lambda: widget.style_passes == 1)
+    widget.style_passes = widget.theme_passes = 0
+    return widget
+
+
+def test_initial_styling_is_flushed_once(qtbot):
+    widget = CountingComponent(bg="gray.1", variant="filled")
+    qtbot.addWidget(widget)
+    assert widget.style_passes == 0
+    qtbot.waitUntil(lambda: widget.style_passes == 1)
+    assert widget.theme_passes == 1
+    assert widget.get_style_prop("bg") == "gray.1"
+
+
+def test_prop_mutations_are_coalesced(qtbot, component):
+    component.set_style_prop("bg", "gray.2")
+    component.set_style_props({"c": "dark.9", "p": "md"})
+    component.variant = "outline"
+    qtbot.waitUntil(lambda: component.style_passes == 1)
+    qtbot.wait(10)
+    assert component.style_passes == 1
+    assert component.theme_passes == 1
+
+
+def test_batch_style_updates_flushes_on_exit(component):
+    with component.batch_style_updates():
+        component.set_style_prop("bg", "gray.2")
+        with component.batch_style_updates():
+            component.size = "lg"
+        assert component.style_passes == 0
+    assert component.style_passes == 1
+    assert component.theme_passes == 1
+
+
+class StubGenerator:
+    def generate_component_qss(self, component_name, props, theme):
+        return f".{component_name} {{ {', '.join(sorted(props))} }}"
+
+
+@pytest.fixture
+def provider():
+    PolygonProvider.reset()
+    provider = PolygonProvider(Theme())
+    provider._qss_generator = StubGenerator()
+    yield provider
+    PolygonProvider.reset()
+
+
+def test_stylesheet_is_rebuilt_from_layers_not_appended(qtbot, provider):
+    provider.theme.components.override_component(
+        "PolygonComponent", {"styles": {"root": {"opacity": 1}}}
+    )
+    widget = PolygonComponent(bg="gray.1", variant="filled")
+    qtbot.addWidget(widget)
+    qtbot.waitUntil(lambda: bool(widget.styleSheet()))
+
+    for _ in range(3):
+        widget._update_styling()
+        widget._apply_theme_styling()
+
+    stylesheet = widget.styleSheet()
+    assert stylesheet.count("opacity") == 1
+    assert stylesheet.count("bg, size, variant") == 1
+    assert stylesheet == "\n".join(
+        [widget._base_qss, widget._variant_qss, widget._overrides_qss]
+    )
+
+
+def test_component_name_is_cached_per_class(qtbot):
+    assert PolygonComponent._component_name == "polygoncomponent"
+    assert CountingComponent._component_name == "countingcomponent"
+    widget = CountingComponent()
+    qtbot.addWidget(widget)
+    assert widget.objectName() == "countingcomponent"
+
+
+def test_unchanged_styling_inputs_skip_regeneration(qtbot, provider):
+    widget = PolygonComponent(bg="gray.1", variant="filled")
+    qtbot.addWidget(widget)
+    qtbot.waitUntil(lambda: bool(widget.styleSheet()))
+    cached = dict(provider._qss_cache)
+
+    provider._qss_cache.clear()
+    widget.show()
+    widget.hide()
+    widget.show()
+    widget._update_styling()
+    assert provider._qss_cache == {}
+
+    provider._on_theme_changed()
+    widget._apply_theme_styling()
+    widget._update_styling()
+    assert len(provider._qss_cache) == len(cached)
+
+
+class FlakyGenerator(StubGenerator):
+    def __init__(self):
+        self.failures = 1
+
+    def generate_component_qss(self, component_name, props, theme):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("generation failed")
+        return super().generate_component_qss(component_name, props, theme)
+
+
+def test_failed_styling_pass_is_retried(qtbot, provider):
+    widget = PolygonComponent(bg="gray.1")
+    qtbot.addWidget(widget)
+    qtbot.waitUntil(lambda: bool(widget.styleSheet()))
+    provider._qss_generator = FlakyGenerator()
+    widget._style_props["c"] = "dark.9"
+
+    with pytest.raises(RuntimeError):
+        widget._update_styling()
+    assert "c, " not in widget.styleSheet()
+
+    widget._update_styling()
+    assert "bg, c, size, variant" in widget.styleSheet()
+
+
+def test_failed_flush_keeps_update_pending(qtbot, provider):
+    widget = PolygonComponent(bg="gray.1")
+    qtbot.addWidget(widget)
+    qtbot.waitUntil(lambda: bool(widget.styleSheet()))
+    provider._qss_generator = FlakyGenerator()
+    widget._style_props["c"] = "dark.9"
+    widget._style_dirty = True
+
+    with pytest.raises(RuntimeError):
+        widget._flush_styling()
+    assert widget._style_dirty
+
+    widget._flush_styling()
+    assert not widget._style_dirty
+    assert "bg, c, size, variant" in widget.styleSheet()
+
+
+def test_style_prop_keys_are_interned(component):
+    key = "".join(["b", "g"])
+    component.set_style_prop(key, "gray.3")
+    component.set_style_props({"".join(["c", "olor"]): "dark.9"})
+    keys = list(component._style_props)
+    assert any(k is sys.intern("bg") for k in keys)
+    assert any(k is sys.intern("color") for k in keys)
+
+
+def test_components_pick_up_default_provider(qtbot, provider):
+    assert PolygonComponent._default_provider is provider
+    widget = CountingComponent()
+    qtbot.addWidget(widget)
+    assert widget._provider is provider
+
+    PolygonProvider.reset()
+    assert PolygonComponent._default_provider is None
+    orphan = CountingComponent()
+    qtbot.addWidget(orphan)
+    assert orphan._provider is None
+
+
+def test_extra_props_hook_feeds_styling(qtbot, provider):
+    class GappedComponent(PolygonComponent):
+        def _collect_extra_props(self, out):
+            out["gap"] = "lg"
+
+    widget = GappedComponent(bg="gray.1")
+    qtbot.addWidget(widget)
+    widget._update_styling()
+    assert widget._base_qss == ".gappedcomponent { bg, gap, size, variant }"
+
+
+def test_theme_change_restyles_live_components(qtbot, provider):
+    widget = CountingComponent(bg="gray.1")
+    qtbot.addWidget(widget)
+    qtbot.waitUntil(lambda: widget.style_passes == 1)
+    assert widget in provider._live_components
+
+    provider._on_theme_changed()
+    assert widget.style_passes == 2
+    assert widget.theme_passes == 2
+
+    orphan = CountingComponent()
+    qtbot.waitUntil(lambda: orphan.style_passes == 1)
+    del orphan
+    gc.collect()
+    assert len(provider._live_components) == 1
+
+
+def test_real_generator_styles_component(qtbot):
+    PolygonProvider.reset()
+    try:
+        PolygonProvider(Theme())
+        widget = PolygonComponent(bg="blue.6", p="md", variant="filled")
+        qtbot.addWidget(widget)
+        qtbot.waitUntil(lambda: bool(widget.styleSheet()))
+
+        stylesheet = widget.styleSheet()
+        assert "background-color: #228be6;" in stylesheet
+        assert "padding: 16px;" in stylesheet
+        # The auto-generated focus rule appears once, with no nested states
+        assert stylesheet.count(":focus") == stylesheet.count(":focus {")
+        assert ":focus:focus" not in stylesheet
+    finally:
+        PolygonProvider.reset()
+
+
+def test_real_generator_bare_color_name_uses_default_shade(qtbot):
+    PolygonProvider.reset()
+    try:
+        PolygonProvider(Theme())
+        widget = PolygonComponent(c="blue")
+        qtbot.addWidget(widget)
+        qtbot.waitUntil(lambda: bool(widget.styleSheet()))
+
+        assert "color: #228be6;" in widget.styleSheet()
+    finally:
+        PolygonProvider.reset()
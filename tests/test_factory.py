@@ -0,0 +1,40 @@
+import pytest
+from polygon_ui.core.factory import ComponentFactory
+
+
+class Recorder:
+    def __init__(self, parent=None, **kwargs):
+        self.parent = parent
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def factory():
+    factory = ComponentFactory()
+    factory.register_component("recorder", Recorder, {"variant": "filled", "p": "md"})
+    return factory
+
+
+def test_create_component_merges_config_under_kwargs(factory):
+    component = factory.create_component("recorder", parent="root", p="xl")
+    assert component.parent == "root"
+    assert component.kwargs == {"variant": "filled", "p": "xl"}
+    assert factory.get_component_config("recorder") == {
+        "variant": "filled",
+        "p": "md",
+    }
+
+
+def test_registered_config_is_copied():
+    config = {"variant": "filled"}
+    factory = ComponentFactory()
+    factory.register_component("recorder", Recorder, config)
+    config["variant"] = "outline"
+    assert factory.create_component("recorder").kwargs == {"variant": "filled"}
+
+
+def test_create_component_without_config(factory):
+    factory.register_component("plain", Recorder)
+    assert factory.create_component("plain", size="lg").kwargs == {"size": "lg"}
+    with pytest.raises(ValueError):
+        factory.create_component("missing")
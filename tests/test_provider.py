@@ -0,0 +1,151 @@
+import pytest
+from polygon_ui.core.provider import PolygonProvider, _freeze, _props_key
+from polygon_ui.theme.theme import ColorScheme, Theme
+
+
+class CountingGenerator:
+    """Stand-in QSS generator that records how often it is invoked."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_component_qss(self, component_name, props, theme):
+        self.calls += 1
+        return f".{component_name} {{ /* {len(props)} */ }}"
+
+
+@pytest.fixture
+def provider():
+    PolygonProvider.reset()
+    provider = PolygonProvider(Theme())
+    provider._qss_generator = CountingGenerator()
+    yield provider
+    PolygonProvider.reset()
+
+
+def test_component_qss_is_memoized(provider):
+    props = {"bg": "primary", "responsive": {"gap": {"base": "sm"}}}
+    first = provider.generate_component_qss("box", props)
+    second = provider.generate_component_qss("box", dict(props))
+    assert first == second
+    assert provider._qss_generator.calls == 1
+
+    provider.generate_component_qss("box", {"bg": "gray.1"})
+    assert provider._qss_generator.calls == 2
+
+
+def test_theme_change_invalidates_qss_cache(provider):
+    provider.generate_component_qss("box", {"bg": "primary"})
+    provider._on_theme_changed()
+    provider.generate_component_qss("box", {"bg": "primary"})
+    assert provider._qss_generator.calls == 2
+
+
+def test_get_theme_value_uses_flat_index(provider):
+    assert provider.get_theme_value("spacing.md") == 16
+    assert provider.get_theme_value("colors.blue.6") == "#228be6"
+    assert (
+        provider.get_theme_value("colors.primary") == provider.theme.get_primary_color()
+    )
+    assert provider.get_theme_value("radius.md") == 8
+    assert provider.get_theme_value("spacing.missing", 8) == 8
+
+
+def test_get_theme_value_falls_back_to_attribute_walk(provider):
+    provider.theme.maxWidths = {"sm": 540}
+    assert "maxWidths.sm" not in provider._theme_index
+    assert provider.get_theme_value("maxWidths.sm") == 540
+    assert provider.get_theme_value("maxWidths.xl", 0) == 0
+
+
+def test_theme_change_rebuilds_index(provider):
+    provider.theme.primary_color = "red"
+    provider._on_theme_changed()
+    assert (
+        provider.get_theme_value("colors.primary") == provider.theme.get_primary_color()
+    )
+
+
+def test_flat_and_nested_props_share_key_shape():
+    flat = {"bg": "primary", "p": "md"}
+    nested = {"bg": "primary", "responsive": {"gap": ["sm", "md"]}}
+    assert _props_key(flat) == _freeze(flat)
+    assert _props_key(nested) == _freeze(nested)
+    hash(_props_key(nested))
+
+
+def test_props_key_ignores_order_but_not_value_type():
+    assert _props_key({"bg": "primary", "p": "md"}) == _props_key(
+        {"p": "md", "bg": "primary"}
+    )
+    assert _freeze({"r": {"a": 1, "b": 2}}) == _freeze({"r": {"b": 2, "a": 1}})
+    keys = {_props_key({"opacity": v}) for v in (1, True, 1.0)}
+    assert len(keys) == 3
+    assert _props_key({"r": [1]}) != _props_key({"r": [True]})
+
+
+def test_initialize_is_one_shot(provider):
+    assert PolygonProvider.initialize(Theme()) is provider
+    assert PolygonProvider.initialize() is provider
+    with pytest.raises(RuntimeError):
+        PolygonProvider(Theme())
+
+
+def test_initialize_creates_instance_with_default_theme():
+    PolygonProvider.reset()
+    try:
+        provider = PolygonProvider.initialize()
+        assert PolygonProvider.get_instance() is provider
+        assert isinstance(provider.theme, Theme)
+    finally:
+        PolygonProvider.reset()
+
+
+class RecordingSettings:
+    """Stand-in QSettings that records writes and syncs."""
+
+    def __init__(self):
+        self.values = {}
+        self.syncs = 0
+
+    def setValue(self, key, value):
+        self.values[key] = value
+
+    def sync(self):
+        self.syncs += 1
+
+
+def test_preference_saves_are_cached_and_synced_once(qtbot, provider):
+    settings = provider._settings = RecordingSettings()
+    for scheme in ("dark", "light", "dark"):
+        provider.theme.color_scheme = ColorScheme(scheme)
+        provider._save_preferences()
+    provider._save_preferences()
+
+    assert provider._pref_cache["color_scheme"] == "dark"
+    assert settings.values == {"color_scheme": "dark"}
+    assert settings.syncs == 0
+    qtbot.waitUntil(lambda: settings.syncs == 1)
+    qtbot.wait(250)
+    assert settings.syncs == 1
+
+
+def test_theme_listeners_are_called_inline(provider):
+    calls = []
+
+    def listener(theme, version):
+        calls.append((theme, version))
+
+    provider.add_theme_listener(listener)
+    provider._on_theme_changed()
+    assert calls == [(provider.theme, 1)]
+
+    provider.remove_theme_listener(listener)
+    provider._on_theme_changed()
+    assert len(calls) == 1
+
+
+def test_theme_version_is_public_and_bumped(provider):
+    version = provider.theme_version
+    provider._on_theme_changed()
+    assert provider.theme_version == version + 1
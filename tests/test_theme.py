@@ -52,6 +52,23 @@ def test_qss_generator_states():
     assert ":focus" in qss
 
 
+def test_qss_generator_appends_into_buffer():
+    class StatelessGenerator(QSSGenerator):
+        def _generate_state_styles(self, component_name, props, theme):
+            return None
+
+    theme = Theme()
+    generator = StatelessGenerator()
+    props = {"w": 100, "opacity": 1}
+    buf = ["/* prefix */"]
+    generator.generate_component_qss_into(buf, "test-box", props, theme)
+    assert buf[0] == "/* prefix */"
+    assert "".join(buf[1:]) == generator.generate_component_qss(
+        "test-box", props, theme
+    )
+    assert "".join(buf[1:]) == ".test-box {\n  width: 100px\n  opacity: 1\n}"
+
+
 def test_theme_persistence():
     from polygon_ui.core.provider import PolygonProvider
 